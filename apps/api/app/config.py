@@ -129,6 +129,7 @@ class ApiRuntimeConfig:
     data_dir: Path
     gopro_dashboard_bin: str
     ffprobe_bin: str
+    ffmpeg_bin: str
     overlay_font_path: str
     cors_origins: tuple[str, ...]
     admin_uids: tuple[str, ...]
@@ -141,6 +142,10 @@ class ApiRuntimeConfig:
     job_database_cleanup_interval_seconds: int
     job_database_retention_days: float
     ffmpeg_threads_per_render: int
+    render_video_concurrency: int
+    probe_render_outputs: bool
+    accel_redirect_prefix: str | None
+    api_threadpool_size: int
     delete_inputs_on_complete: bool
     delete_work_on_complete: bool
     local_render_enabled: bool
@@ -232,6 +237,7 @@ def load_runtime_config(*, repo_root: Path, service_root: Path) -> ApiRuntimeCon
         data_dir=data_dir,
         gopro_dashboard_bin=_read_optional("GOPRO_DASHBOARD_BIN") or str(dashboard_default),
         ffprobe_bin=_read_optional("FFPROBE_BIN") or "ffprobe",
+        ffmpeg_bin=_read_optional("FFMPEG_BIN") or "ffmpeg",
         overlay_font_path=_read_optional("OVERLAY_FONT_PATH") or str(service_root / "app" / "static" / "fonts" / "Orbitron-Bold.ttf"),
         cors_origins=_read_cors_origins(),
         admin_uids=_read_csv("ADMIN_UIDS"),
@@ -244,6 +250,10 @@ def load_runtime_config(*, repo_root: Path, service_root: Path) -> ApiRuntimeCon
         job_database_cleanup_interval_seconds=_read_int("JOB_DATABASE_CLEANUP_INTERVAL_SECONDS", 3600, 300),
         job_database_retention_days=_read_float("JOB_DATABASE_RETENTION_DAYS", 30.0, 1.0),
         ffmpeg_threads_per_render=_read_int("FFMPEG_THREADS_PER_RENDER", 0, 0),
+        render_video_concurrency=_read_int("RENDER_VIDEO_CONCURRENCY", 0, 0),
+        probe_render_outputs=_read_bool("PROBE_RENDER_OUTPUTS", False),
+        accel_redirect_prefix=_read_optional("ACCEL_REDIRECT_PREFIX"),
+        api_threadpool_size=_read_int("API_THREADPOOL_SIZE", 0, 0),
         delete_inputs_on_complete=_read_bool("DELETE_INPUTS_ON_COMPLETE", True),
         delete_work_on_complete=_read_bool("DELETE_WORK_ON_COMPLETE", True),
         local_render_enabled=_read_bool("LOCAL_RENDER_ENABLED", False),
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import base64
-from collections import defaultdict, deque
-from contextlib import asynccontextmanager
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
 from copy import deepcopy
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
+import hashlib
+import heapq
+from itertools import islice
 import json
 import logging
 import os
@@ -13,22 +21,24 @@ from pathlib import Path
 import re
 import secrets
 import shutil
+import statistics
 import subprocess
 import sys
 import tempfile
 import threading
 import time
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping
 from urllib.parse import quote
-from uuid import uuid4
+from uuid import UUID, uuid4
 import zipfile
 
+import anyio.to_thread
 from fastapi import Body, Depends, FastAPI, File, Form, Header, HTTPException, Query, UploadFile
 from fastapi import Request
-from fastapi.responses import FileResponse, RedirectResponse
+from fastapi.responses import FileResponse, JSONResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from starlette.background import BackgroundTask
 from starlette.concurrency import run_in_threadpool
 
 from app.config import load_runtime_config
@@ -90,6 +100,7 @@ GOPRO_DASHBOARD_BIN = _resolve_executable_path(
     fallback_name="gopro-dashboard.py",
 )
 FFPROBE_BIN = RUNTIME_CONFIG.ffprobe_bin
+FFMPEG_BIN = RUNTIME_CONFIG.ffmpeg_bin
 DEFAULT_FONT_PATH = RUNTIME_CONFIG.overlay_font_path
 
 JOB_CLEANUP_ENABLED = RUNTIME_CONFIG.job_cleanup_enabled
@@ -101,6 +112,10 @@ JOB_DATABASE_CLEANUP_ENABLED = RUNTIME_CONFIG.job_database_cleanup_enabled
 JOB_DATABASE_CLEANUP_INTERVAL_SECONDS = RUNTIME_CONFIG.job_database_cleanup_interval_seconds
 JOB_DATABASE_RETENTION_DAYS = RUNTIME_CONFIG.job_database_retention_days
 FFMPEG_THREADS_PER_RENDER = RUNTIME_CONFIG.ffmpeg_threads_per_render
+RENDER_VIDEO_CONCURRENCY = RUNTIME_CONFIG.render_video_concurrency
+PROBE_RENDER_OUTPUTS = RUNTIME_CONFIG.probe_render_outputs
+ACCEL_REDIRECT_PREFIX = (RUNTIME_CONFIG.accel_redirect_prefix or "").rstrip("/")
+API_THREADPOOL_SIZE = RUNTIME_CONFIG.api_threadpool_size
 DELETE_INPUTS_ON_COMPLETE = RUNTIME_CONFIG.delete_inputs_on_complete
 DELETE_WORK_ON_COMPLETE = RUNTIME_CONFIG.delete_work_on_complete
 LOCAL_RENDER_ENABLED = RUNTIME_CONFIG.local_render_enabled
@@ -118,26 +133,38 @@ if JOB_QUEUE_WORKER_COUNT <= 0:
     else:
         JOB_QUEUE_WORKER_COUNT = 1
 
+if RENDER_VIDEO_CONCURRENCY <= 0:
+    cpu_count = max(os.cpu_count() or 1, 1)
+    if FFMPEG_THREADS_PER_RENDER > 0:
+        render_slots = cpu_count // (max(JOB_QUEUE_WORKER_COUNT, 1) * FFMPEG_THREADS_PER_RENDER)
+        RENDER_VIDEO_CONCURRENCY = max(1, min(2, render_slots))
+    else:
+        RENDER_VIDEO_CONCURRENCY = 1
+
 if FFMPEG_THREADS_PER_RENDER <= 0:
     cpu_count = max(os.cpu_count() or 1, 1)
-    FFMPEG_THREADS_PER_RENDER = max(1, cpu_count // max(JOB_QUEUE_WORKER_COUNT, 1))
-
-ALLOWED_UNITS_SPEED = {"kph", "mph", "mps", "knots"}
-ALLOWED_UNITS_ALTITUDE = {"metre", "meter", "feet", "foot"}
-ALLOWED_UNITS_DISTANCE = {"km", "mile", "nmi", "meter", "metre"}
-ALLOWED_UNITS_TEMP = {"degC", "degF", "kelvin"}
-ALLOWED_GPX_SPEED_UNITS = {"auto", "mps", "mph", "kph", "knots"}
-ALLOWED_MAP_STYLES = {
+    FFMPEG_THREADS_PER_RENDER = max(1, cpu_count // (max(JOB_QUEUE_WORKER_COUNT, 1) * RENDER_VIDEO_CONCURRENCY))
+
+if API_THREADPOOL_SIZE <= 0:
+    cpu_count = max(os.cpu_count() or 1, 1)
+    API_THREADPOOL_SIZE = max(4, cpu_count * 2)
+
+ALLOWED_UNITS_SPEED = frozenset({"kph", "mph", "mps", "knots"})
+ALLOWED_UNITS_ALTITUDE = frozenset({"metre", "meter", "feet", "foot"})
+ALLOWED_UNITS_DISTANCE = frozenset({"km", "mile", "nmi", "meter", "metre"})
+ALLOWED_UNITS_TEMP = frozenset({"degC", "degF", "kelvin"})
+ALLOWED_GPX_SPEED_UNITS = frozenset({"auto", "mps", "mph", "kph", "knots"})
+ALLOWED_MAP_STYLES = frozenset({
     "osm",
     "geo-dark-matter",
     "geo-positron",
     "geo-positron-blue",
     "geo-toner",
-}
-ALLOWED_FPS_MODES = {"source_exact", "source_rounded", "fixed"}
+})
+ALLOWED_FPS_MODES = frozenset({"source_exact", "source_rounded", "fixed"})
 AUTO_RENDER_PROFILE = "auto"
 PROFILE_4K_COMPAT_MAX_WIDTH = 3840
-X264_PRESETS = {
+X264_PRESETS = frozenset({
     "ultrafast",
     "superfast",
     "veryfast",
@@ -147,7 +174,7 @@ X264_PRESETS = {
     "slow",
     "slower",
     "veryslow",
-}
+})
 
 
 def _resolve_x264_preset(env_key: str, default: str) -> str:
@@ -173,6 +200,8 @@ ETA_DEFAULT_FIXED_MULTIPLIER_INTERCEPT = 0.32
 ETA_DEFAULT_FIXED_MULTIPLIER_SLOPE = 0.02
 ETA_DEFAULT_FIXED_MULTIPLIER_MIN = 0.45
 ETA_ANCHOR_MEGA_PIXELS = [0.92, 2.07, 4.11, 8.29, 15.87]
+RENDER_ETA_SAMPLE_WINDOW = 3000
+RENDER_SAMPLES_TAIL_BLOCK_BYTES = 256 * 1024
 ETA_BASE_PROFILE_POINTS: dict[str, list[tuple[float, float]]] = {
     "h264-fast": [(0.92, 0.839), (2.07, 1.182), (4.11, 2.14), (8.29, 3.518), (15.87, 10.776)],
     "h264-source": [(0.92, 0.933), (2.07, 1.231), (4.11, 2.241), (8.29, 3.79), (15.87, 11.402)],
@@ -181,7 +210,23 @@ ETA_BASE_PROFILE_POINTS: dict[str, list[tuple[float, float]]] = {
     "qt-hevc-high": [(0.9, 0.95), (2.1, 1.6), (4.1, 3.0), (8.3, 5.8), (15.9, 10.6)],
 }
 
-RENDER_PROFILE_CATALOG: dict[str, dict[str, Any]] = {
+
+def _freeze_render_profile_catalog(catalog: dict[str, dict[str, Any]]) -> Mapping[str, Mapping[str, Any]]:
+    # The catalog is shared by every request and worker; freeze argv into tuples so no caller can mutate it.
+    frozen: dict[str, Mapping[str, Any]] = {}
+    for profile_id, entry in catalog.items():
+        ffmpeg = {key: tuple(value) if isinstance(value, list) else value for key, value in entry["ffmpeg"].items()}
+        frozen[profile_id] = MappingProxyType(
+            {
+                **entry,
+                "platforms": frozenset(entry["platforms"]),
+                "ffmpeg": MappingProxyType(ffmpeg),
+            }
+        )
+    return MappingProxyType(frozen)
+
+
+RENDER_PROFILE_CATALOG: Mapping[str, Mapping[str, Any]] = _freeze_render_profile_catalog({
     "qt-hevc-balanced": {
         "label": "HEVC (QuickTime Balanced) - Recommended",
         "summary": "Best default on macOS for smooth 4K/5.3K playback with strong quality and smaller files.",
@@ -304,31 +349,39 @@ RENDER_PROFILE_CATALOG: dict[str, dict[str, Any]] = {
             "output": ["-vcodec", "libx264", "-preset", H264_FAST_PRESET, "-pix_fmt", "yuv420p", "-movflags", "+faststart"],
         },
     },
-}
+})
 
 
-RENDER_PROFILE_ORDER = [
+RENDER_PROFILE_ORDER = (
     "qt-hevc-balanced",
     "qt-hevc-high",
     "h264-4k-compat",
     "h264-source",
     "h264-fast",
-]
+)
 
 
-def _available_render_profile_ids() -> list[str]:
+def _available_render_profile_ids() -> tuple[str, ...]:
     platform = sys.platform
-    return [
+    return tuple(
         profile_id
         for profile_id in RENDER_PROFILE_ORDER
         if profile_id in RENDER_PROFILE_CATALOG and platform in RENDER_PROFILE_CATALOG[profile_id]["platforms"]
-    ]
+    )
 
 
+# Platform filtering happens once at import; everything below is a read-only lookup table.
 AVAILABLE_RENDER_PROFILE_IDS = _available_render_profile_ids()
-MANUAL_RENDER_PROFILES = set(AVAILABLE_RENDER_PROFILE_IDS)
-ALLOWED_RENDER_PROFILES = {AUTO_RENDER_PROFILE, *MANUAL_RENDER_PROFILES}
-LOCAL_ALLOWED_RENDER_PROFILES = {AUTO_RENDER_PROFILE, *RENDER_PROFILE_CATALOG.keys()}
+MANUAL_RENDER_PROFILES = frozenset(AVAILABLE_RENDER_PROFILE_IDS)
+ALLOWED_RENDER_PROFILES = frozenset({AUTO_RENDER_PROFILE, *MANUAL_RENDER_PROFILES})
+LOCAL_ALLOWED_RENDER_PROFILES = frozenset({AUTO_RENDER_PROFILE, *RENDER_PROFILE_CATALOG.keys()})
+# Auto-profile candidates in preference order, keyed by (running on macOS, source larger than 4K UHD).
+AUTO_RENDER_PROFILE_CANDIDATES: dict[tuple[bool, bool], tuple[str, ...]] = {
+    (True, True): ("qt-hevc-balanced", "h264-4k-compat", "h264-source", "h264-fast"),
+    (True, False): ("h264-source", "qt-hevc-balanced", "h264-fast"),
+    (False, True): ("h264-source", "h264-4k-compat", "h264-fast"),
+    (False, False): ("h264-source", "h264-fast"),
+}
 
 if sys.platform == "darwin":
     DEFAULT_RENDER_PROFILE = "qt-hevc-balanced"
@@ -336,15 +389,29 @@ else:
     DEFAULT_RENDER_PROFILE = "h264-source"
 
 
-TERMINAL_JOB_STATUSES = {"completed", "completed_with_errors", "failed"}
-LOCAL_RENDER_ACTIVE_STATUSES = {"local_pending", "local_running", "local_uploading"}
-LOCAL_RENDER_ALLOWED_VIDEO_STATUSES = {*LOCAL_RENDER_ACTIVE_STATUSES, *TERMINAL_JOB_STATUSES}
+TERMINAL_JOB_STATUSES = frozenset({"completed", "completed_with_errors", "failed"})
+LOCAL_RENDER_ACTIVE_STATUSES = frozenset({"local_pending", "local_running", "local_uploading"})
+LOCAL_RENDER_ALLOWED_VIDEO_STATUSES = frozenset({*LOCAL_RENDER_ACTIVE_STATUSES, *TERMINAL_JOB_STATUSES})
 LOCAL_RENDER_PAIRING_TTL_SECONDS = 5 * 60
 LOCAL_RENDER_WORKER_SESSION_TTL_SECONDS = 24 * 60 * 60
 ANSI_ESCAPE_RE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
+SAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+RENDER_PROGRESS_RE = re.compile(rb"\[(\s*\d+)%\]")
+TRUTHY_STRINGS = frozenset({"1", "true", "yes", "on"})
 # Firestore is the source of truth; this cache only reduces repeated reads within a worker run.
+# Cached entries are replaced whole and never mutated, so readers may clone them outside JOBS_LOCK.
 JOBS: dict[str, dict[str, Any]] = {}
+JOBS_BY_UID: defaultdict[str, set[str]] = defaultdict(set)
+# Signature of the last payload this process wrote per job; lets _persist_job_state skip no-op writes.
+JOB_STATE_SIGNATURES: dict[str, int] = {}
+# Serialized form of each JOBS entry, so handing out a private copy is one json.loads instead of a dumps/loads round trip.
+JOB_STATE_JSON: dict[str, str] = {}
+# Terminal jobs rarely change, so for a short while their cached entry can stand in for a read. Deletes, retries or
+# admin edits made by another instance are only seen once the entry expires. Maps job id to its monotonic expiry.
+TERMINAL_CACHED_JOB_EXPIRY: dict[str, float] = {}
 JOBS_LOCK = threading.Lock()
+# Serializes read-modify-write updates per job (striped) so concurrent video renders don't drop each other's fields.
+JOB_UPDATE_LOCKS = tuple(threading.Lock() for _ in range(64))
 LOCAL_RENDER_LOCK = threading.Lock()
 LOCAL_RENDER_PAIRINGS: dict[str, dict[str, Any]] = {}
 LOCAL_RENDER_WORKER_SESSIONS: dict[str, dict[str, Any]] = {}
@@ -361,6 +428,10 @@ FIRESTORE_PROJECT_ID = (RUNTIME_CONFIG.firestore.project_id or "").strip()
 FIRESTORE_DATABASE_ID = RUNTIME_CONFIG.firestore.database_id
 FIRESTORE_USERS_COLLECTION = RUNTIME_CONFIG.firestore.users_collection
 FIRESTORE_JOBS_COLLECTION = RUNTIME_CONFIG.firestore.jobs_collection
+FIRESTORE_IN_QUERY_LIMIT = 10
+FIRESTORE_GET_ALL_BATCH_SIZE = 100
+# Firestore caps a write batch at 500 operations.
+FIRESTORE_WRITE_BATCH_SIZE = 500
 R2_UPLOAD_ENABLED = RUNTIME_CONFIG.r2.upload_enabled
 R2_BUCKET = (RUNTIME_CONFIG.r2.bucket or "").strip()
 R2_REGION = RUNTIME_CONFIG.r2.region
@@ -369,13 +440,70 @@ R2_ACCESS_KEY_ID = (RUNTIME_CONFIG.r2.access_key_id or "").strip()
 R2_SECRET_ACCESS_KEY = (RUNTIME_CONFIG.r2.secret_access_key or "").strip()
 R2_SIGNED_URL_TTL_SECONDS = 15 * 60
 R2_SIGNED_UPLOAD_URL_TTL_SECONDS = 30 * 60
+# Cached download URLs are only handed out while they still have at least this much validity left.
+R2_SIGNED_URL_CACHE_MARGIN_SECONDS = 5 * 60
+R2_SIGNED_URL_CACHE_MAX_ENTRIES = 1024
+FIREBASE_TOKEN_CACHE_TTL_SECONDS = 60
+FIREBASE_TOKEN_CACHE_MAX_ENTRIES = 4096
+PROBE_CACHE_MAX_ENTRIES = 512
+# Job polls reuse a recent outputs-directory listing; job-state writes drop it early.
+OUTPUT_LISTING_CACHE_TTL_SECONDS = 3.0
+OUTPUT_LISTING_CACHE_MAX_ENTRIES = 1024
+# Media-library polls reuse a user's recent job query; this process's job writes drop it early.
+JOB_LISTING_CACHE_TTL_SECONDS = 15.0
+JOB_LISTING_CACHE_MAX_ENTRIES = 256
+TERMINAL_JOB_CACHE_TTL_SECONDS = 15.0
+# Short, like TERMINAL_JOB_CACHE_TTL_SECONDS: an opt-out made on another instance must stop emails quickly.
+USER_PROFILE_CACHE_TTL_SECONDS = 15.0
+USER_PROFILE_CACHE_MAX_ENTRIES = 1024
+# Outputs below the threshold go up as a single PutObject; larger ones use parallel multipart parts.
+R2_MULTIPART_THRESHOLD_BYTES = 32 * 1024 * 1024
+R2_MULTIPART_CHUNK_BYTES = 16 * 1024 * 1024
+R2_UPLOAD_MAX_CONCURRENCY = 8
+# Finished outputs upload in the background so the next video can start rendering.
+OUTPUT_UPLOAD_CONCURRENCY = 2
 MEDIA_LIST_MAX_PAGE_SIZE = 100
-MEDIA_SORT_FIELDS = {"created_at", "updated_at", "status", "title"}
-MEDIA_SORT_ORDERS = {"asc", "desc"}
+MEDIA_BULK_DELETE_MAX_ITEMS = 500
+# S3 DeleteObjects accepts at most 1000 keys per request.
+R2_DELETE_BATCH_SIZE = 1000
+# Partial (heap) selection beats a full sort only while the requested prefix is a small share of the library.
+MEDIA_PARTIAL_SORT_FACTOR = 8
+# Stamped on new jobs, whose videos are created with ids and titles; bump when the backfill normalizes something new.
+VIDEO_IDENTITY_VERSION = 1
+# Bookkeeping fields stored on job documents but never returned by the API.
+INTERNAL_JOB_FIELDS = ("video_identity_version",)
+MEDIA_SORT_FIELDS = frozenset({"created_at", "updated_at", "status", "title"})
+MEDIA_SORT_ORDERS = frozenset({"asc", "desc"})
+MEDIA_STATUS_RANK = {
+    "queued": 0,
+    "running": 1,
+    "completed": 2,
+    "completed_with_errors": 3,
+    "failed": 4,
+}
 STATE_RETRY_ATTEMPTS = 3
 STATE_RETRY_DELAY_SECONDS = 0.5
+RENDER_PROGRESS_PERSIST_INTERVAL_SECONDS = 1.0
+RENDERER_STDOUT_BUFFER_BYTES = 1024 * 1024
+# Enough trailing output to recover the final console line and any progress marker split across reads.
+RENDERER_TAIL_BYTES = 4096
+RENDER_PROGRESS_MARKER_OVERLAP_BYTES = 16
+RENDER_PROFILE_PROBE_FRAMES = 5
+RENDER_PROFILE_PROBE_TIMEOUT_SECONDS = 60
+# Hardware encoders fail transiently (session limits, resource pressure), so a failed probe is retried after this.
+RENDER_PROFILE_PROBE_FAILURE_TTL_SECONDS = 300.0
+RENDER_PROFILE_PROBE_CACHE_MAX_ENTRIES = 64
+MISSING_ENCODER_MARKERS = (b"Unknown encoder", b"Encoder not found")
 UPLOAD_RETRY_ATTEMPTS = 3
 UPLOAD_RETRY_DELAY_SECONDS = 1.0
+UPLOAD_COPY_BUFFER_BYTES = 8 * 1024 * 1024
+# Starlette keeps multipart parts up to 1 MiB in memory; anything larger is already backed by a temp file.
+UPLOAD_SENDFILE_MIN_BYTES = 1024 * 1024
+ZIP_COPY_BUFFER_BYTES = 1024 * 1024
+ZIP_SPOOL_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+ZIP_DOWNLOAD_CONCURRENCY = 4
+# Rendered videos are already compressed; deflating them burns CPU for almost no size gain.
+ZIP_STORED_SUFFIXES = frozenset({".mp4", ".mov", ".m4v", ".mkv", ".webm"})
 BREVO_NOTIFICATIONS_ENABLED = RUNTIME_CONFIG.brevo.notifications_enabled
 BREVO_API_KEY = (RUNTIME_CONFIG.brevo.api_key or "").strip()
 BREVO_SENDER_EMAIL = (RUNTIME_CONFIG.brevo.sender_email or "").strip()
@@ -386,14 +514,38 @@ _FIREBASE_INIT_LOCK = threading.Lock()
 _FIREBASE_AUTH_MODULE: Any | None = None
 _FIRESTORE_CLIENT_LOCK = threading.Lock()
 _FIRESTORE_CLIENT: Any | None = None
+# (client, jobs collection, users collection); rebuilt whenever the client is replaced.
+_FIRESTORE_COLLECTIONS: tuple[Any, Any, Any] | None = None
 _R2_CLIENT_LOCK = threading.Lock()
 _R2_CLIENT: Any | None = None
+_R2_TRANSFER_CONFIG: Any | None = None
+_RENDER_SAMPLE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="render-samples")
+_OUTPUT_UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=OUTPUT_UPLOAD_CONCURRENCY, thread_name_prefix="r2-upload")
+_NOTIFICATION_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="notifications")
+_SIGNED_URL_CACHE_LOCK = threading.Lock()
+_SIGNED_URL_CACHE: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
+_VERIFIED_TOKEN_CACHE_LOCK = threading.Lock()
+# token hash -> (expiry, uid, auth_time) for tokens whose signature and claims were already verified
+_VERIFIED_TOKEN_CACHE: OrderedDict[bytes, tuple[float, str, float]] = OrderedDict()
+_PROBE_CACHE_LOCK = threading.Lock()
+_PROBE_CACHE: OrderedDict[tuple[str, int, int], dict[str, Any]] = OrderedDict()
+_OUTPUT_LISTING_CACHE_LOCK = threading.Lock()
+_OUTPUT_LISTING_CACHE: OrderedDict[str, tuple[float, frozenset[str]]] = OrderedDict()
+_JOB_LISTING_CACHE_LOCK = threading.Lock()
+_JOB_LISTING_CACHE: OrderedDict[str, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+_JOB_LISTING_GENERATION = 0
+_RENDER_PROFILE_PROBE_CACHE_LOCK = threading.Lock()
+# (profile, width, height) -> (failure expiry or None for a cached success, encodes)
+_RENDER_PROFILE_PROBE_CACHE: OrderedDict[tuple[str, int, int], tuple[float | None, bool]] = OrderedDict()
+_UNAVAILABLE_ENCODERS: set[str] = set()
+_USER_PROFILE_CACHE_LOCK = threading.Lock()
+_USER_PROFILE_CACHE: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
 _BREVO_CLIENT_LOCK = threading.Lock()
 _BREVO_CLIENT: Any | None = None
 _QUEUE_WORKER_LOCK = threading.Lock()
 _QUEUE_WORKER_STARTED = False
 _RECOVERY_LOOP_STARTED = False
-JOB_QUEUE: queue.Queue[str] = queue.Queue()
+JOB_QUEUE: queue.SimpleQueue[str] = queue.SimpleQueue()
 ENQUEUED_JOBS: set[str] = set()
 ACTIVE_JOBS: set[str] = set()
 _OPS_LOCK = threading.Lock()
@@ -412,6 +564,7 @@ _OPS_METRICS: dict[str, Any] = {
     "cleanup_errors_total": 0,
     "cleanup_deleted_job_dirs_total": 0,
     "cleanup_deleted_firestore_jobs_total": 0,
+    "job_state_terminal_cache_hits_total": 0,
     "last_reconcile_started_at": None,
     "last_reconcile_completed_at": None,
     "last_cleanup_started_at": None,
@@ -419,7 +572,11 @@ _OPS_METRICS: dict[str, Any] = {
 }
 _RENDER_ANALYTICS_LOCK = threading.Lock()
 _RENDER_ETA_CACHE_MTIME: float | None = None
-_RENDER_ETA_CACHE: dict[str, Any] | None = None
+# Calibration is cached serialized; decoding a fresh copy per caller is cheaper than deepcopy.
+_RENDER_ETA_CACHE_JSON: str | None = None
+_RENDER_SAMPLES_WINDOW: deque[dict[str, Any]] | None = None
+_RENDER_SAMPLES_WINDOW_MTIME: float | None = None
+_RENDER_SAMPLES_HANDLE: Any | None = None
 LOGGER = logging.getLogger("poverlay.api")
 
 
@@ -440,8 +597,10 @@ def _ops_snapshot() -> dict[str, Any]:
 
 def _queue_snapshot() -> dict[str, Any]:
     with _QUEUE_WORKER_LOCK:
-        active_jobs = sorted(ACTIVE_JOBS)
-        enqueued_jobs = sorted(ENQUEUED_JOBS)
+        active_jobs = list(ACTIVE_JOBS)
+        enqueued_jobs = list(ENQUEUED_JOBS)
+    active_jobs.sort()
+    enqueued_jobs.sort()
     return {
         "configured_workers": JOB_QUEUE_WORKER_COUNT,
         "active_jobs_count": len(active_jobs),
@@ -455,6 +614,9 @@ def _queue_snapshot() -> dict[str, Any]:
 @asynccontextmanager
 async def _lifespan(_app: FastAPI):
     _ensure_dirs()
+    # Sync endpoints and run_in_threadpool share anyio's default limiter (40 threads); size it to the host instead.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = API_THREADPOOL_SIZE
+    _warm_external_clients()
     _start_queue_workers()
     try:
         _recover_pending_jobs()
@@ -462,9 +624,14 @@ async def _lifespan(_app: FastAPI):
         _ops_increment("reconcile_errors_total")
         LOGGER.exception("Initial pending-job recovery failed")
     _start_recovery_loop()
-    if JOB_CLEANUP_ENABLED:
-        threading.Thread(target=_cleanup_loop, name="job-cleanup", daemon=True).start()
-    yield
+    cleanup_task = asyncio.create_task(_cleanup_loop(), name="job-cleanup") if JOB_CLEANUP_ENABLED else None
+    try:
+        yield
+    finally:
+        if cleanup_task is not None:
+            cleanup_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await cleanup_task
 
 
 app = FastAPI(title="POVerlay API", lifespan=_lifespan)
@@ -531,6 +698,15 @@ class AdminCancelRequest(BaseModel):
     reason: str | None = None
 
 
+class MediaBulkDeleteItem(BaseModel):
+    job_id: str
+    video_id: str
+
+
+class MediaBulkDeleteRequest(BaseModel):
+    items: list[MediaBulkDeleteItem]
+
+
 class LocalRenderPairingStartResponse(BaseModel):
     pairing_code: str
     expires_at: str
@@ -612,7 +788,7 @@ class LocalRenderUploadCompleteRequest(BaseModel):
 
 
 def _safe_filename(name: str) -> str:
-    safe = re.sub(r"[^A-Za-z0-9._-]+", "_", name.strip())
+    safe = SAFE_FILENAME_RE.sub("_", name.strip())
     return safe or "file"
 
 
@@ -629,11 +805,17 @@ def _ensure_dirs() -> None:
 
 
 def _ffmpeg_profile_presets() -> dict[str, dict[str, Any]]:
+    # Presets only depend on the static catalog and the thread budget, so the built dict is shared; do not mutate it.
+    return _ffmpeg_profile_presets_for_threads(FFMPEG_THREADS_PER_RENDER)
+
+
+@lru_cache(maxsize=4)
+def _ffmpeg_profile_presets_for_threads(threads: int) -> dict[str, dict[str, Any]]:
     presets: dict[str, dict[str, Any]] = {}
     for profile_id, entry in RENDER_PROFILE_CATALOG.items():
         output_args = list(entry["ffmpeg"].get("output", []))
-        if FFMPEG_THREADS_PER_RENDER > 0 and "-threads" not in output_args:
-            output_args.extend(["-threads", str(FFMPEG_THREADS_PER_RENDER)])
+        if threads > 0 and "-threads" not in output_args:
+            output_args.extend(["-threads", str(threads)])
         ffmpeg_profile = {
             "input": list(entry["ffmpeg"].get("input", [])),
             "output": output_args,
@@ -644,13 +826,31 @@ def _ffmpeg_profile_presets() -> dict[str, dict[str, Any]]:
     return presets
 
 
+@lru_cache(maxsize=4)
+def _ffmpeg_profiles_json(threads: int) -> bytes:
+    return json.dumps(_ffmpeg_profile_presets_for_threads(threads), indent=2).encode("utf-8")
+
+
 def _ensure_ffmpeg_profiles() -> None:
     _ensure_dirs()
-    FFMPEG_PROFILES_FILE.write_text(json.dumps(_ffmpeg_profile_presets(), indent=2), encoding="utf-8")
+    content = _ffmpeg_profiles_json(FFMPEG_THREADS_PER_RENDER)
+    try:
+        if FFMPEG_PROFILES_FILE.read_bytes() == content:
+            return
+    except OSError:
+        pass
+    temp_path = FFMPEG_PROFILES_FILE.with_name(f".{FFMPEG_PROFILES_FILE.name}.{uuid4().hex}.tmp")
+    try:
+        temp_path.write_bytes(content)
+        os.replace(temp_path, FFMPEG_PROFILES_FILE)
+    finally:
+        _safe_unlink(temp_path)
 
 
 def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    # Same shape as datetime.now(timezone.utc).isoformat() without building datetime objects on every state write.
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{nanoseconds // 1000:06d}+00:00"
 
 
 def _utc_after_hours(hours: float) -> str:
@@ -684,21 +884,94 @@ def _retry_operation(
     attempts: int,
     delay_seconds: float,
 ) -> Any:
-    last_error: Exception | None = None
-    for attempt in range(1, attempts + 1):
+    if attempts < 1:
+        raise RuntimeError(f"{label} failed after {attempts} attempt(s)")
+    # Happy path: a single call with no retry bookkeeping.
+    try:
+        return operation()
+    except Exception as exc:  # noqa: BLE001
+        last_error: Exception = exc
+
+    for attempt in range(2, attempts + 1):
+        time.sleep(delay_seconds * (attempt - 1))
         try:
             return operation()
         except Exception as exc:  # noqa: BLE001
             last_error = exc
-            if attempt == attempts:
-                break
-            time.sleep(delay_seconds * attempt)
     raise RuntimeError(f"{label} failed after {attempts} attempt(s)") from last_error
 
 
-def _cache_job_state(job: dict[str, Any]) -> None:
+# Job payloads are JSON trees, so the encoder's per-container cycle bookkeeping is pure overhead.
+_dump_job_json = partial(json.dumps, separators=(",", ":"), check_circular=False)
+
+
+def _clone_job_state(job: dict[str, Any]) -> dict[str, Any]:
+    # Job payloads are plain JSON documents; a C-level JSON round trip is much cheaper than deepcopy.
+    try:
+        return json.loads(_dump_job_json(job))
+    except (TypeError, ValueError, RecursionError):
+        return deepcopy(job)
+
+
+def _clone_cached_job(job_id: str, cached: dict[str, Any]) -> dict[str, Any]:
+    # The blob is written before its JOBS entry, so it only matches while that entry is still current.
+    serialized = JOB_STATE_JSON.get(job_id)
+    if serialized is not None and JOBS.get(job_id) is cached:
+        return json.loads(serialized)
+    return _clone_job_state(cached)
+
+
+def _cache_job_state(job: dict[str, Any], *, signature: int | None = None) -> None:
+    job_id = str(job["id"])
+    try:
+        serialized: str | None = _dump_job_json(job)
+    except (TypeError, ValueError, RecursionError):
+        serialized = None
+    cached = json.loads(serialized) if serialized is not None else deepcopy(job)
+    uid = str(cached.get("uid") or "")
+    with JOBS_LOCK:
+        if signature is None:
+            JOB_STATE_SIGNATURES.pop(job_id, None)
+        else:
+            JOB_STATE_SIGNATURES[job_id] = signature
+        previous = JOBS.get(job_id)
+        previous_uid = str(previous.get("uid") or "") if previous is not None else ""
+        if previous_uid and previous_uid != uid:
+            _unindex_job_uid(previous_uid, job_id)
+        if serialized is None:
+            JOB_STATE_JSON.pop(job_id, None)
+        else:
+            JOB_STATE_JSON[job_id] = serialized
+        JOBS[job_id] = cached
+        if cached.get("status") in TERMINAL_JOB_STATUSES:
+            TERMINAL_CACHED_JOB_EXPIRY[job_id] = time.monotonic() + TERMINAL_JOB_CACHE_TTL_SECONDS
+        else:
+            TERMINAL_CACHED_JOB_EXPIRY.pop(job_id, None)
+        if uid:
+            JOBS_BY_UID[uid].add(job_id)
+
+
+def _unindex_job_uid(uid: str, job_id: str) -> None:
+    job_ids = JOBS_BY_UID.get(uid)
+    if job_ids is None:
+        return
+    job_ids.discard(job_id)
+    if not job_ids:
+        JOBS_BY_UID.pop(uid, None)
+
+
+def _job_state_signature(job: dict[str, Any]) -> int | None:
+    try:
+        serialized = _dump_job_json({key: value for key, value in job.items() if key != "updated_at"}, sort_keys=True)
+    except (TypeError, ValueError, RecursionError):
+        return None
+    return hash(serialized)
+
+
+def _list_cached_jobs_for_uid(uid: str) -> list[dict[str, Any]]:
     with JOBS_LOCK:
-        JOBS[str(job["id"])] = deepcopy(job)
+        cached = [(job_id, JOBS[job_id]) for job_id in JOBS_BY_UID.get(uid, ()) if job_id in JOBS]
+    return [_clone_cached_job(job_id, job) for job_id, job in cached]
 
 
 def _firebase_admin_private_key() -> str:
@@ -750,13 +1023,10 @@ def _google_service_account_credentials() -> Any | None:
     return service_account.Credentials.from_service_account_file(FIREBASE_CREDENTIALS_PATH)
 
 
-def _firestore_jobs_collection() -> Any:
-    if not FIRESTORE_ENABLED:
-        raise RuntimeError("Firestore-backed job state is disabled")
-
+def _firestore_client() -> Any:
     global _FIRESTORE_CLIENT
     if _FIRESTORE_CLIENT is not None:
-        return _FIRESTORE_CLIENT.collection(FIRESTORE_JOBS_COLLECTION)
+        return _FIRESTORE_CLIENT
 
     with _FIRESTORE_CLIENT_LOCK:
         if _FIRESTORE_CLIENT is None:
@@ -777,23 +1047,67 @@ def _firestore_jobs_collection() -> Any:
             except TypeError:
                 _FIRESTORE_CLIENT = firestore.Client(**client_kwargs)
 
-    return _FIRESTORE_CLIENT.collection(FIRESTORE_JOBS_COLLECTION)
+    return _FIRESTORE_CLIENT
+
+
+def _firestore_collections() -> tuple[Any, Any]:
+    global _FIRESTORE_COLLECTIONS
+    cached = _FIRESTORE_COLLECTIONS
+    if cached is not None and _FIRESTORE_CLIENT is not None and cached[0] is _FIRESTORE_CLIENT:
+        return cached[1], cached[2]
+
+    client = _firestore_client()
+    cached = (
+        client,
+        client.collection(FIRESTORE_JOBS_COLLECTION),
+        client.collection(FIRESTORE_USERS_COLLECTION),
+    )
+    _FIRESTORE_COLLECTIONS = cached
+    return cached[1], cached[2]
+
+
+def _firestore_jobs_collection() -> Any:
+    if not FIRESTORE_ENABLED:
+        raise RuntimeError("Firestore-backed job state is disabled")
+    return _firestore_collections()[0]
 
 
 def _firestore_users_collection() -> Any:
     if not FIRESTORE_ENABLED:
         raise RuntimeError("Firestore-backed user state is disabled")
-    global _FIRESTORE_CLIENT
-    if _FIRESTORE_CLIENT is None:
-        _firestore_jobs_collection()
-    assert _FIRESTORE_CLIENT is not None
-    return _FIRESTORE_CLIENT.collection(FIRESTORE_USERS_COLLECTION)
+    return _firestore_collections()[1]
+
+
+def _cached_user_profile(uid: str) -> dict[str, Any] | None:
+    with _USER_PROFILE_CACHE_LOCK:
+        cached = _USER_PROFILE_CACHE.get(uid)
+        if cached is None:
+            return None
+        if cached[0] <= time.monotonic():
+            del _USER_PROFILE_CACHE[uid]
+            return None
+        _USER_PROFILE_CACHE.move_to_end(uid)
+        return dict(cached[1])
+
+
+def _cache_user_profile(uid: str, profile: dict[str, Any]) -> None:
+    with _USER_PROFILE_CACHE_LOCK:
+        _USER_PROFILE_CACHE[uid] = (time.monotonic() + USER_PROFILE_CACHE_TTL_SECONDS, dict(profile))
+        _USER_PROFILE_CACHE.move_to_end(uid)
+        while len(_USER_PROFILE_CACHE) > USER_PROFILE_CACHE_MAX_ENTRIES:
+            _USER_PROFILE_CACHE.popitem(last=False)
 
 
 def _load_or_create_user_profile(uid: str) -> dict[str, Any]:
     if not FIRESTORE_ENABLED:
         return {"uid": uid, "notifications_enabled": True}
 
+    # Every terminal job reads the owner's profile. Writes made by this process update the cache; changes made by
+    # other instances (including notification opt-outs) are picked up once the entry expires.
+    cached = _cached_user_profile(uid)
+    if cached is not None:
+        return cached
+
     def _read() -> Any:
         return _firestore_users_collection().document(uid).get()
 
@@ -822,6 +1136,7 @@ def _load_or_create_user_profile(uid: str) -> dict[str, Any]:
             attempts=STATE_RETRY_ATTEMPTS,
             delay_seconds=STATE_RETRY_DELAY_SECONDS,
         )
+        _cache_user_profile(uid, profile)
         return profile
 
     profile = snapshot.to_dict() or {}
@@ -839,6 +1154,7 @@ def _load_or_create_user_profile(uid: str) -> dict[str, Any]:
             attempts=STATE_RETRY_ATTEMPTS,
             delay_seconds=STATE_RETRY_DELAY_SECONDS,
         )
+    _cache_user_profile(uid, profile)
     return profile
 
 
@@ -864,6 +1180,7 @@ def _update_user_notification_preference(uid: str, *, notifications_enabled: boo
             attempts=STATE_RETRY_ATTEMPTS,
             delay_seconds=STATE_RETRY_DELAY_SECONDS,
         )
+        _cache_user_profile(uid, profile)
 
     return profile
 
@@ -888,10 +1205,15 @@ def _update_user_profile_contact(uid: str, *, email: str | None, display_name: s
         attempts=STATE_RETRY_ATTEMPTS,
         delay_seconds=STATE_RETRY_DELAY_SECONDS,
     )
+    cached = _cached_user_profile(uid)
+    if cached is not None:
+        cached.update(payload)
+        _cache_user_profile(uid, cached)
 
 
-def _lookup_recipient_email(uid: str) -> tuple[str | None, str | None]:
-    profile = _load_or_create_user_profile(uid)
+def _lookup_recipient_email(uid: str, profile: dict[str, Any] | None = None) -> tuple[str | None, str | None]:
+    if profile is None:
+        profile = _load_or_create_user_profile(uid)
     email = str(profile.get("email") or "").strip() or None
     display_name = str(profile.get("display_name") or "").strip() or None
     if email:
@@ -940,17 +1262,17 @@ def _job_completion_summary(job: dict[str, Any]) -> dict[str, Any]:
     total = len(videos)
     completed = sum(1 for item in videos if item.get("status") == "completed")
     failed = sum(1 for item in videos if item.get("status") == "failed")
-    status = str(job.get("status") or "")
+    status = _as_str(job.get("status"))
     status_label = status.replace("_", " ").title()
     media_url = f"{WEB_BASE_URL}/media"
-    job_id = str(job.get("id") or "")
+    job_id = _as_str(job.get("id"))
     if job_id:
         media_url = f"{media_url}?job={quote(job_id)}"
     return {
         "job_id": job_id,
         "job_status": status,
         "job_status_label": status_label,
-        "job_message": str(job.get("message") or ""),
+        "job_message": _as_str(job.get("message")),
         "total_videos": total,
         "completed_videos": completed,
         "failed_videos": failed,
@@ -1030,7 +1352,7 @@ def _send_job_completion_notification(job: dict[str, Any]) -> None:
     if not bool(profile.get("notifications_enabled", True)):
         return
 
-    recipient_email, recipient_name = _lookup_recipient_email(uid)
+    recipient_email, recipient_name = _lookup_recipient_email(uid, profile)
     if not recipient_email:
         LOGGER.warning("Skipping completion notification: no recipient email for uid=%s job=%s", uid, job.get("id"))
         return
@@ -1039,11 +1361,21 @@ def _send_job_completion_notification(job: dict[str, Any]) -> None:
 
 
 def _persist_job_state(job: dict[str, Any]) -> dict[str, Any]:
-    payload = deepcopy(job)
+    job_id = str(job["id"])
+    signature = _job_state_signature(job)
+    if signature is not None:
+        with JOBS_LOCK:
+            cached = JOBS.get(job_id)
+            unchanged = cached is not None and JOB_STATE_SIGNATURES.get(job_id) == signature
+        if unchanged:
+            return _clone_cached_job(job_id, cached)
+
+    payload = _clone_job_state(job)
     payload["updated_at"] = _utc_now()
-    job_id = str(payload["id"])
     if not FIRESTORE_ENABLED and LOCAL_SMOKE_IN_MEMORY_JOBS:
-        _cache_job_state(payload)
+        _cache_job_state(payload, signature=signature)
+        _invalidate_output_names(payload)
+        _invalidate_job_listing(_as_str(payload.get("uid")))
         return payload
 
     def _write() -> None:
@@ -1055,10 +1387,45 @@ def _persist_job_state(job: dict[str, Any]) -> dict[str, Any]:
         attempts=STATE_RETRY_ATTEMPTS,
         delay_seconds=STATE_RETRY_DELAY_SECONDS,
     )
-    _cache_job_state(payload)
+    _cache_job_state(payload, signature=signature)
+    _invalidate_output_names(payload)
+    _invalidate_job_listing(_as_str(payload.get("uid")))
     return payload
 
 
+def _persist_job_states(jobs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # Bulk variant of _persist_job_state for backfills: one batched commit instead of a round trip per job.
+    if not FIRESTORE_ENABLED or len(jobs) < 2:
+        return [_persist_job_state(job) for job in jobs]
+
+    signatures = [_job_state_signature(job) for job in jobs]
+    payloads = [_clone_job_state(job) for job in jobs]
+    updated_at = _utc_now()
+    for payload in payloads:
+        payload["updated_at"] = updated_at
+
+    def _write() -> None:
+        collection = _firestore_jobs_collection()
+        client = _firestore_client()
+        for start in range(0, len(payloads), FIRESTORE_WRITE_BATCH_SIZE):
+            batch = client.batch()
+            for payload in payloads[start : start + FIRESTORE_WRITE_BATCH_SIZE]:
+                batch.set(collection.document(str(payload["id"])), payload)
+            batch.commit()
+
+    _retry_operation(
+        f"Persisting {len(payloads)} job state(s)",
+        _write,
+        attempts=STATE_RETRY_ATTEMPTS,
+        delay_seconds=STATE_RETRY_DELAY_SECONDS,
+    )
+    for payload, signature in zip(payloads, signatures):
+        _cache_job_state(payload, signature=signature)
+        _invalidate_output_names(payload)
+        _invalidate_job_listing(_as_str(payload.get("uid")))
+    return payloads
+
+
 def _delete_job_state(job_id: str) -> None:
     if not FIRESTORE_ENABLED and LOCAL_SMOKE_IN_MEMORY_JOBS:
         _forget_job(job_id)
@@ -1075,23 +1442,25 @@ def _delete_job_state(job_id: str) -> None:
         attempts=STATE_RETRY_ATTEMPTS,
         delay_seconds=STATE_RETRY_DELAY_SECONDS,
     )
+    _invalidate_job_listing(None)
     _forget_job(job_id)
     with _QUEUE_WORKER_LOCK:
         ENQUEUED_JOBS.discard(job_id)
 
 
 def _load_job_state(job_id: str, *, prefer_cache: bool) -> dict[str, Any] | None:
-    if prefer_cache:
-        with JOBS_LOCK:
-            cached = JOBS.get(job_id)
-            if cached is not None:
-                return deepcopy(cached)
+    if prefer_cache or TERMINAL_CACHED_JOB_EXPIRY.get(job_id, 0.0) > time.monotonic():
+        # A single dict lookup is atomic; no need to serialize cache hits behind JOBS_LOCK.
+        cached = JOBS.get(job_id)
+        if cached is not None:
+            if not prefer_cache:
+                _ops_increment("job_state_terminal_cache_hits_total")
+            return _clone_cached_job(job_id, cached)
 
     if not FIRESTORE_ENABLED:
         if LOCAL_SMOKE_IN_MEMORY_JOBS:
-            with JOBS_LOCK:
-                cached = JOBS.get(job_id)
-                return deepcopy(cached) if cached is not None else None
+            cached = JOBS.get(job_id)
+            return _clone_cached_job(job_id, cached) if cached is not None else None
         return None
 
     def _read() -> Any:
@@ -1109,108 +1478,194 @@ def _load_job_state(job_id: str, *, prefer_cache: bool) -> dict[str, Any] | None
     job_payload = snapshot.to_dict() or {}
     job_payload.setdefault("id", job_id)
     _cache_job_state(job_payload)
-    return deepcopy(job_payload)
+    return job_payload
 
 
-def _list_jobs_with_status(statuses: set[str]) -> list[dict[str, Any]]:
+def _load_job_states(job_ids: list[str]) -> dict[str, dict[str, Any] | None]:
+    if not job_ids:
+        return {}
     if not FIRESTORE_ENABLED:
+        if not LOCAL_SMOKE_IN_MEMORY_JOBS:
+            return {job_id: None for job_id in job_ids}
+        with JOBS_LOCK:
+            cached = {job_id: JOBS.get(job_id) for job_id in job_ids}
+        return {job_id: _clone_cached_job(job_id, job) if job is not None else None for job_id, job in cached.items()}
+
+    def _read() -> dict[str, dict[str, Any] | None]:
+        collection = _firestore_jobs_collection()
+        client = _firestore_client()
+        states: dict[str, dict[str, Any] | None] = {job_id: None for job_id in job_ids}
+        for start in range(0, len(job_ids), FIRESTORE_GET_ALL_BATCH_SIZE):
+            refs = [collection.document(job_id) for job_id in job_ids[start : start + FIRESTORE_GET_ALL_BATCH_SIZE]]
+            for snapshot in client.get_all(refs):
+                if snapshot.exists:
+                    states[snapshot.id] = {"id": snapshot.id, **(snapshot.to_dict() or {})}
+        return states
+
+    states = _retry_operation(
+        f"Loading {len(job_ids)} job state(s)",
+        _read,
+        attempts=STATE_RETRY_ATTEMPTS,
+        delay_seconds=STATE_RETRY_DELAY_SECONDS,
+    )
+    for state in states.values():
+        if state is not None:
+            _cache_job_state(state)
+    return states
+
+
+def _job_payloads_from_snapshots(snapshots: Any) -> list[dict[str, Any]]:
+    return [{"id": snapshot.id, **(snapshot.to_dict() or {})} for snapshot in snapshots]
+
+
+def _list_jobs_with_status(statuses: set[str]) -> list[dict[str, Any]]:
+    if not FIRESTORE_ENABLED or not statuses:
         return []
 
-    def _stream() -> list[Any]:
-        return list(_firestore_jobs_collection().stream())
+    status_values = sorted(statuses)
+
+    def _stream() -> list[dict[str, Any]]:
+        from google.cloud.firestore_v1 import FieldFilter
 
-    snapshots = _retry_operation(
+        collection = _firestore_jobs_collection()
+        jobs: list[dict[str, Any]] = []
+        for start in range(0, len(status_values), FIRESTORE_IN_QUERY_LIMIT):
+            chunk = status_values[start : start + FIRESTORE_IN_QUERY_LIMIT]
+            jobs.extend(_job_payloads_from_snapshots(collection.where(filter=FieldFilter("status", "in", chunk)).stream()))
+        return jobs
+
+    return _retry_operation(
         "Listing job states",
         _stream,
         attempts=STATE_RETRY_ATTEMPTS,
         delay_seconds=STATE_RETRY_DELAY_SECONDS,
     )
-    jobs: list[dict[str, Any]] = []
-    for snapshot in snapshots:
-        payload = snapshot.to_dict() or {}
-        payload.setdefault("id", snapshot.id)
-        if payload.get("status") in statuses:
-            jobs.append(payload)
-    return jobs
 
 
 def _list_jobs_for_uid(uid: str) -> list[dict[str, Any]]:
-    if not FIRESTORE_ENABLED:
+    if not uid:
         return []
+    if not FIRESTORE_ENABLED:
+        return _list_cached_jobs_for_uid(uid) if LOCAL_SMOKE_IN_MEMORY_JOBS else []
+
+    now_monotonic = time.monotonic()
+    with _JOB_LISTING_CACHE_LOCK:
+        cached = _JOB_LISTING_CACHE.get(uid)
+        generation = _JOB_LISTING_GENERATION
+    if cached is not None and cached[0] > now_monotonic:
+        return [_clone_job_state(job) for job in cached[1]]
+
+    def _stream() -> list[dict[str, Any]]:
+        from google.cloud.firestore_v1 import FieldFilter
 
-    def _stream() -> list[Any]:
-        return list(_firestore_jobs_collection().stream())
+        query = _firestore_jobs_collection().where(filter=FieldFilter("uid", "==", uid))
+        return _job_payloads_from_snapshots(query.stream())
 
-    snapshots = _retry_operation(
+    jobs = _retry_operation(
         f"Listing jobs for user {uid}",
         _stream,
         attempts=STATE_RETRY_ATTEMPTS,
         delay_seconds=STATE_RETRY_DELAY_SECONDS,
     )
-    jobs: list[dict[str, Any]] = []
-    for snapshot in snapshots:
-        payload = snapshot.to_dict() or {}
-        payload.setdefault("id", snapshot.id)
-        if str(payload.get("uid") or "") == uid:
-            jobs.append(payload)
-    return jobs
+    # The TTL starts once the query has returned; a write that landed mid-query means the result may be stale.
+    with _JOB_LISTING_CACHE_LOCK:
+        if generation == _JOB_LISTING_GENERATION:
+            _JOB_LISTING_CACHE[uid] = (time.monotonic() + JOB_LISTING_CACHE_TTL_SECONDS, jobs)
+            _JOB_LISTING_CACHE.move_to_end(uid)
+            while len(_JOB_LISTING_CACHE) > JOB_LISTING_CACHE_MAX_ENTRIES:
+                _JOB_LISTING_CACHE.popitem(last=False)
+    return [_clone_job_state(job) for job in jobs]
+
+
+def _invalidate_job_listing(uid: str | None) -> None:
+    # None drops every user's listing, for paths that do not know the owner.
+    global _JOB_LISTING_GENERATION
+    with _JOB_LISTING_CACHE_LOCK:
+        _JOB_LISTING_GENERATION += 1
+        if uid is None:
+            _JOB_LISTING_CACHE.clear()
+        else:
+            _JOB_LISTING_CACHE.pop(uid, None)
 
 
 def _list_all_jobs() -> list[dict[str, Any]]:
     if not FIRESTORE_ENABLED:
         return []
 
-    def _stream() -> list[Any]:
-        return list(_firestore_jobs_collection().stream())
+    def _stream() -> list[dict[str, Any]]:
+        return _job_payloads_from_snapshots(_firestore_jobs_collection().stream())
 
-    snapshots = _retry_operation(
+    return _retry_operation(
         "Listing all jobs",
         _stream,
         attempts=STATE_RETRY_ATTEMPTS,
         delay_seconds=STATE_RETRY_DELAY_SECONDS,
     )
-    jobs: list[dict[str, Any]] = []
-    for snapshot in snapshots:
-        payload = snapshot.to_dict() or {}
-        payload.setdefault("id", snapshot.id)
-        jobs.append(payload)
-    return jobs
+
+
+def _as_str(value: Any) -> str:
+    # Same result as str(value or "") but skips the str() call for values that are already strings.
+    if type(value) is str:
+        return value
+    return str(value or "")
 
 
 def _default_video_title(video: dict[str, Any]) -> str:
-    candidate = str(video.get("title") or "").strip()
+    candidate = _as_str(video.get("title")).strip()
     if candidate:
         return candidate
 
-    output_name = str(video.get("output_name") or "").strip()
-    input_name = str(video.get("input_name") or "").strip()
+    output_name = _as_str(video.get("output_name")).strip()
+    input_name = _as_str(video.get("input_name")).strip()
     base_name = output_name or input_name or "render"
-    stem = Path(base_name).stem
+    stem = os.path.splitext(os.path.basename(base_name))[0]
     return stem or base_name
 
 
+def _new_video_ids(count: int) -> list[str]:
+    if count == 1:
+        return [uuid4().hex]
+    # One urandom read for the whole batch instead of one per uuid4().
+    random_bytes = os.urandom(16 * count)
+    return [UUID(bytes=random_bytes[index * 16 : (index + 1) * 16], version=4).hex for index in range(count)]
+
+
 def _ensure_video_identity_metadata(job: dict[str, Any]) -> dict[str, Any]:
+    if _backfill_video_identity_metadata(job):
+        return _persist_job_state(job)
+    return job
+
+
+def _backfill_video_identity_metadata(job: dict[str, Any]) -> bool:
+    # Ids and titles are never cleared once set, so jobs stamped at creation can skip the walk entirely.
+    if job.get("video_identity_version") == VIDEO_IDENTITY_VERSION:
+        return False
     changed = False
     videos = job.get("videos", [])
     if not isinstance(videos, list):
-        return job
+        return False
+
+    missing_ids = [video for video in videos if isinstance(video, dict) and not _as_str(video.get("id")).strip()]
+    if missing_ids:
+        for video, video_id in zip(missing_ids, _new_video_ids(len(missing_ids))):
+            video["id"] = video_id
+        changed = True
 
     for video in videos:
         if not isinstance(video, dict):
             continue
 
-        video_id = str(video.get("id") or "").strip()
-        if not video_id:
-            video["id"] = uuid4().hex
-            changed = True
-
-        title = str(video.get("title") or "").strip()
+        title = _as_str(video.get("title")).strip()
         if not title:
             video["title"] = _default_video_title(video)
             changed = True
 
-    if changed:
-        return _persist_job_state(job)
+    return changed
+
+
+def _without_internal_job_fields(job: dict[str, Any]) -> dict[str, Any]:
+    for field in INTERNAL_JOB_FIELDS:
+        job.pop(field, None)
     return job
 
 
@@ -1222,67 +1677,109 @@ def _find_video_by_id(job: dict[str, Any], video_id: str) -> tuple[int, dict[str
     for index, video in enumerate(videos):
         if not isinstance(video, dict):
             continue
-        if str(video.get("id") or "") == video_id:
+        if _as_str(video.get("id")) == video_id:
             return index, video
 
     raise HTTPException(status_code=404, detail="Media not found")
 
 
-def _media_status_rank(status: str) -> int:
-    rank = {
-        "queued": 0,
-        "running": 1,
-        "completed": 2,
-        "completed_with_errors": 3,
-        "failed": 4,
-    }
-    return rank.get(status, 99)
+# Sort keys read media items built by _build_media_item, where status and title are always strings.
+# The trailing id makes every key unique, so cursors address an exact position in the ordering.
+def _media_status_sort_key(item: dict[str, Any]) -> tuple[Any, ...]:
+    return (MEDIA_STATUS_RANK.get(item["status"], 99), item["title"].lower(), item["id"])
+
 
+def _media_title_sort_key(item: dict[str, Any]) -> tuple[Any, ...]:
+    return (item["title"].lower(), _as_str(item["updated_at"]), item["id"])
 
-def _media_sort_value(item: dict[str, Any], sort_by: str) -> tuple[Any, Any]:
+
+def _media_sort_key(sort_by: str) -> Callable[[dict[str, Any]], tuple[Any, ...]]:
+    # Resolve the sort field once per request; list.sort(key=...) then builds each item's key exactly once.
     if sort_by == "status":
-        return (_media_status_rank(str(item.get("status") or "")), str(item.get("title") or "").lower())
+        return _media_status_sort_key
     if sort_by == "title":
-        return (str(item.get("title") or "").lower(), str(item.get("updated_at") or ""))
-    return (str(item.get(sort_by) or ""), str(item.get("title") or "").lower())
+        return _media_title_sort_key
 
+    def _field_sort_key(item: dict[str, Any]) -> tuple[Any, ...]:
+        return (_as_str(item[sort_by]), item["title"].lower(), item["id"])
 
-def _build_media_item(job: dict[str, Any], video: dict[str, Any]) -> dict[str, Any]:
-    status = str(video.get("status") or "queued")
-    output_name = str(video.get("output_name") or "")
-    object_key = str(video.get("r2_object_key") or "")
+    return _field_sort_key
+
+
+def _encode_media_cursor(sort_by: str, sort_order: str, key: tuple[Any, ...]) -> str:
+    raw = json.dumps([sort_by, sort_order, list(key)], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_media_cursor(cursor: str, sort_by: str, sort_order: str) -> tuple[Any, ...]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort_by, cursor_sort_order, key = json.loads(raw)
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+    if cursor_sort_by != sort_by or cursor_sort_order != sort_order:
+        raise HTTPException(status_code=400, detail="Cursor does not match sort_by/sort_order")
+    if not isinstance(key, list) or not all(isinstance(value, (str, int)) for value in key):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return tuple(key)
+
+
+def _media_job_fields(job: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "job_id": _as_str(job.get("id")),
+        "job_status": _as_str(job.get("status")),
+        "job_message": _as_str(job.get("message")),
+        "created_at": job.get("created_at"),
+        "updated_at": job.get("updated_at"),
+    }
+
+
+def _build_media_item(
+    job: dict[str, Any],
+    video: dict[str, Any],
+    job_fields: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    # Job-level fields are identical for every video of a job; listings compute them once per job.
+    if job_fields is None:
+        job_fields = _media_job_fields(job)
+    video_get = video.get
+    status = _as_str(video_get("status")) or "queued"
+    output_name = _as_str(video_get("output_name"))
+    object_key = _as_str(video_get("r2_object_key"))
 
     return {
-        "id": str(video.get("id") or ""),
-        "job_id": str(job.get("id") or ""),
+        "id": _as_str(video_get("id")),
+        "job_id": job_fields["job_id"],
         "status": status,
-        "job_status": str(job.get("status") or ""),
-        "job_message": str(job.get("message") or ""),
+        "job_status": job_fields["job_status"],
+        "job_message": job_fields["job_message"],
         "title": _default_video_title(video),
-        "input_name": str(video.get("input_name") or ""),
+        "input_name": _as_str(video_get("input_name")),
         "output_name": output_name or None,
-        "size_bytes": video.get("output_size_bytes"),
-        "render_profile_label": video.get("render_profile_label"),
-        "source_resolution": video.get("source_resolution"),
-        "source_fps": video.get("source_fps"),
-        "source_duration_seconds": video.get("source_duration_seconds"),
-        "output_resolution": video.get("output_resolution"),
-        "output_fps": video.get("output_fps"),
-        "output_duration_seconds": video.get("output_duration_seconds"),
-        "output_codec": video.get("output_codec"),
-        "render_elapsed_seconds": video.get("render_elapsed_seconds"),
-        "wall_x_realtime": video.get("wall_x_realtime"),
-        "progress": int(video.get("progress") or 0),
-        "detail": video.get("detail"),
-        "error": video.get("error"),
-        "log_name": str(video.get("log_name") or "") or None,
-        "created_at": job.get("created_at"),
-        "updated_at": job.get("updated_at"),
+        "size_bytes": video_get("output_size_bytes"),
+        "render_profile_label": video_get("render_profile_label"),
+        "source_resolution": video_get("source_resolution"),
+        "source_fps": video_get("source_fps"),
+        "source_duration_seconds": video_get("source_duration_seconds"),
+        "output_resolution": video_get("output_resolution"),
+        "output_fps": video_get("output_fps"),
+        "output_duration_seconds": video_get("output_duration_seconds"),
+        "output_codec": video_get("output_codec"),
+        "render_elapsed_seconds": video_get("render_elapsed_seconds"),
+        "wall_x_realtime": video_get("wall_x_realtime"),
+        "progress": int(video_get("progress") or 0),
+        "detail": video_get("detail"),
+        "error": video_get("error"),
+        "log_name": _as_str(video_get("log_name")) or None,
+        "created_at": job_fields["created_at"],
+        "updated_at": job_fields["updated_at"],
         "can_download": bool(output_name and object_key and status == "completed"),
     }
 
 
 def _delete_r2_object(object_key: str) -> None:
+    _forget_signed_r2_download_urls(object_key)
+
     def _delete() -> None:
         _r2_client().delete_object(Bucket=R2_BUCKET, Key=object_key)
 
@@ -1294,6 +1791,31 @@ def _delete_r2_object(object_key: str) -> None:
     )
 
 
+def _delete_r2_objects(object_keys: list[str]) -> None:
+    for object_key in object_keys:
+        _forget_signed_r2_download_urls(object_key)
+
+    for start in range(0, len(object_keys), R2_DELETE_BATCH_SIZE):
+        batch = object_keys[start : start + R2_DELETE_BATCH_SIZE]
+
+        def _delete(batch: list[str] = batch) -> None:
+            response = _r2_client().delete_objects(
+                Bucket=R2_BUCKET,
+                Delete={"Objects": [{"Key": object_key} for object_key in batch], "Quiet": True},
+            )
+            errors = response.get("Errors") or []
+            if errors:
+                first = errors[0]
+                raise RuntimeError(f"Failed to delete {len(errors)} R2 object(s), first {first.get('Key')}: {first.get('Message')}")
+
+        _retry_operation(
+            f"Deleting {len(batch)} R2 object(s)",
+            _delete,
+            attempts=UPLOAD_RETRY_ATTEMPTS,
+            delay_seconds=UPLOAD_RETRY_DELAY_SECONDS,
+        )
+
+
 def _r2_client() -> Any:
     if not R2_UPLOAD_ENABLED:
         raise RuntimeError("R2 upload integration is disabled")
@@ -1322,6 +1844,24 @@ def _r2_client() -> Any:
     return _R2_CLIENT
 
 
+def _r2_transfer_config() -> Any:
+    global _R2_TRANSFER_CONFIG
+    if _R2_TRANSFER_CONFIG is None:
+        try:
+            from boto3.s3.transfer import TransferConfig
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError("boto3 transfer support is unavailable") from exc
+
+        _R2_TRANSFER_CONFIG = TransferConfig(
+            multipart_threshold=R2_MULTIPART_THRESHOLD_BYTES,
+            multipart_chunksize=R2_MULTIPART_CHUNK_BYTES,
+            max_concurrency=R2_UPLOAD_MAX_CONCURRENCY,
+            io_chunksize=1024 * 1024,
+            use_threads=True,
+        )
+    return _R2_TRANSFER_CONFIG
+
+
 def _upload_output_to_r2(uid: str, job_id: str, output_name: str, output_path: Path) -> dict[str, Any]:
     object_key = build_r2_output_object_key(uid, job_id, output_name)
     content_type = "video/mp4" if output_path.suffix.lower() == ".mp4" else "application/octet-stream"
@@ -1332,6 +1872,7 @@ def _upload_output_to_r2(uid: str, job_id: str, output_name: str, output_path: P
             R2_BUCKET,
             object_key,
             ExtraArgs={"ContentType": content_type},
+            Config=_r2_transfer_config(),
         )
 
     _retry_operation(
@@ -1362,6 +1903,31 @@ def _upload_output_to_r2(uid: str, job_id: str, output_name: str, output_path: P
 
 
 def _signed_r2_download_url(object_key: str, filename: str) -> str:
+    cache_key = (object_key, filename)
+    now_monotonic = time.monotonic()
+    with _SIGNED_URL_CACHE_LOCK:
+        cached = _SIGNED_URL_CACHE.get(cache_key)
+        if cached is not None and cached[0] > now_monotonic:
+            _SIGNED_URL_CACHE.move_to_end(cache_key)
+            return cached[1]
+
+    url = _sign_r2_download_url(object_key, filename)
+    reuse_until = now_monotonic + R2_SIGNED_URL_TTL_SECONDS - R2_SIGNED_URL_CACHE_MARGIN_SECONDS
+    with _SIGNED_URL_CACHE_LOCK:
+        _SIGNED_URL_CACHE[cache_key] = (reuse_until, url)
+        _SIGNED_URL_CACHE.move_to_end(cache_key)
+        while len(_SIGNED_URL_CACHE) > R2_SIGNED_URL_CACHE_MAX_ENTRIES:
+            _SIGNED_URL_CACHE.popitem(last=False)
+    return url
+
+
+def _forget_signed_r2_download_urls(object_key: str) -> None:
+    with _SIGNED_URL_CACHE_LOCK:
+        for cache_key in [key for key in _SIGNED_URL_CACHE if key[0] == object_key]:
+            del _SIGNED_URL_CACHE[cache_key]
+
+
+def _sign_r2_download_url(object_key: str, filename: str) -> str:
     safe_filename = quote(_safe_filename(filename))
     content_disposition = f"attachment; filename*=UTF-8''{safe_filename}"
 
@@ -1427,16 +1993,13 @@ def _verify_r2_object(object_key: str) -> dict[str, Any]:
 
 
 def _enqueue_job(job_id: str) -> bool:
-    added = False
     with _QUEUE_WORKER_LOCK:
         if job_id in ENQUEUED_JOBS or job_id in ACTIVE_JOBS:
             return False
         ENQUEUED_JOBS.add(job_id)
-        added = True
     JOB_QUEUE.put(job_id)
-    if added:
-        _ops_increment("queue_enqueued_total")
-    return added
+    _ops_increment("queue_enqueued_total")
+    return True
 
 
 def _is_job_active_locally(job_id: str) -> bool:
@@ -1454,7 +2017,6 @@ def _queue_worker_loop() -> None:
                 ENQUEUED_JOBS.add(job_id)
                 claimed = True
         if not claimed:
-            JOB_QUEUE.task_done()
             continue
 
         try:
@@ -1476,7 +2038,6 @@ def _queue_worker_loop() -> None:
             with _QUEUE_WORKER_LOCK:
                 ACTIVE_JOBS.discard(job_id)
                 ENQUEUED_JOBS.discard(job_id)
-            JOB_QUEUE.task_done()
 
 
 def _start_queue_workers() -> None:
@@ -1493,31 +2054,31 @@ def _start_queue_workers() -> None:
         _QUEUE_WORKER_STARTED = True
 
 
+# Both recovery helpers only mutate the job; _reconcile_pending_jobs_once persists a sweep's changes in one batch.
 def _mark_job_artifacts_missing_failed(job: dict[str, Any], *, reason: str, metric_key: str) -> None:
     job["status"] = "failed"
     job["finished_at"] = _utc_now()
     job["progress"] = 100
     job["message"] = reason
-    _persist_job_state(job)
     _ops_increment(metric_key)
 
 
-def _normalize_job_for_recovery(job: dict[str, Any], *, message: str) -> dict[str, Any]:
-    if str(job.get("status") or "") == "running":
-        job["status"] = "queued"
-        job["message"] = message
-        for video in job.get("videos", []):
-            status = str(video.get("status") or "")
-            if status == "completed":
-                continue
-            if status in {"running", "queued", "failed"}:
-                video["status"] = "queued"
-                video["progress"] = 0
-                video["detail"] = "Queued for recovery"
-                video["error"] = None
-        _persist_job_state(job)
-        _ops_increment("reconcile_normalized_running_total")
-    return job
+def _normalize_job_for_recovery(job: dict[str, Any], *, message: str) -> bool:
+    if str(job.get("status") or "") != "running":
+        return False
+    job["status"] = "queued"
+    job["message"] = message
+    for video in job.get("videos", []):
+        status = str(video.get("status") or "")
+        if status == "completed":
+            continue
+        if status in {"running", "queued", "failed"}:
+            video["status"] = "queued"
+            video["progress"] = 0
+            video["detail"] = "Queued for recovery"
+            video["error"] = None
+    _ops_increment("reconcile_normalized_running_total")
+    return True
 
 
 def _job_has_recoverable_inputs(job: dict[str, Any]) -> bool:
@@ -1552,9 +2113,10 @@ def _prune_enqueued_jobs() -> None:
     with _QUEUE_WORKER_LOCK:
         candidates = [job_id for job_id in ENQUEUED_JOBS if job_id not in ACTIVE_JOBS]
 
+    states = _load_job_states(candidates)
     stale: list[str] = []
     for job_id in candidates:
-        state = _load_job_state(job_id, prefer_cache=False)
+        state = states.get(job_id)
         if state is None or str(state.get("status") or "") in TERMINAL_JOB_STATUSES:
             stale.append(job_id)
 
@@ -1578,6 +2140,8 @@ def _reconcile_pending_jobs_once(*, startup: bool) -> dict[str, int]:
         "failed_missing_inputs": 0,
     }
 
+    changed_jobs: list[dict[str, Any]] = []
+    recoverable_job_ids: list[str] = []
     for job in _list_jobs_with_status({"queued", "running"}):
         summary["scanned"] += 1
         job_id = str(job.get("id") or "")
@@ -1591,6 +2155,7 @@ def _reconcile_pending_jobs_once(*, startup: bool) -> dict[str, int]:
                 reason="Job artifacts are missing on disk and were removed from the queue",
                 metric_key="reconcile_failed_missing_dir_total",
             )
+            changed_jobs.append(job)
             summary["failed_missing_dir"] += 1
             continue
         if not _job_has_recoverable_inputs(job):
@@ -1599,16 +2164,21 @@ def _reconcile_pending_jobs_once(*, startup: bool) -> dict[str, int]:
                 reason="Job inputs are incomplete on disk and could not be recovered",
                 metric_key="reconcile_failed_missing_inputs_total",
             )
+            changed_jobs.append(job)
             summary["failed_missing_inputs"] += 1
             continue
 
-        if str(job.get("status") or "") == "running" and not _is_job_active_locally(job_id):
-            job = _normalize_job_for_recovery(
-                job,
-                message="Resuming after API restart" if startup else "Recovered from stale running state",
-            )
+        if not _is_job_active_locally(job_id) and _normalize_job_for_recovery(
+            job,
+            message="Resuming after API restart" if startup else "Recovered from stale running state",
+        ):
+            changed_jobs.append(job)
             summary["normalized_running"] += 1
+        recoverable_job_ids.append(job_id)
 
+    # Normalized states must be durable before a worker picks the job up again.
+    _persist_job_states(changed_jobs)
+    for job_id in recoverable_job_ids:
         if not _is_job_active_locally(job_id):
             if _enqueue_job(job_id):
                 summary["requeued"] += 1
@@ -1660,16 +2230,14 @@ def _require_local_render_enabled() -> None:
     _require_job_persistence_enabled()
 
 
-def _is_active_job(job_id: str) -> bool:
-    current = _load_job_state(job_id, prefer_cache=False)
-    if current is None:
-        return False
-    return current.get("status") not in TERMINAL_JOB_STATUSES
-
-
 def _forget_job(job_id: str) -> None:
     with JOBS_LOCK:
-        JOBS.pop(job_id, None)
+        JOB_STATE_SIGNATURES.pop(job_id, None)
+        TERMINAL_CACHED_JOB_EXPIRY.pop(job_id, None)
+        job = JOBS.pop(job_id, None)
+        JOB_STATE_JSON.pop(job_id, None)
+        if job is not None:
+            _unindex_job_uid(str(job.get("uid") or ""), job_id)
 
 
 def _write_expiry_marker(job_dir: Path, expires_at: str) -> None:
@@ -1677,10 +2245,11 @@ def _write_expiry_marker(job_dir: Path, expires_at: str) -> None:
 
 
 def _read_expiry_marker(job_dir: Path) -> datetime | None:
-    marker = job_dir / JOB_EXPIRY_MARKER_FILE
-    if not marker.exists():
+    try:
+        raw = (job_dir / JOB_EXPIRY_MARKER_FILE).read_text(encoding="utf-8")
+    except FileNotFoundError:
         return None
-    return _parse_iso(marker.read_text(encoding="utf-8").strip())
+    return _parse_iso(raw.strip())
 
 
 def _cleanup_completed_job_live_files(job_dir: Path) -> None:
@@ -1706,24 +2275,33 @@ def _cleanup_expired_jobs_once() -> dict[str, int]:
         return summary
 
     now = datetime.now(timezone.utc)
-    for job_dir in JOBS_DIR.iterdir():
-        if not job_dir.is_dir():
-            continue
-        summary["scanned_dirs"] += 1
+    expired_dirs: list[Path] = []
+    # scandir's entries carry the dirent type, so non-symlinked job dirs need no extra stat for is_dir().
+    with os.scandir(JOBS_DIR) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            summary["scanned_dirs"] += 1
+            job_dir = Path(entry.path)
 
-        job_id = job_dir.name
-        if _is_active_job(job_id):
-            summary["skipped_active"] += 1
-            continue
+            expires_at = _read_expiry_marker(job_dir)
+            if expires_at is None:
+                # Backfill retention for old jobs without marker metadata.
+                mtime = datetime.fromtimestamp(entry.stat().st_mtime, tz=timezone.utc)
+                expires_at = mtime + timedelta(hours=JOB_OUTPUT_RETENTION_HOURS)
 
-        expires_at = _read_expiry_marker(job_dir)
-        if expires_at is None:
-            # Backfill retention for old jobs without marker metadata.
-            mtime = datetime.fromtimestamp(job_dir.stat().st_mtime, tz=timezone.utc)
-            expires_at = mtime + timedelta(hours=JOB_OUTPUT_RETENTION_HOURS)
+            if expires_at > now:
+                summary["skipped_not_expired"] += 1
+                continue
+            expired_dirs.append(job_dir)
 
-        if expires_at > now:
-            summary["skipped_not_expired"] += 1
+    # Only expired directories need a state check, and those are fetched in one batched read.
+    states = _load_job_states([job_dir.name for job_dir in expired_dirs])
+    for job_dir in expired_dirs:
+        job_id = job_dir.name
+        state = states.get(job_id)
+        if state is not None and state.get("status") not in TERMINAL_JOB_STATUSES:
+            summary["skipped_active"] += 1
             continue
 
         _safe_rmtree(job_dir)
@@ -1801,7 +2379,8 @@ def _run_cleanup_cycle(*, include_database: bool, force_database: bool = False)
     return payload
 
 
-def _cleanup_loop() -> None:
+async def _cleanup_loop() -> None:
+    # Runs on the event loop; only the blocking scan itself borrows a threadpool thread.
     last_database_cleanup_at = 0.0
     while True:
         try:
@@ -1810,37 +2389,81 @@ def _cleanup_loop() -> None:
                 JOB_DATABASE_CLEANUP_ENABLED
                 and (now_monotonic - last_database_cleanup_at) >= float(JOB_DATABASE_CLEANUP_INTERVAL_SECONDS)
             )
-            result = _run_cleanup_cycle(include_database=should_cleanup_database)
+            result = await run_in_threadpool(_run_cleanup_cycle, include_database=should_cleanup_database)
             if should_cleanup_database and result.get("database") is not None:
                 last_database_cleanup_at = now_monotonic
         except Exception:  # noqa: BLE001
             _ops_increment("cleanup_errors_total")
             LOGGER.exception("Cleanup loop iteration failed")
-        time.sleep(JOB_CLEANUP_INTERVAL_SECONDS)
+        await asyncio.sleep(JOB_CLEANUP_INTERVAL_SECONDS)
+
+
+def _job_update_lock(job_id: str) -> Any:
+    return JOB_UPDATE_LOCKS[hash(job_id) % len(JOB_UPDATE_LOCKS)]
 
 
 def _set_job(job_id: str, **fields: Any) -> None:
-    current = _load_job_state(job_id, prefer_cache=True)
-    if current is None:
-        raise RuntimeError(f"Job {job_id} not found")
-    previous_status = str(current.get("status") or "")
-    current.update(fields)
-    persisted = _persist_job_state(current)
+    with _job_update_lock(job_id):
+        current = _load_job_state(job_id, prefer_cache=True)
+        if current is None:
+            raise RuntimeError(f"Job {job_id} not found")
+        previous_status = str(current.get("status") or "")
+        current.update(fields)
+        persisted = _persist_job_state(current)
 
     new_status = str(persisted.get("status") or "")
     if previous_status != new_status and new_status in TERMINAL_JOB_STATUSES:
-        try:
-            _send_job_completion_notification(persisted)
-        except Exception:  # noqa: BLE001
-            LOGGER.exception("Job completion notification failed for job=%s status=%s", job_id, new_status)
+        _submit_job_completion_notification(persisted)
+
+
+def _submit_job_completion_notification(job: dict[str, Any]) -> None:
+    # Profile lookup and the Brevo send are blocking RPCs; keep them off the render worker that finished the job.
+    def _log_failure(future: Future[None]) -> None:
+        exc = future.exception()
+        if exc is not None:
+            LOGGER.error(
+                "Job completion notification failed for job=%s status=%s",
+                job.get("id"),
+                job.get("status"),
+                exc_info=exc,
+            )
+
+    _NOTIFICATION_EXECUTOR.submit(_send_job_completion_notification, job).add_done_callback(_log_failure)
 
 
 def _set_video(job_id: str, index: int, **fields: Any) -> None:
-    current = _load_job_state(job_id, prefer_cache=True)
-    if current is None:
-        raise RuntimeError(f"Job {job_id} not found")
-    current["videos"][index].update(fields)
-    _persist_job_state(current)
+    with _job_update_lock(job_id):
+        current = _load_job_state(job_id, prefer_cache=True)
+        if current is None:
+            raise RuntimeError(f"Job {job_id} not found")
+        current["videos"][index].update(fields)
+        _persist_job_state(current)
+
+
+def _set_render_progress(job_id: str, index: int, video_progress: int, *, detail: str | None = None) -> None:
+    # One read-modify-write for both the video and the job-level progress; status never changes here.
+    with _job_update_lock(job_id):
+        current = _load_job_state(job_id, prefer_cache=True)
+        if current is None:
+            raise RuntimeError(f"Job {job_id} not found")
+        videos = current["videos"]
+        videos[index]["progress"] = video_progress
+        if detail:
+            videos[index]["detail"] = detail
+        # Videos may render concurrently, so derive job progress from every video rather than a running offset.
+        finished = 0
+        progress_units = 0
+        for video in videos:
+            status = str(video.get("status") or "")
+            if status in TERMINAL_JOB_STATUSES:
+                finished += 1
+                progress_units += 100
+            elif status == "running":
+                progress_units += int(video.get("progress") or 0)
+        total_videos = max(len(videos), 1)
+        current["progress"] = int(progress_units / total_videos)
+        current["message"] = f"Rendering {min(finished + 1, total_videos)}/{total_videos}"
+        _persist_job_state(current)
 
 
 def _bearer_token_from_header(authorization: str | None = Header(default=None, alias="Authorization")) -> str:
@@ -1889,7 +2512,42 @@ def _firebase_auth_module() -> Any:
         return _FIREBASE_AUTH_MODULE
 
 
+def _warm_external_clients() -> None:
+    # Build the SDK clients once at startup so the first requests don't pay for imports and credential loading.
+    if R2_UPLOAD_ENABLED:
+        try:
+            _r2_client()
+        except Exception:  # noqa: BLE001
+            LOGGER.exception("R2 client initialization failed; retrying on first use")
+    if FIREBASE_AUTH_ENABLED:
+        try:
+            _firebase_auth_module()
+        except Exception:  # noqa: BLE001
+            LOGGER.exception("Firebase auth initialization failed; retrying on first use")
+
+
 def _verify_firebase_token(token: str) -> str:
+    # Signature and claim checks are reused for a short window (never past token expiry);
+    # revocation and disabled accounts are still checked against Firebase on every request.
+    cache_key = hashlib.sha256(token.encode("utf-8")).digest()
+    now_monotonic = time.monotonic()
+    with _VERIFIED_TOKEN_CACHE_LOCK:
+        cached = _VERIFIED_TOKEN_CACHE.get(cache_key)
+        if cached is not None and cached[0] > now_monotonic:
+            _VERIFIED_TOKEN_CACHE.move_to_end(cache_key)
+        else:
+            cached = None
+
+    if cached is not None:
+        _, uid, auth_time = cached
+        try:
+            _raise_if_firebase_token_revoked(uid, auth_time)
+        except HTTPException:
+            with _VERIFIED_TOKEN_CACHE_LOCK:
+                _VERIFIED_TOKEN_CACHE.pop(cache_key, None)
+            raise
+        return uid
+
     try:
         decoded = _firebase_auth_module().verify_id_token(token, check_revoked=True)
     except HTTPException:
@@ -1900,9 +2558,34 @@ def _verify_firebase_token(token: str) -> str:
     uid = decoded.get("uid") or decoded.get("sub")
     if not isinstance(uid, str) or not uid:
         raise HTTPException(status_code=401, detail="Invalid token payload")
+
+    expires_in = (_safe_float(decoded.get("exp")) or 0.0) - time.time()
+    cache_seconds = min(float(FIREBASE_TOKEN_CACHE_TTL_SECONDS), expires_in)
+    auth_time = _safe_float(decoded.get("auth_time")) or 0.0
+    if cache_seconds > 0:
+        with _VERIFIED_TOKEN_CACHE_LOCK:
+            _VERIFIED_TOKEN_CACHE[cache_key] = (now_monotonic + cache_seconds, uid, auth_time)
+            _VERIFIED_TOKEN_CACHE.move_to_end(cache_key)
+            while len(_VERIFIED_TOKEN_CACHE) > FIREBASE_TOKEN_CACHE_MAX_ENTRIES:
+                _VERIFIED_TOKEN_CACHE.popitem(last=False)
     return uid
 
 
+def _raise_if_firebase_token_revoked(uid: str, auth_time: float) -> None:
+    # Same rule as verify_id_token(check_revoked=True): tokens issued before the user's revocation cutoff are invalid.
+    try:
+        record = _firebase_auth_module().get_user(uid)
+    except HTTPException:
+        raise
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(status_code=401, detail="Invalid or expired token") from exc
+    if getattr(record, "disabled", False):
+        raise HTTPException(status_code=401, detail="User account is disabled")
+    valid_after_ms = _safe_float(getattr(record, "tokens_valid_after_timestamp", None)) or 0.0
+    if auth_time * 1000 < valid_after_ms:
+        raise HTTPException(status_code=401, detail="Token has been revoked")
+
+
 def _require_user_uid(authorization: str | None = Header(default=None, alias="Authorization")) -> str:
     if not FIREBASE_AUTH_ENABLED and LOCAL_SMOKE_AUTH_UID:
         return LOCAL_SMOKE_AUTH_UID
@@ -2111,23 +2794,88 @@ def _job_status_summary(jobs: list[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
-def _video_has_completed_output(video: dict[str, Any], outputs_dir: Path) -> bool:
-    status = str(video.get("status") or "")
-    if status != "completed":
-        return False
-    output_name = str(video.get("output_name") or "")
-    if video.get("r2_object_key"):
-        return True
-    return bool(output_name and (outputs_dir / output_name).exists())
+# Job directories never move once created, so the realpath walk for a job's subdirectory only has to happen once.
+@lru_cache(maxsize=1024)
+def _resolved_job_subdir(job_dir: str, name: str) -> Path:
+    return (Path(job_dir) / name).resolve()
 
 
-def _prepare_job_for_admin_requeue(job: dict[str, Any], *, reset_failed_videos: bool) -> dict[str, Any]:
-    job_id = str(job.get("id") or "")
-    if not job_id:
-        raise HTTPException(status_code=400, detail="Invalid job payload")
-    if _is_job_active_locally(job_id):
-        raise HTTPException(status_code=409, detail="Job is currently active on this API instance")
-    if not _job_has_recoverable_inputs(job):
+def _resolve_job_file(base_dir: Path, filename: str) -> Path | None:
+    # Both sides are already canonical, so a prefix check is equivalent to walking target.parents.
+    target = (base_dir / filename).resolve()
+    target_str = os.fspath(target)
+    if not target_str.startswith(os.fspath(base_dir) + os.sep) or not os.path.lexists(target_str):
+        return None
+    return target
+
+
+def _accel_redirect_response(target: Path, media_type: str) -> Response | None:
+    # Behind nginx, hand the file back to the proxy so the body is sent with sendfile(2) instead of through Python.
+    if not ACCEL_REDIRECT_PREFIX:
+        return None
+    try:
+        relative = target.relative_to(_resolved_job_subdir(str(JOBS_DIR), "."))
+    except ValueError:
+        return None
+    return Response(
+        headers={
+            "X-Accel-Redirect": f"{ACCEL_REDIRECT_PREFIX}/{quote(relative.as_posix())}",
+            "Content-Disposition": f"attachment; filename*=utf-8''{quote(target.name)}",
+        },
+        media_type=media_type,
+    )
+
+
+def _directory_entry_names(path: Path) -> set[str]:
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _cached_output_names(outputs_dir: Path) -> frozenset[str]:
+    cache_key = str(outputs_dir)
+    now_monotonic = time.monotonic()
+    with _OUTPUT_LISTING_CACHE_LOCK:
+        cached = _OUTPUT_LISTING_CACHE.get(cache_key)
+        if cached is not None and cached[0] > now_monotonic:
+            return cached[1]
+
+    names = frozenset(_directory_entry_names(outputs_dir))
+    with _OUTPUT_LISTING_CACHE_LOCK:
+        _OUTPUT_LISTING_CACHE[cache_key] = (now_monotonic + OUTPUT_LISTING_CACHE_TTL_SECONDS, names)
+        _OUTPUT_LISTING_CACHE.move_to_end(cache_key)
+        while len(_OUTPUT_LISTING_CACHE) > OUTPUT_LISTING_CACHE_MAX_ENTRIES:
+            _OUTPUT_LISTING_CACHE.popitem(last=False)
+    return names
+
+
+def _invalidate_output_names(job: dict[str, Any]) -> None:
+    job_dir = _as_str(job.get("job_dir"))
+    if not job_dir:
+        return
+    with _OUTPUT_LISTING_CACHE_LOCK:
+        _OUTPUT_LISTING_CACHE.pop(str(Path(job_dir) / "outputs"), None)
+
+
+def _video_has_completed_output(video: dict[str, Any], outputs_dir: Path) -> bool:
+    status = str(video.get("status") or "")
+    if status != "completed":
+        return False
+    output_name = str(video.get("output_name") or "")
+    if video.get("r2_object_key"):
+        return True
+    return bool(output_name and (outputs_dir / output_name).exists())
+
+
+def _prepare_job_for_admin_requeue(job: dict[str, Any], *, reset_failed_videos: bool) -> dict[str, Any]:
+    job_id = str(job.get("id") or "")
+    if not job_id:
+        raise HTTPException(status_code=400, detail="Invalid job payload")
+    if _is_job_active_locally(job_id):
+        raise HTTPException(status_code=409, detail="Job is currently active on this API instance")
+    if not _job_has_recoverable_inputs(job):
         raise HTTPException(status_code=409, detail="Job inputs are incomplete and cannot be re-queued")
 
     outputs_dir = Path(str(job.get("job_dir") or "")) / "outputs"
@@ -2284,39 +3032,155 @@ def _admin_overview_payload() -> dict[str, Any]:
             "job_database_cleanup_interval_seconds": JOB_DATABASE_CLEANUP_INTERVAL_SECONDS,
             "job_database_retention_days": JOB_DATABASE_RETENTION_DAYS,
             "ffmpeg_threads_per_render": FFMPEG_THREADS_PER_RENDER,
+            "render_video_concurrency": RENDER_VIDEO_CONCURRENCY,
         },
         "pending_jobs": _pending_jobs_summary(jobs, limit=80) if firestore_available else [],
     }
 
 
-def _build_zip_from_r2(outputs: list[tuple[str, str]], zip_path: Path) -> None:
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-        for output_name, object_key in outputs:
-            def _download() -> bytes:
-                payload = _r2_client().get_object(Bucket=R2_BUCKET, Key=object_key)
-                body = payload.get("Body")
-                if body is None:
-                    raise RuntimeError(f"Missing R2 body for {object_key}")
-                return body.read()
-
-            file_bytes = _retry_operation(
-                f"Downloading {object_key} from R2",
-                _download,
-                attempts=UPLOAD_RETRY_ATTEMPTS,
-                delay_seconds=UPLOAD_RETRY_DELAY_SECONDS,
-            )
-            archive.writestr(output_name, file_bytes)
+def _download_r2_object_to_spool(object_key: str) -> Any:
+    def _download() -> Any:
+        payload = _r2_client().get_object(Bucket=R2_BUCKET, Key=object_key)
+        body = payload.get("Body")
+        if body is None:
+            raise RuntimeError(f"Missing R2 body for {object_key}")
+        # Each attempt gets a fresh spool so a retried partial download never leaks into the archive.
+        spool = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_MEMORY_BYTES)
+        try:
+            shutil.copyfileobj(body, spool, ZIP_COPY_BUFFER_BYTES)
+        except Exception:
+            spool.close()
+            raise
+        spool.seek(0)
+        return spool
 
+    return _retry_operation(
+        f"Downloading {object_key} from R2",
+        _download,
+        attempts=UPLOAD_RETRY_ATTEMPTS,
+        delay_seconds=UPLOAD_RETRY_DELAY_SECONDS,
+    )
 
-async def _save_upload(upload: UploadFile, destination: Path) -> None:
+
+def _zip_compress_type(name: str) -> int:
+    return zipfile.ZIP_STORED if os.path.splitext(name)[1].lower() in ZIP_STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+
+
+class _ZipStreamBuffer:
+    # Write-only sink: without tell()/seek() zipfile tracks offsets itself and emits data descriptors.
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: Any) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _iter_zip_stream(sources: Iterator[tuple[str, Any, tuple[int, ...]]]) -> Iterator[bytes]:
+    buffer = _ZipStreamBuffer()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for output_name, source, date_time in sources:
+            member = zipfile.ZipInfo(output_name, date_time=date_time)
+            member.compress_type = _zip_compress_type(output_name)
+            with archive.open(member, "w", force_zip64=True) as destination:
+                while chunk := source.read(ZIP_COPY_BUFFER_BYTES):
+                    destination.write(chunk)
+                    if data := buffer.drain():
+                        yield data
+            if data := buffer.drain():
+                yield data
+    if data := buffer.drain():
+        yield data
+
+
+def _local_zip_sources(outputs_dir: Path, output_names: list[str]) -> Iterator[tuple[str, Any, tuple[int, ...]]]:
+    # Members keep the file's mtime, as archive.write() would; a bare ZipInfo defaults to 1980-01-01.
+    for output_name in output_names:
+        source = outputs_dir / output_name
+        try:
+            handle = source.open("rb")
+        except FileNotFoundError:
+            continue
+        with handle:
+            yield source.name, handle, time.localtime(os.fstat(handle.fileno()).st_mtime)[:6]
+
+
+def _r2_zip_sources(outputs: list[tuple[str, str]]) -> Iterator[tuple[str, Any, tuple[int, ...]]]:
+    # Downloads overlap on a small pool; zipfile is not thread-safe, so members are still handed out in order.
+    # Only a window of downloads runs ahead of the archive so a slow client never spills every object to disk.
+    window = max(1, min(ZIP_DOWNLOAD_CONCURRENCY, len(outputs)))
+    pending: deque[tuple[str, Future[Any]]] = deque()
+    try:
+        with ThreadPoolExecutor(max_workers=window, thread_name_prefix="zip-download") as executor:
+            queued = iter(outputs)
+            try:
+                for output_name, object_key in islice(queued, window):
+                    pending.append((output_name, executor.submit(_download_r2_object_to_spool, object_key)))
+                while pending:
+                    output_name, future = pending[0]
+                    with future.result() as source:
+                        yield output_name, source, time.localtime()[:6]
+                    pending.popleft()
+                    for next_name, next_key in islice(queued, 1):
+                        pending.append((next_name, executor.submit(_download_r2_object_to_spool, next_key)))
+            except BaseException:
+                for _output_name, future in pending:
+                    future.cancel()
+                raise
+    finally:
+        for _output_name, future in pending:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                future.result().close()
+
+
+def _sendfile_copy(source: Any, handle: Any) -> bool:
+    # Multipart spools larger than Starlette's in-memory limit are real temp files; copy those in-kernel.
+    # Small parts are skipped first, since fileno() on an in-memory spool would roll it over to disk.
+    if not hasattr(os, "sendfile"):
+        return False
+    try:
+        offset = source.tell()
+        size = source.seek(0, os.SEEK_END)
+        source.seek(offset)
+        if size - offset < UPLOAD_SENDFILE_MIN_BYTES:
+            return False
+        source_fd = source.fileno()
+    except (AttributeError, OSError):
+        return False
+    try:
+        while offset < size:
+            sent = os.sendfile(handle.fileno(), source_fd, offset, min(size - offset, 1 << 30))
+            if sent == 0:
+                break
+            offset += sent
+    except OSError:
+        handle.seek(0)
+        handle.truncate()
+        return False
+    return True
+
+
+def _copy_upload_file(source: Any, destination: Path) -> None:
     destination.parent.mkdir(parents=True, exist_ok=True)
     with destination.open("wb") as handle:
-        while True:
-            chunk = await upload.read(1024 * 1024)
-            if not chunk:
-                break
-            handle.write(chunk)
-    await upload.close()
+        if not _sendfile_copy(source, handle):
+            shutil.copyfileobj(source, handle, UPLOAD_COPY_BUFFER_BYTES)
+
+
+async def _save_upload(upload: UploadFile, destination: Path) -> None:
+    # One threadpool hop for the whole copy instead of one per chunk, and no blocking writes on the event loop.
+    try:
+        await run_in_threadpool(_copy_upload_file, upload.file, destination)
+    finally:
+        await upload.close()
 
 
 async def _probe_video_safe(path: Path) -> dict[str, Any] | None:
@@ -2326,11 +3190,15 @@ async def _probe_video_safe(path: Path) -> dict[str, Any] | None:
         return None
 
 
+# Cleanup sweeps re-parse the same stored timestamps every cycle; datetimes are immutable, so memoize.
+@lru_cache(maxsize=4096)
 def _parse_iso(value: str | None) -> datetime | None:
     if not value:
         return None
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
     try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return datetime.fromisoformat(value)
     except ValueError:
         return None
 
@@ -2338,8 +3206,8 @@ def _parse_iso(value: str | None) -> datetime | None:
 def _parse_fps(value: str | None) -> float | None:
     if not value:
         return None
-    if "/" in value:
-        left, right = value.split("/", 1)
+    left, separator, right = value.partition("/")
+    if separator:
         try:
             denom = float(right)
             if denom == 0:
@@ -2353,11 +3221,94 @@ def _parse_fps(value: str | None) -> float | None:
         return None
 
 
+@lru_cache(maxsize=1)
+def _pyav_module() -> Any | None:
+    try:
+        import av
+    except Exception:  # noqa: BLE001
+        return None
+    return av
+
+
+def _probe_video_in_process(path: Path) -> dict[str, Any] | None:
+    av = _pyav_module()
+    if av is None:
+        return None
+    try:
+        with av.open(str(path)) as container:
+            video_stream = next(iter(container.streams.video), None)
+            if video_stream is None:
+                return None
+            codec_context = video_stream.codec_context
+            rate = video_stream.average_rate
+            fps_raw = f"{rate.numerator}/{rate.denominator}" if rate else "0/0"
+            return {
+                "width": int(codec_context.width),
+                "height": int(codec_context.height),
+                "duration": float(container.duration) / av.time_base if container.duration else None,
+                "creation_time": container.metadata.get("creation_time"),
+                "codec": codec_context.name,
+                "fps": _parse_fps(fps_raw),
+                "fps_raw": fps_raw,
+            }
+    except Exception:  # noqa: BLE001
+        # Let ffprobe produce the canonical error for unreadable inputs.
+        return None
+
+
+def _probe_cache_key(path: Path) -> tuple[str, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return str(path), stat.st_size, stat.st_mtime_ns
+
+
+def _carry_probe_cache(previous_key: tuple[str, int, int] | None, path: Path) -> None:
+    # Our own utime calls change the key without changing the media; keep the cached probe reachable.
+    if previous_key is None:
+        return
+    current_key = _probe_cache_key(path)
+    if current_key is None or current_key == previous_key:
+        return
+    with _PROBE_CACHE_LOCK:
+        metadata = _PROBE_CACHE.pop(previous_key, None)
+        if metadata is not None:
+            _PROBE_CACHE[current_key] = metadata
+
+
 def _probe_video(path: Path) -> dict[str, Any]:
+    # Uploads probe each input once and _process_job probes it again; reuse results for unchanged files.
+    cache_key = _probe_cache_key(path)
+    if cache_key is not None:
+        with _PROBE_CACHE_LOCK:
+            cached = _PROBE_CACHE.get(cache_key)
+            if cached is not None:
+                _PROBE_CACHE.move_to_end(cache_key)
+                return dict(cached)
+
+    metadata = _probe_video_uncached(path)
+    if cache_key is not None:
+        with _PROBE_CACHE_LOCK:
+            _PROBE_CACHE[cache_key] = dict(metadata)
+            _PROBE_CACHE.move_to_end(cache_key)
+            while len(_PROBE_CACHE) > PROBE_CACHE_MAX_ENTRIES:
+                _PROBE_CACHE.popitem(last=False)
+    return metadata
+
+
+def _probe_video_uncached(path: Path) -> dict[str, Any]:
+    # PyAV (optional) reads the container headers in-process; otherwise spawn ffprobe.
+    metadata = _probe_video_in_process(path)
+    if metadata is not None:
+        return metadata
+
     cmd = [
         FFPROBE_BIN,
         "-v",
         "error",
+        "-select_streams",
+        "v:0",
         "-show_entries",
         "stream=width,height,codec_type,codec_name,avg_frame_rate:format=duration:format_tags=creation_time",
         "-of",
@@ -2404,17 +3355,21 @@ def _safe_float(value: Any) -> float | None:
 def _median(values: list[float]) -> float | None:
     if not values:
         return None
-    ordered = sorted(values)
-    mid = len(ordered) // 2
-    if len(ordered) % 2 == 1:
-        return ordered[mid]
-    return (ordered[mid - 1] + ordered[mid]) / 2.0
+    return statistics.median(values)
 
 
 def _nearest_eta_anchor(mega_pixels: float) -> float:
     if mega_pixels <= 0:
         return ETA_ANCHOR_MEGA_PIXELS[0]
-    return min(ETA_ANCHOR_MEGA_PIXELS, key=lambda anchor: abs(anchor - mega_pixels))
+    # Anchors are ascending; ties go to the lower anchor, as min() over the list would.
+    index = bisect_left(ETA_ANCHOR_MEGA_PIXELS, mega_pixels)
+    if index == 0:
+        return ETA_ANCHOR_MEGA_PIXELS[0]
+    if index == len(ETA_ANCHOR_MEGA_PIXELS):
+        return ETA_ANCHOR_MEGA_PIXELS[-1]
+    lower = ETA_ANCHOR_MEGA_PIXELS[index - 1]
+    upper = ETA_ANCHOR_MEGA_PIXELS[index]
+    return lower if mega_pixels - lower <= upper - mega_pixels else upper
 
 
 def _interpolate_eta_points(points: list[tuple[float, float]], mega_pixels: float) -> float:
@@ -2443,24 +3398,46 @@ def _default_eta_point_for_profile(profile_id: str, mega_pixels: float) -> float
     return _interpolate_eta_points(points, mega_pixels)
 
 
-def _load_recent_render_samples(limit: int = 3000) -> list[dict[str, Any]]:
-    if not RENDER_SAMPLES_FILE.exists():
-        return []
+def _parse_render_sample_line(line: bytes) -> dict[str, Any] | None:
+    if not line.strip():
+        return None
+    try:
+        payload = json.loads(line)
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
 
-    window: deque[dict[str, Any]] = deque(maxlen=limit)
-    with RENDER_SAMPLES_FILE.open("r", encoding="utf-8") as handle:
-        for raw_line in handle:
-            line = raw_line.strip()
-            if not line:
-                continue
-            try:
-                payload = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(payload, dict):
-                window.append(payload)
 
-    return list(window)
+def _load_recent_render_samples(limit: int = RENDER_ETA_SAMPLE_WINDOW) -> list[dict[str, Any]]:
+    try:
+        handle = RENDER_SAMPLES_FILE.open("rb")
+    except FileNotFoundError:
+        return []
+
+    # The JSONL only grows; read it backwards in blocks until the window is full instead of parsing it all.
+    recent: list[dict[str, Any]] = []
+    with handle:
+        position = handle.seek(0, os.SEEK_END)
+        partial = b""
+        while position > 0 and len(recent) < limit:
+            read_size = min(RENDER_SAMPLES_TAIL_BLOCK_BYTES, position)
+            position -= read_size
+            handle.seek(position)
+            lines = (handle.read(read_size) + partial).split(b"\n")
+            partial = lines[0]
+            for line in reversed(lines[1:]):
+                payload = _parse_render_sample_line(line)
+                if payload is not None:
+                    recent.append(payload)
+                    if len(recent) >= limit:
+                        break
+        if position == 0 and len(recent) < limit:
+            payload = _parse_render_sample_line(partial)
+            if payload is not None:
+                recent.append(payload)
+
+    recent.reverse()
+    return recent
 
 
 def _build_render_eta_calibration(samples: list[dict[str, Any]]) -> dict[str, Any]:
@@ -2493,15 +3470,19 @@ def _build_render_eta_calibration(samples: list[dict[str, Any]]) -> dict[str, An
         payload["wall_x_realtime"] = wall_x
         successful.append(payload)
 
+    samples_by_profile: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for sample in successful:
+        samples_by_profile[str(sample.get("render_profile") or "")].append(sample)
+
     profile_points: dict[str, list[dict[str, Any]]] = {}
-    profile_ids = sorted({*ETA_BASE_PROFILE_POINTS.keys(), *(str(s.get("render_profile") or "") for s in successful)})
+    profile_ids = sorted({*ETA_BASE_PROFILE_POINTS.keys(), *samples_by_profile.keys()})
     for profile_id in profile_ids:
         if not profile_id:
             continue
 
         baseline = ETA_BASE_PROFILE_POINTS.get(profile_id) or ETA_BASE_PROFILE_POINTS["h264-source"]
         anchor_values: dict[float, list[float]] = defaultdict(list)
-        profile_samples = [s for s in successful if str(s.get("render_profile") or "") == profile_id]
+        profile_samples = samples_by_profile.get(profile_id, [])
         preferred = [
             s
             for s in profile_samples
@@ -2629,39 +3610,80 @@ def _build_render_eta_calibration(samples: list[dict[str, Any]]) -> dict[str, An
 
 
 def _get_render_eta_calibration() -> dict[str, Any]:
-    global _RENDER_ETA_CACHE, _RENDER_ETA_CACHE_MTIME
+    global _RENDER_ETA_CACHE_JSON, _RENDER_ETA_CACHE_MTIME, _RENDER_SAMPLES_WINDOW, _RENDER_SAMPLES_WINDOW_MTIME
 
     mtime = RENDER_SAMPLES_FILE.stat().st_mtime if RENDER_SAMPLES_FILE.exists() else -1.0
     with _RENDER_ANALYTICS_LOCK:
-        if _RENDER_ETA_CACHE is not None and _RENDER_ETA_CACHE_MTIME == mtime:
-            return deepcopy(_RENDER_ETA_CACHE)
+        if _RENDER_ETA_CACHE_JSON is not None and _RENDER_ETA_CACHE_MTIME == mtime:
+            return json.loads(_RENDER_ETA_CACHE_JSON)
+
+        # Re-parse the JSONL only when it changed behind our back; our own appends update the window in place.
+        if _RENDER_SAMPLES_WINDOW is None or _RENDER_SAMPLES_WINDOW_MTIME != mtime:
+            _RENDER_SAMPLES_WINDOW = deque(_load_recent_render_samples(), maxlen=RENDER_ETA_SAMPLE_WINDOW)
+            _RENDER_SAMPLES_WINDOW_MTIME = mtime
 
-        samples = _load_recent_render_samples(limit=3000)
-        calibration = _build_render_eta_calibration(samples)
-        _RENDER_ETA_CACHE = calibration
+        calibration = _build_render_eta_calibration(list(_RENDER_SAMPLES_WINDOW))
+        _RENDER_ETA_CACHE_JSON = json.dumps(calibration)
         _RENDER_ETA_CACHE_MTIME = mtime
-        return deepcopy(calibration)
+        return calibration
+
+
+def _render_samples_handle() -> Any:
+    # Caller holds _RENDER_ANALYTICS_LOCK.
+    global _RENDER_SAMPLES_HANDLE
+    handle = _RENDER_SAMPLES_HANDLE
+    if handle is not None and not handle.closed and handle.name == str(RENDER_SAMPLES_FILE):
+        return handle
+    if handle is not None:
+        handle.close()
+    ANALYTICS_DIR.mkdir(parents=True, exist_ok=True)
+    _RENDER_SAMPLES_HANDLE = open(RENDER_SAMPLES_FILE, "ab")
+    return _RENDER_SAMPLES_HANDLE
 
 
 def _record_render_sample(sample: dict[str, Any]) -> None:
-    global _RENDER_ETA_CACHE, _RENDER_ETA_CACHE_MTIME
+    global _RENDER_ETA_CACHE_JSON, _RENDER_ETA_CACHE_MTIME, _RENDER_SAMPLES_WINDOW, _RENDER_SAMPLES_WINDOW_MTIME
 
-    ANALYTICS_DIR.mkdir(parents=True, exist_ok=True)
-    payload = json.dumps(sample, separators=(",", ":"), ensure_ascii=True)
+    payload = json.dumps(sample, separators=(",", ":"), ensure_ascii=True).encode("ascii") + b"\n"
     with _RENDER_ANALYTICS_LOCK:
-        with RENDER_SAMPLES_FILE.open("a", encoding="utf-8") as handle:
-            handle.write(payload)
-            handle.write("\n")
-        _RENDER_ETA_CACHE = None
+        previous_mtime = RENDER_SAMPLES_FILE.stat().st_mtime if RENDER_SAMPLES_FILE.exists() else -1.0
+        handle = _render_samples_handle()
+        handle.write(payload)
+        # Flush per sample so ETA calibration reads (and the mtime cache key) always see it.
+        handle.flush()
+        if _RENDER_SAMPLES_WINDOW is not None and _RENDER_SAMPLES_WINDOW_MTIME == previous_mtime:
+            _RENDER_SAMPLES_WINDOW.append(json.loads(payload))
+            _RENDER_SAMPLES_WINDOW_MTIME = RENDER_SAMPLES_FILE.stat().st_mtime
+        else:
+            _RENDER_SAMPLES_WINDOW = None
+            _RENDER_SAMPLES_WINDOW_MTIME = None
+        _RENDER_ETA_CACHE_JSON = None
         _RENDER_ETA_CACHE_MTIME = None
 
 
+def _submit_render_sample(sample: dict[str, Any]) -> None:
+    # Samples only feed ETA calibration, so a single writer thread appends them in order off the render path.
+    def _log_failure(future: Future[None]) -> None:
+        exc = future.exception()
+        if exc is not None:
+            LOGGER.error(
+                "Failed to persist render sample for job=%s video=%s",
+                sample.get("job_id"),
+                sample.get("input_name"),
+                exc_info=exc,
+            )
+
+    _RENDER_SAMPLE_EXECUTOR.submit(_record_render_sample, sample).add_done_callback(_log_failure)
+
+
 def _set_file_mtime_from_creation(path: Path, creation_time: str | None) -> None:
     dt = _parse_iso(creation_time)
     if dt is None:
         return
     timestamp = dt.timestamp()
+    previous_key = _probe_cache_key(path)
     os.utime(path, (timestamp, timestamp))
+    _carry_probe_cache(previous_key, path)
 
 
 def _build_renderer_command(
@@ -2787,32 +3809,39 @@ def _coerce_bool(value: Any) -> bool:
     if isinstance(value, (int, float)):
         return value != 0
     if isinstance(value, str):
-        return value.strip().lower() in {"1", "true", "yes", "on"}
+        return value.strip().lower() in TRUTHY_STRINGS
     return bool(value)
 
 
-def _parse_component_visibility(raw: str | None, include_maps: bool) -> dict[str, bool]:
-    payload: dict[str, Any] | None = None
-    if not raw:
-        visibility = dict(DEFAULT_COMPONENT_VISIBILITY)
-    else:
-        try:
-            parsed = json.loads(raw)
-        except json.JSONDecodeError as exc:
-            raise HTTPException(status_code=400, detail=f"component_visibility must be valid JSON: {exc}") from exc
-        if not isinstance(parsed, dict):
-            raise HTTPException(status_code=400, detail="component_visibility must be an object")
-        payload = parsed
+def _component_visibility_overrides(payload: dict[str, Any]) -> dict[str, bool]:
+    if payload.keys() - COMPONENT_OPTIONS.keys():
+        # Report the first unknown key in payload order so the error stays deterministic.
+        unknown = next(key for key in payload if key not in COMPONENT_OPTIONS)
+        raise HTTPException(status_code=400, detail=f"Unsupported component option: {unknown}")
+    return {key: _coerce_bool(value) for key, value in payload.items()}
 
-        visibility = dict(DEFAULT_COMPONENT_VISIBILITY)
-        for key, value in payload.items():
-            if key not in COMPONENT_OPTIONS:
-                raise HTTPException(status_code=400, detail=f"Unsupported component option: {key}")
-            visibility[key] = _coerce_bool(value)
 
-    # Keep backwards compatibility with the legacy include_maps toggle.
-    if payload is not None and "route_maps" in payload:
-        return visibility
+@lru_cache(maxsize=256)
+def _parse_component_visibility_json(raw: str) -> tuple[tuple[str, bool], ...]:
+    # Clients resend the same visibility JSON on every upload, so identical strings are parsed and validated once.
+    try:
+        parsed = json.loads(raw)
+    except json.JSONDecodeError as exc:
+        raise HTTPException(status_code=400, detail=f"component_visibility must be valid JSON: {exc}") from exc
+    if not isinstance(parsed, dict):
+        raise HTTPException(status_code=400, detail="component_visibility must be an object")
+
+    return tuple(_component_visibility_overrides(parsed).items())
+
+
+def _parse_component_visibility(raw: str | None, include_maps: bool) -> dict[str, bool]:
+    visibility = dict(DEFAULT_COMPONENT_VISIBILITY)
+    if raw:
+        overrides = _parse_component_visibility_json(raw)
+        visibility.update(overrides)
+        # Keep backwards compatibility with the legacy include_maps toggle.
+        if any(key == "route_maps" for key, _value in overrides):
+            return visibility
 
     visibility["route_maps"] = bool(include_maps)
     return visibility
@@ -2827,10 +3856,7 @@ def _normalize_component_visibility(value: Any, include_maps: bool) -> dict[str,
         raise HTTPException(status_code=400, detail="component_visibility must be an object")
 
     visibility = dict(DEFAULT_COMPONENT_VISIBILITY)
-    for key, raw_value in value.items():
-        if key not in COMPONENT_OPTIONS:
-            raise HTTPException(status_code=400, detail=f"Unsupported component option: {key}")
-        visibility[key] = _coerce_bool(raw_value)
+    visibility.update(_component_visibility_overrides(value))
     if "route_maps" not in value:
         visibility["route_maps"] = bool(include_maps)
     return visibility
@@ -2900,31 +3926,103 @@ def _normalized_local_render_settings(raw_settings: dict[str, Any]) -> dict[str,
     }
 
 
-def _auto_render_profile_candidates(metadata: dict[str, Any]) -> list[str]:
+def _auto_render_profile_candidates(metadata: dict[str, Any]) -> tuple[str, ...]:
     width = int(metadata.get("width") or 0)
     height = int(metadata.get("height") or 0)
-    high_resolution = width > 3840 or height > 2160
+    return _available_auto_render_profiles(width > 3840 or height > 2160)
 
-    if sys.platform == "darwin":
-        if high_resolution:
-            return ["qt-hevc-balanced", "h264-4k-compat", "h264-source", "h264-fast"]
-        return ["h264-source", "qt-hevc-balanced", "h264-fast"]
 
-    if high_resolution:
-        return ["h264-source", "h264-4k-compat", "h264-fast"]
-    return ["h264-source", "h264-fast"]
+@lru_cache(maxsize=2)
+def _available_auto_render_profiles(high_resolution: bool) -> tuple[str, ...]:
+    candidates = AUTO_RENDER_PROFILE_CANDIDATES[(sys.platform == "darwin", high_resolution)]
+    return tuple(profile for profile in candidates if profile in MANUAL_RENDER_PROFILES) or (DEFAULT_RENDER_PROFILE,)
 
 
-def _select_render_profile(metadata: dict[str, Any], requested_profile: str) -> tuple[str, list[str]]:
+def _select_render_profile(metadata: dict[str, Any], requested_profile: str) -> tuple[str, tuple[str, ...]]:
     if requested_profile != AUTO_RENDER_PROFILE:
-        return requested_profile, [requested_profile]
+        return requested_profile, (requested_profile,)
 
-    candidates = [profile for profile in _auto_render_profile_candidates(metadata) if profile in MANUAL_RENDER_PROFILES]
-    if not candidates:
-        candidates = [DEFAULT_RENDER_PROFILE]
+    # Auto candidates come back as the cached tuple; only its resolution class depends on this video.
+    candidates = _auto_render_profile_candidates(metadata)
     return candidates[0], candidates
 
 
+def _render_profile_encoder(preset: dict[str, Any]) -> str | None:
+    output_args = preset["output"]
+    for flag in ("-vcodec", "-c:v"):
+        if flag in output_args[:-1]:
+            return str(output_args[output_args.index(flag) + 1])
+    return None
+
+
+def _render_profile_encodes(profile_id: str, width: int, height: int) -> bool:
+    preset = _ffmpeg_profile_presets().get(profile_id)
+    if preset is None or width < 2 or height < 2:
+        return True
+    encoder = _render_profile_encoder(preset)
+    cache_key = (profile_id, width, height)
+    with _RENDER_PROFILE_PROBE_CACHE_LOCK:
+        if encoder is not None and encoder in _UNAVAILABLE_ENCODERS:
+            return False
+        cached = _RENDER_PROFILE_PROBE_CACHE.get(cache_key)
+        if cached is not None and (cached[0] is None or cached[0] > time.monotonic()):
+            _RENDER_PROFILE_PROBE_CACHE.move_to_end(cache_key)
+            return cached[1]
+
+    encodes = _probe_render_profile_encode(profile_id, preset, width, height, encoder)
+    if encodes is None:
+        return True
+    with _RENDER_PROFILE_PROBE_CACHE_LOCK:
+        expires_at = None if encodes else time.monotonic() + RENDER_PROFILE_PROBE_FAILURE_TTL_SECONDS
+        _RENDER_PROFILE_PROBE_CACHE[cache_key] = (expires_at, encodes)
+        _RENDER_PROFILE_PROBE_CACHE.move_to_end(cache_key)
+        while len(_RENDER_PROFILE_PROBE_CACHE) > RENDER_PROFILE_PROBE_CACHE_MAX_ENTRIES:
+            _RENDER_PROFILE_PROBE_CACHE.popitem(last=False)
+    return encodes
+
+
+def _probe_render_profile_encode(
+    profile_id: str,
+    preset: dict[str, Any],
+    width: int,
+    height: int,
+    encoder: str | None,
+) -> bool | None:
+    # Encode a few synthetic frames with the profile's ffmpeg settings so an encoder that can't handle
+    # this size fails in seconds instead of after a full-length render. None means inconclusive.
+    source = f"color=c=black:s={width}x{height}:r=30"
+    cmd = [FFMPEG_BIN, "-v", "error", "-y", *preset["input"], "-f", "lavfi", "-i", source]
+    if "filter" in preset:
+        cmd.extend(["-f", "lavfi", "-i", f"color=c=black@0.0:s={width}x{height}:r=30,format=rgba"])
+        cmd.extend(["-filter_complex", str(preset["filter"])])
+    cmd.extend(["-frames:v", str(RENDER_PROFILE_PROBE_FRAMES), *preset["output"]])
+    try:
+        with tempfile.TemporaryDirectory(prefix="profile-probe-") as probe_dir:
+            result = subprocess.run(
+                [*cmd, str(Path(probe_dir) / "probe.mp4")],
+                capture_output=True,
+                check=False,
+                timeout=RENDER_PROFILE_PROBE_TIMEOUT_SECONDS,
+            )
+    except (OSError, subprocess.TimeoutExpired):
+        # Inconclusive: let the real render decide.
+        return None
+    if result.returncode == 0:
+        return True
+    if encoder is not None and any(marker in result.stderr for marker in MISSING_ENCODER_MARKERS):
+        # The ffmpeg build lacks this encoder outright; no later probe of any profile using it can pass.
+        with _RENDER_PROFILE_PROBE_CACHE_LOCK:
+            _UNAVAILABLE_ENCODERS.add(encoder)
+    LOGGER.info(
+        "Render profile %s failed encode probe at %sx%s: %s",
+        profile_id,
+        width,
+        height,
+        result.stderr.decode("utf-8", "replace").strip()[-400:],
+    )
+    return False
+
+
 def _render_profile_label(profile_id: str) -> str:
     if profile_id == AUTO_RENDER_PROFILE:
         return "Auto (Recommended)"
@@ -2951,6 +4049,39 @@ def _overlay_dimensions_for_profile(metadata: dict[str, Any], profile_id: str) -
     return _to_even(PROFILE_4K_COMPAT_MAX_WIDTH), _to_even(scaled_height)
 
 
+@lru_cache(maxsize=32)
+def _profile_output_codec(profile_id: str) -> str | None:
+    preset = _ffmpeg_profile_presets().get(profile_id)
+    if preset is None or "filter" in preset:
+        # Filtered profiles may rescale the video, so their output can't be described from the source alone.
+        return None
+    encoder = _render_profile_encoder(preset)
+    if encoder is None:
+        return None
+    if "hevc" in encoder or "265" in encoder:
+        return "hevc"
+    if "264" in encoder:
+        return "h264"
+    return None
+
+
+def _derived_output_metadata(metadata: dict[str, Any], profile_id: str) -> dict[str, Any] | None:
+    # The renderer keeps the source size, frame rate and duration; only the codec comes from the profile.
+    codec = _profile_output_codec(profile_id)
+    if codec is None or not metadata.get("width") or not metadata.get("height") or not metadata.get("fps_raw"):
+        return None
+    if metadata.get("duration") is None:
+        return None
+    return {
+        "width": metadata["width"],
+        "height": metadata["height"],
+        "duration": metadata["duration"],
+        "codec": codec,
+        "fps": metadata.get("fps"),
+        "fps_raw": metadata["fps_raw"],
+    }
+
+
 def _clamped_progress(value: int | None) -> int | None:
     if value is None:
         return None
@@ -2971,7 +4102,7 @@ def _parse_resolution(value: str | None) -> tuple[int, int] | None:
 
 
 def _local_render_job_response(job: dict[str, Any]) -> dict[str, Any]:
-    return deepcopy(job)
+    return _without_internal_job_fields(deepcopy(job))
 
 
 def _create_local_render_job(payload: LocalRenderJobCreateRequest, *, uid: str) -> dict[str, Any]:
@@ -3015,7 +4146,7 @@ def _create_local_render_job(payload: LocalRenderJobCreateRequest, *, uid: str)
         videos.append(
             {
                 "id": uuid4().hex,
-                "title": video.title or Path(input_name).stem,
+                "title": (video.title or "").strip() or Path(input_name).stem,
                 "input_name": input_name,
                 "local_input_path": video.local_input_path,
                 "layout_xml": layout_xml,
@@ -3065,6 +4196,7 @@ def _create_local_render_job(payload: LocalRenderJobCreateRequest, *, uid: str)
         "message": "Waiting for local worker",
         "gpx_name": gpx_name,
         "videos": videos,
+        "video_identity_version": VIDEO_IDENTITY_VERSION,
         "settings": settings,
         "local_output_dir": payload.local_output_dir,
         "upload_intent": payload.upload_intent,
@@ -3177,7 +4309,7 @@ def _complete_local_render_upload(
 ) -> dict[str, Any]:
     job = _require_local_worker_job(job_id, worker_session)
     video_index, video = _find_video_by_id(job, payload.video_id)
-    object_key = str(video.get("r2_object_key") or "")
+    object_key = _as_str(video.get("r2_object_key"))
     if not object_key:
         object_key = build_r2_output_object_key(str(job.get("uid") or ""), job_id, _safe_filename(payload.output_name))
     try:
@@ -3201,45 +4333,91 @@ def _complete_local_render_upload(
     return _persist_job_state(job)
 
 
+@lru_cache(maxsize=1)
+def _renderer_env() -> dict[str, str]:
+    # Snapshot on first render, after startup has pointed TMPDIR at the data disk; shared, so do not mutate it.
+    return {**os.environ, "PYTHONUNBUFFERED": "1"}
+
+
+def _last_console_line(raw: bytes) -> str:
+    lines = raw.split(b"\n")
+    if len(lines) > 1 and not lines[-1]:
+        lines.pop()
+    return lines[-1].decode("utf-8", "replace").strip()
+
+
 def _run_renderer(
     cmd: list[str],
     log_path: Path,
     job_id: str,
     video_index: int,
-    completed_before: int,
-    total_videos: int,
 ) -> tuple[int, str, float]:
-    progress_re = re.compile(r"\[(\s*\d+)%\]")
-    last_line = ""
+    tail = b""
     started = time.perf_counter()
-
-    with log_path.open("a", encoding="utf-8") as log_file:
-        log_file.write(f"\n=== Renderer attempt at {_utc_now()} ===\n")
-        log_file.write(" ".join(cmd) + "\n")
+    pending_progress: int | None = None
+    persisted_progress = -1
+    last_progress_persist = 0.0
+
+    # Pump stdout in whatever chunks the pipe has ready rather than per line: the log gets bytes undecoded and
+    # only chunks carrying a progress marker reach the regex, so many concurrent renderers cost little GIL time.
+    with log_path.open("ab") as log_file:
+        log_file.write(f"\n=== Renderer attempt at {_utc_now()} ===\n".encode("utf-8"))
+        log_file.write((" ".join(cmd) + "\n").encode("utf-8"))
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            env={**os.environ, "PYTHONUNBUFFERED": "1"},
+            bufsize=RENDERER_STDOUT_BUFFER_BYTES,
+            env=_renderer_env(),
         )
 
         assert process.stdout is not None
-        for line in process.stdout:
-            log_file.write(line)
-            last_line = line.strip()
-
-            match = progress_re.search(line)
-            if match:
-                video_progress = int(match.group(1).strip())
-                _set_video(job_id, video_index, progress=video_progress)
-                overall = int(((completed_before + (video_progress / 100.0)) / total_videos) * 100)
-                _set_job(job_id, progress=overall, message=f"Rendering {completed_before + 1}/{total_videos}")
+        carry = b""
+        while chunk := process.stdout.read1(RENDERER_STDOUT_BUFFER_BYTES):
+            chunk = carry + chunk
+            carry = b""
+            if b"\r" in chunk:
+                if chunk.endswith(b"\r"):
+                    # Hold back a trailing CR so a CRLF split across reads isn't doubled.
+                    carry = b"\r"
+                    chunk = chunk[:-1]
+                # Progress bars redraw with carriage returns; split them into lines as text mode used to.
+                chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            log_file.write(chunk)
+            # Rescan the incomplete end of the previous chunk so a progress marker split across reads still matches.
+            overlap = tail[-RENDER_PROGRESS_MARKER_OVERLAP_BYTES:]
+            window = overlap[overlap.rfind(b"]") + 1 :] + chunk
+            tail = (tail + chunk)[-RENDERER_TAIL_BYTES:]
+
+            if b"%]" not in window:
+                continue
+            matches = RENDER_PROGRESS_RE.findall(window)
+            if matches:
+                progress = int(matches[-1])
+                # Renderers repeat the same percentage for many frames; only a changed value is worth a write.
+                if progress == persisted_progress:
+                    pending_progress = None
+                    continue
+                pending_progress = progress
+                # Coalesce progress ticks so a slow state write can't back up the renderer's stdout pipe.
+                now = time.monotonic()
+                persist_due = now - last_progress_persist >= RENDER_PROGRESS_PERSIST_INTERVAL_SECONDS
+                if progress >= 100 or persist_due:
+                    _set_render_progress(job_id, video_index, progress)
+                    last_progress_persist = now
+                    persisted_progress = progress
+                    pending_progress = None
+        if carry:
+            log_file.write(b"\n")
+            tail += b"\n"
 
         return_code = process.wait()
 
-    if last_line:
+    # Fold the trailing progress tick and the final console line into a single state write.
+    last_line = _last_console_line(tail)
+    if pending_progress is not None:
+        _set_render_progress(job_id, video_index, pending_progress, detail=last_line)
+    elif last_line:
         _set_video(job_id, video_index, detail=last_line)
     elapsed_seconds = max(time.perf_counter() - started, 0.0)
     return return_code, last_line, elapsed_seconds
@@ -3249,6 +4427,334 @@ def _normalize_console_line(value: str) -> str:
     return ANSI_ESCAPE_RE.sub("", value).strip()
 
 
+@dataclass(frozen=True, slots=True)
+class _RenderSettings:
+    render_profile: str
+    include_maps: bool
+    overlay_theme: str
+    layout_style: str
+    component_visibility: tuple[tuple[str, Any], ...] | None
+    speed_units: str
+    fps_mode: str
+    fixed_fps: float
+    gpx_offset_seconds: float
+    gpx_speed_unit: str
+
+
+def _resolve_render_settings(settings: dict[str, Any]) -> _RenderSettings:
+    component_visibility = settings.get("component_visibility")
+    return _RenderSettings(
+        render_profile=str(settings.get("render_profile", AUTO_RENDER_PROFILE)),
+        include_maps=bool(settings["include_maps"]),
+        overlay_theme=str(settings["overlay_theme"]),
+        layout_style=str(settings.get("layout_style", DEFAULT_LAYOUT_STYLE)),
+        component_visibility=(
+            tuple(sorted(component_visibility.items()))
+            if isinstance(component_visibility, dict)
+            else None
+        ),
+        speed_units=str(settings.get("speed_units", "kph")),
+        fps_mode=str(settings.get("fps_mode", "source_exact")),
+        fixed_fps=float(settings.get("fixed_fps", 30.0)),
+        gpx_offset_seconds=float(settings["gpx_offset_seconds"]),
+        gpx_speed_unit=str(settings.get("gpx_speed_unit", "auto")),
+    )
+
+
+@lru_cache(maxsize=32)
+def _cached_layout_xml(
+    width: int,
+    height: int,
+    theme_name: str,
+    include_maps: bool,
+    layout_style: str,
+    component_visibility: tuple[tuple[str, Any], ...] | None,
+    speed_units: str,
+) -> str:
+    return render_layout_xml(
+        width,
+        height,
+        theme_name,
+        include_maps=include_maps,
+        layout_style=layout_style,
+        component_visibility=dict(component_visibility) if component_visibility is not None else None,
+        speed_units=speed_units,
+    )
+
+
+def _render_job_video(
+    job: dict[str, Any],
+    render_settings: _RenderSettings,
+    index: int,
+    *,
+    shifted_gpx: Path,
+    inputs_dir: Path,
+    outputs_dir: Path,
+    work_dir: Path,
+    logs_dir: Path,
+) -> str | Future[str | None] | None:
+    # Renders and records one video; returns the failure reason, or a future for its background upload.
+    job_id = str(job["id"])
+    owner_uid = str(job.get("uid") or "")
+    video_state = job["videos"][index]
+    input_name = video_state["input_name"]
+    input_path = inputs_dir / input_name
+
+    _set_video(job_id, index, status="running", progress=1, detail="Probing metadata")
+
+    try:
+        metadata = _probe_video(input_path)
+        _set_file_mtime_from_creation(input_path, metadata.get("creation_time"))
+        selected_profile, profile_candidates = _select_render_profile(metadata, render_settings.render_profile)
+        layout_path = work_dir / f"layout-{index + 1}.xml"
+        maps_enabled_for_attempt = render_settings.include_maps
+        map_fallback_used = False
+        # The settings parts of the layout are fixed per job; only size and maps vary between attempts.
+        written_layout_key: tuple[int, int, bool] | None = None
+
+        output_name = f"{Path(input_name).stem}-overlay.mp4"
+        output_path = outputs_dir / output_name
+        log_path = logs_dir / f"{Path(input_name).stem}.log"
+
+        return_code = 1
+        attempted_profile = selected_profile
+        last_error: str | None = None
+        render_elapsed_seconds = 0.0
+
+        for profile_idx, profile_id in enumerate(profile_candidates):
+            is_last_candidate = profile_idx == len(profile_candidates) - 1
+            if not is_last_candidate and not _render_profile_encodes(
+                profile_id, int(metadata["width"]), int(metadata["height"])
+            ):
+                last_error = f"Render profile {profile_id} failed a short encode test; trying the next profile"
+                continue
+            attempted_profile = profile_id
+            overlay_width, overlay_height = _overlay_dimensions_for_profile(metadata, profile_id)
+            overlay_size: tuple[int, int] | None = None
+            if overlay_width != int(metadata["width"]) or overlay_height != int(metadata["height"]):
+                overlay_size = (overlay_width, overlay_height)
+
+            layout_key = (overlay_width, overlay_height, maps_enabled_for_attempt)
+            if layout_key != written_layout_key:
+                layout_path.write_text(
+                    _cached_layout_xml(
+                        overlay_width,
+                        overlay_height,
+                        render_settings.overlay_theme,
+                        maps_enabled_for_attempt,
+                        render_settings.layout_style,
+                        render_settings.component_visibility,
+                        render_settings.speed_units,
+                    ),
+                    encoding="utf-8",
+                )
+                written_layout_key = layout_key
+
+            _set_video(
+                job_id,
+                index,
+                detail=(
+                    f"Rendering with {profile_id} ({profile_idx + 1}/{len(profile_candidates)}) "
+                    f"at {overlay_width}x{overlay_height}"
+                ),
+                render_profile=profile_id,
+                render_profile_label=_render_profile_label(profile_id),
+            )
+            command = _build_renderer_command(
+                gpx_path=shifted_gpx,
+                video_path=input_path,
+                output_path=output_path,
+                layout_path=layout_path,
+                settings=job["settings"],
+                render_profile=profile_id,
+                overlay_size=overlay_size,
+            )
+            return_code, last_line, elapsed_seconds = _run_renderer(
+                command,
+                log_path,
+                job_id,
+                index,
+            )
+            render_elapsed_seconds += elapsed_seconds
+            normalized_last_line = _normalize_console_line(last_line).lower()
+            if (
+                return_code != 0
+                and maps_enabled_for_attempt
+                and not map_fallback_used
+                and "images do not match" in normalized_last_line
+            ):
+                map_fallback_used = True
+                maps_enabled_for_attempt = False
+                _set_video(job_id, index, detail="Map rendering failed; retrying without route maps.")
+                layout_path.write_text(
+                    _cached_layout_xml(
+                        overlay_width,
+                        overlay_height,
+                        render_settings.overlay_theme,
+                        False,
+                        render_settings.layout_style,
+                        render_settings.component_visibility,
+                        render_settings.speed_units,
+                    ),
+                    encoding="utf-8",
+                )
+                written_layout_key = (overlay_width, overlay_height, False)
+                return_code, last_line, elapsed_seconds = _run_renderer(
+                    command,
+                    log_path,
+                    job_id,
+                    index,
+                )
+                render_elapsed_seconds += elapsed_seconds
+                normalized_last_line = _normalize_console_line(last_line).lower()
+
+            if return_code == 0:
+                selected_profile = attempted_profile
+                break
+            if normalized_last_line and ("error" in normalized_last_line or "exception" in normalized_last_line):
+                last_error = normalized_last_line
+            else:
+                last_error = f"Renderer exited with code {return_code} using profile {profile_id}"
+            # Retry other profiles only for likely codec/encode issues.
+            if "don't overlap in time" in normalized_last_line:
+                break
+
+        elapsed_rounded = round(render_elapsed_seconds, 3)
+        source_duration = float(metadata.get("duration") or 0.0)
+        wall_x_realtime = round(render_elapsed_seconds / source_duration, 5) if source_duration > 0 else None
+        source_resolution = f"{metadata['width']}x{metadata['height']}"
+        sample_base = {
+            "recorded_at": _utc_now(),
+            "job_id": job_id,
+            "video_id": video_state.get("id"),
+            "input_name": input_name,
+            "platform": sys.platform,
+            "requested_render_profile": render_settings.render_profile,
+            "maps_enabled": maps_enabled_for_attempt,
+            "fps_mode": render_settings.fps_mode,
+            "fixed_fps": render_settings.fixed_fps,
+            "source_width": metadata.get("width"),
+            "source_height": metadata.get("height"),
+            "source_duration_seconds": metadata.get("duration"),
+            "source_codec": metadata.get("codec"),
+            "source_fps": metadata.get("fps"),
+            "source_fps_raw": metadata.get("fps_raw"),
+            "render_elapsed_seconds": elapsed_rounded,
+            "wall_x_realtime": wall_x_realtime,
+        }
+
+        if return_code != 0:
+            failure_reason = last_error or f"Renderer exited with code {return_code}"
+            _set_video(
+                job_id,
+                index,
+                status="failed",
+                progress=0,
+                error=failure_reason,
+                log_name=log_path.name,
+                source_resolution=source_resolution,
+                source_fps=metadata.get("fps_raw"),
+                source_duration_seconds=metadata.get("duration"),
+                render_elapsed_seconds=elapsed_rounded,
+                wall_x_realtime=wall_x_realtime,
+                render_profile_label=_render_profile_label(attempted_profile),
+            )
+            _submit_render_sample(
+                {**sample_base, "success": False, "error": failure_reason, "render_profile": attempted_profile}
+            )
+            return failure_reason
+
+        output_metadata = None if PROBE_RENDER_OUTPUTS else _derived_output_metadata(metadata, selected_profile)
+        if output_metadata is None:
+            try:
+                output_metadata = _probe_video(output_path)
+            except Exception:  # noqa: BLE001
+                output_metadata = None
+        output = output_metadata or {}
+
+        completed_fields = {
+            "output_name": output_name,
+            "log_name": log_path.name,
+            "render_profile": selected_profile,
+            "render_profile_label": _render_profile_label(selected_profile),
+            "source_resolution": source_resolution,
+            "source_fps": metadata.get("fps_raw"),
+            "source_duration_seconds": metadata.get("duration"),
+            "output_resolution": f"{output['width']}x{output['height']}" if output_metadata else None,
+            "output_fps": output.get("fps_raw"),
+            "output_duration_seconds": output.get("duration"),
+            "output_codec": output.get("codec"),
+            "render_elapsed_seconds": elapsed_rounded,
+            "wall_x_realtime": wall_x_realtime,
+        }
+        _set_video(job_id, index, detail="Uploading output")
+        render_sample = {
+            **sample_base,
+            "success": True,
+            "render_profile": selected_profile,
+            "output_width": output.get("width"),
+            "output_height": output.get("height"),
+            "output_duration_seconds": output.get("duration"),
+            "output_codec": output.get("codec"),
+            "output_fps": output.get("fps"),
+            "output_fps_raw": output.get("fps_raw"),
+        }
+    except Exception as exc:  # noqa: BLE001
+        _set_video(
+            job_id,
+            index,
+            status="failed",
+            progress=0,
+            error=str(exc),
+            detail="Render/upload failed",
+        )
+        return str(exc)
+    return _OUTPUT_UPLOAD_EXECUTOR.submit(
+        _upload_job_video_output,
+        job_id,
+        index,
+        uid=owner_uid,
+        output_name=output_name,
+        output_path=output_path,
+        completed_fields=completed_fields,
+        render_sample=render_sample,
+    )
+
+
+def _upload_job_video_output(
+    job_id: str,
+    index: int,
+    *,
+    uid: str,
+    output_name: str,
+    output_path: Path,
+    completed_fields: dict[str, Any],
+    render_sample: dict[str, Any],
+) -> str | None:
+    # The sample is recorded only once the upload settles, so a lost output never counts as a successful render.
+    try:
+        upload_metadata = _upload_output_to_r2(
+            uid=uid,
+            job_id=job_id,
+            output_name=output_name,
+            output_path=output_path,
+        )
+    except Exception as exc:  # noqa: BLE001
+        _set_video(
+            job_id,
+            index,
+            status="failed",
+            progress=0,
+            error=str(exc),
+            detail="Render/upload failed",
+        )
+        _submit_render_sample({**render_sample, "success": False, "error": f"Upload failed: {exc}"})
+        return str(exc)
+    _set_video(job_id, index, status="completed", progress=100, error=None, **completed_fields, **upload_metadata)
+    _submit_render_sample(render_sample)
+    return None
+
+
 def _process_job(job_id: str) -> None:
     job = _get_job(job_id)
     if job.get("status") in TERMINAL_JOB_STATUSES:
@@ -3266,6 +4772,7 @@ def _process_job(job_id: str) -> None:
 
     _set_job(job_id, status="running", started_at=_utc_now(), progress=1, message="Preparing GPX data")
 
+    render_settings = _resolve_render_settings(job["settings"])
     source_gpx = inputs_dir / job["gpx_name"]
     shifted_gpx = work_dir / "track-shifted.gpx"
     if source_gpx.exists():
@@ -3273,8 +4780,8 @@ def _process_job(job_id: str) -> None:
             shift_gpx_timestamps(
                 source_gpx,
                 shifted_gpx,
-                float(job["settings"]["gpx_offset_seconds"]),
-                speed_unit=str(job["settings"].get("gpx_speed_unit", "auto")),
+                render_settings.gpx_offset_seconds,
+                speed_unit=render_settings.gpx_speed_unit,
             )
         except Exception as exc:  # noqa: BLE001
             _set_job(
@@ -3298,278 +4805,43 @@ def _process_job(job_id: str) -> None:
     total_videos = len(job["videos"])
     resumable_completed = 0
     pending_video_indexes: list[int] = []
+    local_outputs = _directory_entry_names(outputs_dir)
     for index, video in enumerate(job["videos"]):
         status = str(video.get("status") or "")
         output_name = str(video.get("output_name") or "")
-        has_output = bool(video.get("r2_object_key") or (output_name and (outputs_dir / output_name).exists()))
+        has_output = bool(video.get("r2_object_key") or (output_name and output_name in local_outputs))
         if status == "completed" and has_output:
             resumable_completed += 1
             continue
         pending_video_indexes.append(index)
 
-    failed_count = 0
-    owner_uid = str(job.get("uid") or "")
-    first_failure_reason: str | None = None
-
     if total_videos > 0 and resumable_completed > 0:
         baseline = int((resumable_completed / total_videos) * 100)
         _set_job(job_id, progress=max(1, baseline), message=f"Resuming ({resumable_completed}/{total_videos} completed)")
 
-    for pending_position, index in enumerate(pending_video_indexes):
-        video_state = job["videos"][index]
-        input_name = video_state["input_name"]
-        input_path = inputs_dir / input_name
-
-        _set_video(job_id, index, status="running", progress=1, detail="Probing metadata")
-
-        try:
-            metadata = _probe_video(input_path)
-            _set_file_mtime_from_creation(input_path, metadata.get("creation_time"))
-            selected_profile, profile_candidates = _select_render_profile(metadata, job["settings"]["render_profile"])
-            layout_path = work_dir / f"layout-{index + 1}.xml"
-            maps_enabled_for_attempt = bool(job["settings"]["include_maps"])
-            map_fallback_used = False
-
-            output_name = f"{Path(input_name).stem}-overlay.mp4"
-            output_path = outputs_dir / output_name
-            log_path = logs_dir / f"{Path(input_name).stem}.log"
-
-            return_code = 1
-            attempted_profile = selected_profile
-            last_error: str | None = None
-            render_elapsed_seconds = 0.0
-
-            for profile_idx, profile_id in enumerate(profile_candidates):
-                attempted_profile = profile_id
-                overlay_width, overlay_height = _overlay_dimensions_for_profile(metadata, profile_id)
-                overlay_size: tuple[int, int] | None = None
-                if overlay_width != int(metadata["width"]) or overlay_height != int(metadata["height"]):
-                    overlay_size = (overlay_width, overlay_height)
-
-                layout_xml = render_layout_xml(
-                    overlay_width,
-                    overlay_height,
-                    job["settings"]["overlay_theme"],
-                    include_maps=maps_enabled_for_attempt,
-                    layout_style=str(job["settings"].get("layout_style", DEFAULT_LAYOUT_STYLE)),
-                    component_visibility=job["settings"].get("component_visibility"),
-                    speed_units=str(job["settings"].get("speed_units", "kph")),
-                )
-                layout_path.write_text(layout_xml, encoding="utf-8")
-
-                _set_video(
-                    job_id,
-                    index,
-                    detail=(
-                        f"Rendering with {profile_id} ({profile_idx + 1}/{len(profile_candidates)}) "
-                        f"at {overlay_width}x{overlay_height}"
-                    ),
-                    render_profile=profile_id,
-                    render_profile_label=_render_profile_label(profile_id),
-                )
-                command = _build_renderer_command(
-                    gpx_path=shifted_gpx,
-                    video_path=input_path,
-                    output_path=output_path,
-                    layout_path=layout_path,
-                    settings=job["settings"],
-                    render_profile=profile_id,
-                    overlay_size=overlay_size,
-                )
-                return_code, last_line, elapsed_seconds = _run_renderer(
-                    command,
-                    log_path,
-                    job_id,
-                    index,
-                    resumable_completed + pending_position,
-                    total_videos,
-                )
-                render_elapsed_seconds += elapsed_seconds
-                normalized_last_line = _normalize_console_line(last_line).lower()
-                if (
-                    return_code != 0
-                    and maps_enabled_for_attempt
-                    and not map_fallback_used
-                    and "images do not match" in normalized_last_line
-                ):
-                    map_fallback_used = True
-                    maps_enabled_for_attempt = False
-                    _set_video(job_id, index, detail="Map rendering failed; retrying without route maps.")
-                    fallback_layout = render_layout_xml(
-                        overlay_width,
-                        overlay_height,
-                        job["settings"]["overlay_theme"],
-                        include_maps=False,
-                        layout_style=str(job["settings"].get("layout_style", DEFAULT_LAYOUT_STYLE)),
-                        component_visibility=job["settings"].get("component_visibility"),
-                        speed_units=str(job["settings"].get("speed_units", "kph")),
-                    )
-                    layout_path.write_text(fallback_layout, encoding="utf-8")
-                    return_code, last_line, elapsed_seconds = _run_renderer(
-                        command,
-                        log_path,
-                        job_id,
-                        index,
-                        resumable_completed + pending_position,
-                        total_videos,
-                    )
-                    render_elapsed_seconds += elapsed_seconds
-                    normalized_last_line = _normalize_console_line(last_line).lower()
-
-                if return_code == 0:
-                    selected_profile = attempted_profile
-                    break
-                if normalized_last_line and ("error" in normalized_last_line or "exception" in normalized_last_line):
-                    last_error = normalized_last_line
-                else:
-                    last_error = f"Renderer exited with code {return_code} using profile {profile_id}"
-                # Retry other profiles only for likely codec/encode issues.
-                if "don't overlap in time" in normalized_last_line:
-                    break
-
-            if return_code != 0:
-                failed_count += 1
-                if first_failure_reason is None:
-                    first_failure_reason = last_error or f"Renderer exited with code {return_code}"
-                _set_video(
-                    job_id,
-                    index,
-                    status="failed",
-                    progress=0,
-                    error=last_error or f"Renderer exited with code {return_code}",
-                    log_name=log_path.name,
-                    source_resolution=f"{metadata['width']}x{metadata['height']}",
-                    source_fps=metadata.get("fps_raw"),
-                    source_duration_seconds=metadata.get("duration"),
-                    render_elapsed_seconds=round(render_elapsed_seconds, 3),
-                    wall_x_realtime=(
-                        round(render_elapsed_seconds / float(metadata["duration"]), 5)
-                        if metadata.get("duration") and float(metadata["duration"]) > 0
-                        else None
-                    ),
-                    render_profile_label=_render_profile_label(attempted_profile),
-                )
-                try:
-                    _record_render_sample(
-                        {
-                            "recorded_at": _utc_now(),
-                            "job_id": job_id,
-                            "video_id": video_state.get("id"),
-                            "input_name": input_name,
-                            "platform": sys.platform,
-                            "success": False,
-                            "error": last_error or f"Renderer exited with code {return_code}",
-                            "render_profile": attempted_profile,
-                            "requested_render_profile": str(job["settings"].get("render_profile", AUTO_RENDER_PROFILE)),
-                            "maps_enabled": maps_enabled_for_attempt,
-                            "fps_mode": str(job["settings"].get("fps_mode", "source_exact")),
-                            "fixed_fps": float(job["settings"].get("fixed_fps", 30.0)),
-                            "source_width": metadata.get("width"),
-                            "source_height": metadata.get("height"),
-                            "source_duration_seconds": metadata.get("duration"),
-                            "source_codec": metadata.get("codec"),
-                            "source_fps": metadata.get("fps"),
-                            "source_fps_raw": metadata.get("fps_raw"),
-                            "render_elapsed_seconds": round(render_elapsed_seconds, 3),
-                            "wall_x_realtime": (
-                                round(render_elapsed_seconds / float(metadata["duration"]), 5)
-                                if metadata.get("duration") and float(metadata["duration"]) > 0
-                                else None
-                            ),
-                        }
-                    )
-                except Exception:  # noqa: BLE001
-                    LOGGER.exception("Failed to persist failed render sample for job=%s video=%s", job_id, input_name)
-                continue
+    render_video = partial(
+        _render_job_video,
+        job,
+        render_settings,
+        shifted_gpx=shifted_gpx,
+        inputs_dir=inputs_dir,
+        outputs_dir=outputs_dir,
+        work_dir=work_dir,
+        logs_dir=logs_dir,
+    )
+    # Each video is an independent renderer subprocess; threads only wait on them.
+    render_workers = min(RENDER_VIDEO_CONCURRENCY, len(pending_video_indexes))
+    if render_workers > 1:
+        with ThreadPoolExecutor(max_workers=render_workers, thread_name_prefix="render-video") as executor:
+            failures = list(executor.map(render_video, pending_video_indexes))
+    else:
+        failures = [render_video(index) for index in pending_video_indexes]
+    # Uploads overlap later renders; wait for all of them before settling the job status.
+    failures = [item.result() if isinstance(item, Future) else item for item in failures]
 
-            upload_metadata = _upload_output_to_r2(
-                uid=owner_uid,
-                job_id=job_id,
-                output_name=output_name,
-                output_path=output_path,
-            )
-
-            output_metadata: dict[str, Any] | None = None
-            try:
-                output_metadata = _probe_video(output_path)
-            except Exception:  # noqa: BLE001
-                output_metadata = None
-
-            _set_video(
-                job_id,
-                index,
-                status="completed",
-                progress=100,
-                output_name=output_name,
-                log_name=log_path.name,
-                render_profile=selected_profile,
-                render_profile_label=_render_profile_label(selected_profile),
-                source_resolution=f"{metadata['width']}x{metadata['height']}",
-                source_fps=metadata.get("fps_raw"),
-                source_duration_seconds=metadata.get("duration"),
-                output_resolution=(
-                    f"{output_metadata['width']}x{output_metadata['height']}" if output_metadata else None
-                ),
-                output_fps=output_metadata.get("fps_raw") if output_metadata else None,
-                output_duration_seconds=output_metadata.get("duration") if output_metadata else None,
-                output_codec=output_metadata.get("codec") if output_metadata else None,
-                render_elapsed_seconds=round(render_elapsed_seconds, 3),
-                wall_x_realtime=(
-                    round(render_elapsed_seconds / float(metadata["duration"]), 5)
-                    if metadata.get("duration") and float(metadata["duration"]) > 0
-                    else None
-                ),
-                error=None,
-                **upload_metadata,
-            )
-            try:
-                _record_render_sample(
-                    {
-                        "recorded_at": _utc_now(),
-                        "job_id": job_id,
-                        "video_id": video_state.get("id"),
-                        "input_name": input_name,
-                        "platform": sys.platform,
-                        "success": True,
-                        "render_profile": selected_profile,
-                        "requested_render_profile": str(job["settings"].get("render_profile", AUTO_RENDER_PROFILE)),
-                        "maps_enabled": maps_enabled_for_attempt,
-                        "fps_mode": str(job["settings"].get("fps_mode", "source_exact")),
-                        "fixed_fps": float(job["settings"].get("fixed_fps", 30.0)),
-                        "source_width": metadata.get("width"),
-                        "source_height": metadata.get("height"),
-                        "source_duration_seconds": metadata.get("duration"),
-                        "source_codec": metadata.get("codec"),
-                        "source_fps": metadata.get("fps"),
-                        "source_fps_raw": metadata.get("fps_raw"),
-                        "output_width": output_metadata.get("width") if output_metadata else None,
-                        "output_height": output_metadata.get("height") if output_metadata else None,
-                        "output_duration_seconds": output_metadata.get("duration") if output_metadata else None,
-                        "output_codec": output_metadata.get("codec") if output_metadata else None,
-                        "output_fps": output_metadata.get("fps") if output_metadata else None,
-                        "output_fps_raw": output_metadata.get("fps_raw") if output_metadata else None,
-                        "render_elapsed_seconds": round(render_elapsed_seconds, 3),
-                        "wall_x_realtime": (
-                            round(render_elapsed_seconds / float(metadata["duration"]), 5)
-                            if metadata.get("duration") and float(metadata["duration"]) > 0
-                            else None
-                        ),
-                    }
-                )
-            except Exception:  # noqa: BLE001
-                LOGGER.exception("Failed to persist completed render sample for job=%s video=%s", job_id, input_name)
-        except Exception as exc:  # noqa: BLE001
-            failed_count += 1
-            if first_failure_reason is None:
-                first_failure_reason = str(exc)
-            _set_video(
-                job_id,
-                index,
-                status="failed",
-                progress=0,
-                error=str(exc),
-                detail="Render/upload failed",
-            )
+    failure_reasons = [reason for reason in failures if reason is not None]
+    failed_count = len(failure_reasons)
+    first_failure_reason = failure_reasons[0] if failure_reasons else None
 
     if failed_count == 0:
         _set_job(job_id, status="completed", progress=100, finished_at=_utc_now(), message="All videos rendered")
@@ -3603,8 +4875,9 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
-@app.get("/api/meta")
-def meta() -> dict[str, Any]:
+@lru_cache(maxsize=1)
+def _static_meta() -> dict[str, Any]:
+    # Everything here is fixed at import time; build it once instead of per request.
     return {
         "themes": sorted(THEMES.keys()),
         "theme_options": _theme_meta(),
@@ -3622,6 +4895,13 @@ def meta() -> dict[str, Any]:
         "render_profiles": _render_profile_meta(),
         "render_profile_ids": AVAILABLE_RENDER_PROFILE_IDS,
         "default_render_profile": AUTO_RENDER_PROFILE,
+    }
+
+
+@app.get("/api/meta")
+def meta() -> dict[str, Any]:
+    return {
+        **_static_meta(),
         "render_eta_calibration": _get_render_eta_calibration(),
         "local_render_enabled": LOCAL_RENDER_ENABLED,
     }
@@ -3924,6 +5204,7 @@ async def create_job(
         "message": "Queued",
         "gpx_name": gpx_name,
         "videos": video_states,
+        "video_identity_version": VIDEO_IDENTITY_VERSION,
         "settings": {
             "speed_units": speed_units,
             "gpx_speed_unit": gpx_speed_unit,
@@ -3957,28 +5238,24 @@ async def create_job(
 @app.get("/api/jobs/{job_id}")
 def job_status(job_id: str, uid: str = Depends(_require_user_uid)) -> dict[str, Any]:
     job = _get_job(job_id, requester_uid=uid)
-    outputs_dir = Path(str(job.get("job_dir") or "")) / "outputs"
+    outputs_dir = Path(_as_str(job.get("job_dir"))) / "outputs"
+    download_prefix = f"/api/jobs/{job_id}/download/"
     has_downloads = False
+    # One (briefly cached) directory read answers every local-output check instead of a stat per video.
+    local_outputs: frozenset[str] | None = None
 
     for video in job["videos"]:
-        output_name = str(video.get("output_name") or "")
-        if not output_name:
-            video["download_url"] = None
-            continue
-
-        if video.get("r2_object_key"):
-            video["download_url"] = f"/api/jobs/{job_id}/download/{output_name}"
-            has_downloads = True
-            continue
-
-        if (outputs_dir / output_name).exists():
-            video["download_url"] = f"/api/jobs/{job_id}/download/{output_name}"
-            has_downloads = True
-        else:
-            video["download_url"] = None
+        output_name = _as_str(video.get("output_name"))
+        downloadable = bool(output_name and video.get("r2_object_key"))
+        if output_name and not downloadable:
+            if local_outputs is None:
+                local_outputs = _cached_output_names(outputs_dir)
+            downloadable = output_name in local_outputs
+        video["download_url"] = download_prefix + output_name if downloadable else None
+        has_downloads = has_downloads or downloadable
 
     job["download_all_url"] = f"/api/jobs/{job_id}/download-all" if has_downloads else None
-    return job
+    return _without_internal_job_fields(job)
 
 
 @app.get("/api/media")
@@ -3987,38 +5264,77 @@ def list_media(
     page_size: int = Query(default=20, ge=1, le=MEDIA_LIST_MAX_PAGE_SIZE),
     sort_by: str = Query(default="created_at"),
     sort_order: str = Query(default="desc"),
+    cursor: str | None = Query(default=None),
     uid: str = Depends(_require_user_uid),
-) -> dict[str, Any]:
+) -> JSONResponse:
     _require_durable_pipeline_enabled()
 
     if sort_by not in MEDIA_SORT_FIELDS:
         raise HTTPException(status_code=400, detail=f"Unsupported sort_by value: {sort_by}")
     if sort_order not in MEDIA_SORT_ORDERS:
         raise HTTPException(status_code=400, detail=f"Unsupported sort_order value: {sort_order}")
+    after = _decode_media_cursor(cursor, sort_by, sort_order) if cursor is not None else None
+
+    jobs = _list_jobs_for_uid(uid)
+    # Legacy jobs missing video ids/titles are backfilled in place and written back together.
+    backfilled = [job for job in jobs if _backfill_video_identity_metadata(job)]
+    if backfilled:
+        persisted = {str(job["id"]): job for job in _persist_job_states(backfilled)}
+        jobs = [persisted.get(str(job["id"]), job) for job in jobs]
 
     items: list[dict[str, Any]] = []
-    for job in _list_jobs_for_uid(uid):
-        normalized_job = _ensure_video_identity_metadata(job)
-        for video in normalized_job.get("videos", []):
+    for job in jobs:
+        job_fields = _media_job_fields(job)
+        for video in job.get("videos", []):
             if isinstance(video, dict):
-                items.append(_build_media_item(normalized_job, video))
+                items.append(_build_media_item(job, video, job_fields))
 
-    items.sort(key=lambda item: _media_sort_value(item, sort_by), reverse=sort_order == "desc")
+    sort_key = _media_sort_key(sort_by)
+    select = heapq.nlargest if sort_order == "desc" else heapq.nsmallest
+    if after is not None:
+        # Cursor pages select only past the last key the client saw and skip counting the whole library.
+        try:
+            if sort_order == "desc":
+                remaining = [item for item in items if sort_key(item) < after]
+            else:
+                remaining = [item for item in items if sort_key(item) > after]
+        except TypeError as exc:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+        paged_items = select(page_size + 1, remaining, key=sort_key)
+        has_more = len(paged_items) > page_size
+        paged_items = paged_items[:page_size]
+        return JSONResponse({
+            "items": paged_items,
+            "page_size": page_size,
+            "next_cursor": _encode_media_cursor(sort_by, sort_order, sort_key(paged_items[-1])) if has_more else None,
+            "sort_by": sort_by,
+            "sort_order": sort_order,
+        })
 
     total = len(items)
     total_pages = max(1, (total + page_size - 1) // page_size)
     start_index = (page - 1) * page_size
-    paged_items = items[start_index:start_index + page_size]
+    end_index = start_index + page_size
+    if end_index * MEDIA_PARTIAL_SORT_FACTOR <= total:
+        # Early pages of a large library only need the leading items; heapq matches a stable sort's order.
+        paged_items = select(end_index, items, key=sort_key)[start_index:]
+    else:
+        items.sort(key=sort_key, reverse=sort_order == "desc")
+        paged_items = items[start_index:end_index]
 
-    return {
+    # Items are plain JSON-ready dicts built above; returning a response skips FastAPI's jsonable_encoder walk.
+    return JSONResponse({
         "items": paged_items,
         "page": page,
         "page_size": page_size,
         "total": total,
         "total_pages": total_pages,
+        "next_cursor": (
+            _encode_media_cursor(sort_by, sort_order, sort_key(paged_items[-1])) if paged_items and end_index < total else None
+        ),
         "sort_by": sort_by,
         "sort_order": sort_order,
-    }
+    })
 
 
 @app.patch("/api/media/{job_id}/{video_id}")
@@ -4040,13 +5356,13 @@ def rename_media(
     job = _ensure_video_identity_metadata(job)
     video_index, video = _find_video_by_id(job, video_id)
     job["videos"][video_index]["title"] = next_title
-    updated = _persist_job_state(job)
-    _, persisted_video = _find_video_by_id(updated, video_id)
+    _persist_job_state(job)
 
+    # The persisted payload is a copy of this job, so the located video already holds what was written.
     return {
-        "id": str(persisted_video.get("id") or ""),
+        "id": _as_str(video.get("id")),
         "job_id": job_id,
-        "title": str(persisted_video.get("title") or next_title),
+        "title": next_title,
     }
 
 
@@ -4062,20 +5378,20 @@ def delete_media(
     job = _ensure_video_identity_metadata(job)
     video_index, video = _find_video_by_id(job, video_id)
 
-    video_status = str(video.get("status") or "")
+    video_status = _as_str(video.get("status"))
     if video_status in {"queued", "running"}:
         raise HTTPException(status_code=409, detail="Media is still rendering and cannot be deleted")
 
-    object_key = str(video.get("r2_object_key") or "")
+    object_key = _as_str(video.get("r2_object_key"))
     if object_key:
         try:
             _delete_r2_object(object_key)
         except Exception as exc:  # noqa: BLE001
             raise HTTPException(status_code=500, detail=f"Failed to delete media object: {exc}") from exc
 
-    job_dir = Path(str(job.get("job_dir") or ""))
-    output_name = str(video.get("output_name") or "")
-    log_name = str(video.get("log_name") or "")
+    job_dir = Path(_as_str(job.get("job_dir")))
+    output_name = _as_str(video.get("output_name"))
+    log_name = _as_str(video.get("log_name"))
     if output_name:
         _safe_unlink(job_dir / "outputs" / output_name)
     if log_name:
@@ -4086,6 +5402,62 @@ def delete_media(
     return {"deleted": True, "job_id": job_id, "id": video_id}
 
 
+@app.post("/api/media/bulk-delete")
+def bulk_delete_media(
+    payload: MediaBulkDeleteRequest,
+    uid: str = Depends(_require_user_uid),
+) -> dict[str, Any]:
+    _require_durable_pipeline_enabled()
+
+    requested: dict[str, set[str]] = defaultdict(set)
+    for item in payload.items:
+        requested[item.job_id].add(item.video_id)
+    if not requested:
+        raise HTTPException(status_code=400, detail="items is required")
+    if len(payload.items) > MEDIA_BULK_DELETE_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {MEDIA_BULK_DELETE_MAX_ITEMS} items can be deleted at once")
+
+    # Validate every item before touching storage so a bad id never leaves a half-applied delete.
+    states = _load_job_states(list(requested))
+    jobs: list[dict[str, Any]] = []
+    object_keys: list[str] = []
+    local_paths: list[Path] = []
+    deleted: list[dict[str, str]] = []
+    for job_id, video_ids in requested.items():
+        job = states.get(job_id)
+        if job is None or job.get("uid") != uid:
+            raise HTTPException(status_code=404, detail="Job not found")
+        _backfill_video_identity_metadata(job)
+        indexes = {video_id: _find_video_by_id(job, video_id)[0] for video_id in video_ids}
+        job_dir = Path(_as_str(job.get("job_dir")))
+        for video_id, video_index in indexes.items():
+            video = job["videos"][video_index]
+            if _as_str(video.get("status")) in {"queued", "running"}:
+                raise HTTPException(status_code=409, detail="Media is still rendering and cannot be deleted")
+            if object_key := _as_str(video.get("r2_object_key")):
+                object_keys.append(object_key)
+            if output_name := _as_str(video.get("output_name")):
+                local_paths.append(job_dir / "outputs" / output_name)
+            if log_name := _as_str(video.get("log_name")):
+                local_paths.append(job_dir / "logs" / log_name)
+            deleted.append({"job_id": job_id, "id": video_id})
+        removed = set(indexes.values())
+        job["videos"] = [video for index, video in enumerate(job["videos"]) if index not in removed]
+        jobs.append(job)
+
+    if object_keys:
+        try:
+            _delete_r2_objects(object_keys)
+        except Exception as exc:  # noqa: BLE001
+            raise HTTPException(status_code=500, detail=f"Failed to delete media objects: {exc}") from exc
+
+    for path in local_paths:
+        _safe_unlink(path)
+
+    _persist_job_states(jobs)
+    return {"deleted": deleted}
+
+
 @app.post("/api/media/{job_id}/{video_id}/download-link")
 def issue_media_download_link(
     job_id: str,
@@ -4098,9 +5470,9 @@ def issue_media_download_link(
     job = _ensure_video_identity_metadata(job)
     _, video = _find_video_by_id(job, video_id)
 
-    output_name = str(video.get("output_name") or "")
-    object_key = str(video.get("r2_object_key") or "")
-    if not output_name or not object_key or str(video.get("status") or "") != "completed":
+    output_name = _as_str(video.get("output_name"))
+    object_key = _as_str(video.get("r2_object_key"))
+    if not output_name or not object_key or _as_str(video.get("status")) != "completed":
         raise HTTPException(status_code=404, detail="Media file not available")
 
     try:
@@ -4122,7 +5494,7 @@ def download_output(job_id: str, filename: str, uid: str = Depends(_require_user
     if video is None:
         raise HTTPException(status_code=404, detail="Output file not found")
 
-    object_key = str(video.get("r2_object_key") or "")
+    object_key = _as_str(video.get("r2_object_key"))
     if object_key:
         try:
             signed_url = _signed_r2_download_url(object_key, filename)
@@ -4130,36 +5502,35 @@ def download_output(job_id: str, filename: str, uid: str = Depends(_require_user
             raise HTTPException(status_code=500, detail=f"Failed to sign download URL: {exc}") from exc
         return RedirectResponse(url=signed_url, status_code=307)
 
-    outputs_dir = (Path(str(job.get("job_dir") or "")) / "outputs").resolve()
-    target = (outputs_dir / filename).resolve()
-    if outputs_dir not in target.parents or not target.exists():
+    outputs_dir = _resolved_job_subdir(_as_str(job.get("job_dir")), "outputs")
+    target = _resolve_job_file(outputs_dir, filename)
+    if target is None:
         raise HTTPException(status_code=404, detail="Output file not found")
-    return FileResponse(target, filename=target.name, media_type="video/mp4")
+    return _accel_redirect_response(target, "video/mp4") or FileResponse(target, filename=target.name, media_type="video/mp4")
 
 
 @app.get("/api/jobs/{job_id}/log/{filename}")
 def download_log(job_id: str, filename: str, uid: str = Depends(_require_user_uid)) -> FileResponse:
     job = _get_job(job_id, requester_uid=uid)
-    logs_dir = (Path(str(job.get("job_dir") or "")) / "logs").resolve()
-    target = (logs_dir / filename).resolve()
-
-    if logs_dir not in target.parents or not target.exists():
+    logs_dir = _resolved_job_subdir(_as_str(job.get("job_dir")), "logs")
+    target = _resolve_job_file(logs_dir, filename)
+    if target is None:
         raise HTTPException(status_code=404, detail="Log file not found")
 
     return FileResponse(target, filename=target.name, media_type="text/plain")
 
 
 @app.get("/api/jobs/{job_id}/download-all")
-def download_all(job_id: str, uid: str = Depends(_require_user_uid)) -> FileResponse:
+def download_all(job_id: str, uid: str = Depends(_require_user_uid)) -> StreamingResponse:
     job = _get_job(job_id, requester_uid=uid)
 
     r2_outputs: list[tuple[str, str]] = []
     local_outputs: list[str] = []
     for video in job.get("videos", []):
-        output_name = str(video.get("output_name") or "")
+        output_name = _as_str(video.get("output_name"))
         if not output_name:
             continue
-        object_key = str(video.get("r2_object_key") or "")
+        object_key = _as_str(video.get("r2_object_key"))
         if object_key:
             r2_outputs.append((output_name, object_key))
         else:
@@ -4168,23 +5539,14 @@ def download_all(job_id: str, uid: str = Depends(_require_user_uid)) -> FileResp
     if not r2_outputs and not local_outputs:
         raise HTTPException(status_code=404, detail="No outputs available")
 
-    temp_dir = DATA_DIR / "tmp"
-    temp_dir.mkdir(parents=True, exist_ok=True)
-    zip_path = temp_dir / f"outputs-{job_id}-{uuid4().hex}.zip"
-
     if r2_outputs:
-        _build_zip_from_r2(r2_outputs, zip_path)
+        sources = _r2_zip_sources(r2_outputs)
     else:
-        outputs_dir = Path(str(job.get("job_dir") or "")) / "outputs"
-        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-            for file_name in local_outputs:
-                source = outputs_dir / file_name
-                if source.exists():
-                    archive.write(source, arcname=source.name)
-
-    return FileResponse(
-        zip_path,
-        filename=f"overlay-renders-{job_id}.zip",
+        sources = _local_zip_sources(Path(_as_str(job.get("job_dir"))) / "outputs", local_outputs)
+
+    # The archive is produced while it is sent, so nothing is staged on disk and the first bytes go out immediately.
+    return StreamingResponse(
+        _iter_zip_stream(sources),
         media_type="application/zip",
-        background=BackgroundTask(_safe_unlink, zip_path),
+        headers={"Content-Disposition": f'attachment; filename="overlay-renders-{job_id}.zip"'},
     )
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from fractions import Fraction
+from concurrent.futures import ThreadPoolExecutor
+import io
 import json
 import os
 import sys
 from pathlib import Path
 import types
+import zipfile
 
 import pytest
 from fastapi import HTTPException
@@ -20,6 +24,9 @@ from app.main import app  # noqa: E402
 
 
 client = TestClient(app)
+# The autouse fake_job_store fixture replaces these; cache tests exercise the real implementations.
+REAL_LIST_JOBS_FOR_UID = api_main._list_jobs_for_uid
+REAL_LOAD_JOB_STATE = api_main._load_job_state
 
 NEW_LAYOUT_STYLE_IDS = (
     "moto-journey-needle",
@@ -43,6 +50,9 @@ def fake_job_store(monkeypatch: pytest.MonkeyPatch) -> dict[str, dict[str, objec
         payload = store.get(job_id)
         return deepcopy(payload) if payload is not None else None
 
+    def _load_job_states(job_ids: list[str]) -> dict[str, dict[str, object] | None]:
+        return {job_id: deepcopy(store.get(job_id)) for job_id in job_ids}
+
     def _list_jobs_with_status(statuses: set[str]) -> list[dict[str, object]]:
         return [deepcopy(job) for job in store.values() if str(job.get("status")) in statuses]
 
@@ -54,6 +64,8 @@ def fake_job_store(monkeypatch: pytest.MonkeyPatch) -> dict[str, dict[str, objec
 
     monkeypatch.setattr(api_main, "_persist_job_state", _persist_job_state)
     monkeypatch.setattr(api_main, "_load_job_state", _load_job_state)
+    monkeypatch.setattr(api_main, "_load_job_states", _load_job_states)
+    monkeypatch.setattr(api_main, "_persist_job_states", lambda jobs: [_persist_job_state(job) for job in jobs])
     monkeypatch.setattr(api_main, "_list_jobs_with_status", _list_jobs_with_status)
     monkeypatch.setattr(api_main, "_list_jobs_for_uid", _list_jobs_for_uid)
     monkeypatch.setattr(api_main, "_list_all_jobs", _list_all_jobs)
@@ -196,6 +208,221 @@ def test_firestore_client_uses_configured_credentials(monkeypatch: pytest.Monkey
     assert created_clients == [{"project": "project-a", "credentials": sentinel_credentials, "database": "db-a"}]
 
 
+def test_retry_operation_backs_off_then_succeeds(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    calls: list[int] = []
+    monkeypatch.setattr(api_main.time, "sleep", sleeps.append)
+
+    def _flaky() -> str:
+        calls.append(1)
+        if len(calls) < 3:
+            raise OSError("transient")
+        return "ok"
+
+    assert api_main._retry_operation("Flaky op", _flaky, attempts=3, delay_seconds=0.5) == "ok"
+    assert len(calls) == 3
+    assert sleeps == [0.5, 1.0]
+
+    def _always_fails() -> None:
+        raise OSError("down")
+
+    with pytest.raises(RuntimeError, match="Broken op failed after 2 attempt") as exc_info:
+        api_main._retry_operation("Broken op", _always_fails, attempts=2, delay_seconds=0.5)
+    assert isinstance(exc_info.value.__cause__, OSError)
+
+
+def test_list_jobs_for_uid_reuses_recent_query_until_invalidated(monkeypatch: pytest.MonkeyPatch) -> None:
+    queries: list[tuple[str, str, str]] = []
+    snapshot = types.SimpleNamespace(id="job-1", to_dict=lambda: {"uid": "user-a", "videos": []})
+
+    class FakeQuery:
+        def stream(self) -> list[types.SimpleNamespace]:
+            return [snapshot]
+
+    class FakeCollection:
+        def where(self, *, filter: object) -> FakeQuery:  # noqa: A002
+            queries.append((filter.field_path, filter.op_string, filter.value))
+            return FakeQuery()
+
+    monkeypatch.setattr(api_main, "FIRESTORE_ENABLED", True)
+    monkeypatch.setattr(api_main, "_firestore_jobs_collection", lambda: FakeCollection())
+    monkeypatch.setattr(api_main, "_JOB_LISTING_CACHE", api_main.OrderedDict())
+
+    first = REAL_LIST_JOBS_FOR_UID("user-a")
+    first[0]["videos"].append({"id": "mutated"})
+    second = REAL_LIST_JOBS_FOR_UID("user-a")
+    assert queries == [("uid", "==", "user-a")]
+    assert second == [{"id": "job-1", "uid": "user-a", "videos": []}]
+
+    api_main._invalidate_job_listing("user-a")
+    REAL_LIST_JOBS_FOR_UID("user-a")
+    assert len(queries) == 2
+
+
+def test_load_job_state_serves_cached_terminal_jobs_without_firestore(monkeypatch: pytest.MonkeyPatch) -> None:
+    reads: list[str] = []
+
+    class FakeDocument:
+        def __init__(self, job_id: str) -> None:
+            self.job_id = job_id
+
+        def get(self) -> types.SimpleNamespace:
+            reads.append(self.job_id)
+            return types.SimpleNamespace(exists=True, to_dict=lambda: {"status": "running"})
+
+    class FakeCollection:
+        def document(self, job_id: str) -> FakeDocument:
+            return FakeDocument(job_id)
+
+    monkeypatch.setattr(api_main, "FIRESTORE_ENABLED", True)
+    monkeypatch.setattr(api_main, "_firestore_jobs_collection", lambda: FakeCollection())
+    api_main._cache_job_state({"id": "job-done", "uid": "user-a", "status": "completed"})
+    api_main._cache_job_state({"id": "job-live", "uid": "user-a", "status": "queued"})
+    monkeypatch.setattr(api_main, "TERMINAL_JOB_CACHE_TTL_SECONDS", 0.0)
+    api_main._cache_job_state({"id": "job-expired", "uid": "user-a", "status": "completed"})
+
+    job_ids = ("job-done", "job-live", "job-expired")
+    try:
+        assert REAL_LOAD_JOB_STATE("job-done", prefer_cache=False)["status"] == "completed"
+        assert REAL_LOAD_JOB_STATE("job-live", prefer_cache=False)["status"] == "running"
+        assert REAL_LOAD_JOB_STATE("job-expired", prefer_cache=False)["status"] == "running"
+        assert reads == ["job-live", "job-expired"]
+    finally:
+        for job_id in job_ids:
+            api_main._forget_job(job_id)
+            api_main.TERMINAL_CACHED_JOB_EXPIRY.pop(job_id, None)
+            api_main.JOB_STATE_JSON.pop(job_id, None)
+
+
+def test_cached_job_copies_come_from_serialized_snapshot() -> None:
+    api_main._cache_job_state({"id": "job-copy", "uid": "user-a", "status": "completed", "videos": [{"id": "v1"}]})
+    try:
+        assert "job-copy" in api_main.JOB_STATE_JSON
+        first = REAL_LOAD_JOB_STATE("job-copy", prefer_cache=True)
+        first["videos"].append({"id": "v2"})
+        second = REAL_LOAD_JOB_STATE("job-copy", prefer_cache=True)
+        assert second == {"id": "job-copy", "uid": "user-a", "status": "completed", "videos": [{"id": "v1"}]}
+        assert second is not api_main.JOBS["job-copy"]
+        assert api_main.JOBS["job-copy"]["videos"] == [{"id": "v1"}]
+        api_main._forget_job("job-copy")
+        assert "job-copy" not in api_main.JOB_STATE_JSON
+        assert "job-copy" not in api_main.JOBS
+    finally:
+        api_main._forget_job("job-copy")
+        api_main.TERMINAL_CACHED_JOB_EXPIRY.pop("job-copy", None)
+        api_main.JOB_STATE_JSON.pop("job-copy", None)
+
+
+def test_signed_download_urls_are_reused_until_near_expiry(monkeypatch: pytest.MonkeyPatch) -> None:
+    signed: list[tuple[str, str]] = []
+    clock = [1000.0]
+
+    def _fake_sign(object_key: str, filename: str) -> str:
+        signed.append((object_key, filename))
+        return f"https://signed/{object_key}/{filename}/{len(signed)}"
+
+    monkeypatch.setattr(api_main, "_sign_r2_download_url", _fake_sign)
+    monkeypatch.setattr(api_main.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(api_main, "_SIGNED_URL_CACHE", api_main.OrderedDict())
+
+    first = api_main._signed_r2_download_url("users/a/out.mp4", "out.mp4")
+    assert api_main._signed_r2_download_url("users/a/out.mp4", "out.mp4") == first
+    assert len(signed) == 1
+
+    clock[0] += api_main.R2_SIGNED_URL_TTL_SECONDS - api_main.R2_SIGNED_URL_CACHE_MARGIN_SECONDS
+    assert api_main._signed_r2_download_url("users/a/out.mp4", "out.mp4") != first
+    assert len(signed) == 2
+
+    api_main._forget_signed_r2_download_urls("users/a/out.mp4")
+    api_main._signed_r2_download_url("users/a/out.mp4", "out.mp4")
+    assert len(signed) == 3
+
+
+def test_verified_firebase_tokens_are_cached_briefly(monkeypatch: pytest.MonkeyPatch) -> None:
+    verified: list[str] = []
+    revocation_checks: list[str] = []
+    clock = [1000.0]
+
+    def _fake_verify_id_token(token: str, check_revoked: bool = False) -> dict[str, object]:
+        verified.append(token)
+        return {"uid": f"uid-for-{token}", "exp": api_main.time.time() + 3600, "auth_time": 1_700_000_000}
+
+    def _fake_get_user(uid: str) -> types.SimpleNamespace:
+        revocation_checks.append(uid)
+        return types.SimpleNamespace(disabled=False, tokens_valid_after_timestamp=None)
+
+    fake_auth = types.SimpleNamespace(verify_id_token=_fake_verify_id_token, get_user=_fake_get_user)
+    monkeypatch.setattr(api_main, "_firebase_auth_module", lambda: fake_auth)
+    monkeypatch.setattr(api_main.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(api_main, "_VERIFIED_TOKEN_CACHE", api_main.OrderedDict())
+
+    assert api_main._verify_firebase_token("token-a") == "uid-for-token-a"
+    assert api_main._verify_firebase_token("token-a") == "uid-for-token-a"
+    assert verified == ["token-a"]
+    assert revocation_checks == ["uid-for-token-a"]
+
+    clock[0] += api_main.FIREBASE_TOKEN_CACHE_TTL_SECONDS
+    assert api_main._verify_firebase_token("token-a") == "uid-for-token-a"
+    assert verified == ["token-a", "token-a"]
+
+
+def test_cached_firebase_token_is_rejected_after_revocation(monkeypatch: pytest.MonkeyPatch) -> None:
+    user = types.SimpleNamespace(disabled=False, tokens_valid_after_timestamp=None)
+
+    fake_auth = types.SimpleNamespace(
+        verify_id_token=lambda token, check_revoked=False: {  # noqa: ARG005
+            "uid": "user-a",
+            "exp": api_main.time.time() + 3600,
+            "auth_time": 1_700_000_000,
+        },
+        get_user=lambda uid: user,  # noqa: ARG005
+    )
+    monkeypatch.setattr(api_main, "_firebase_auth_module", lambda: fake_auth)
+    monkeypatch.setattr(api_main, "_VERIFIED_TOKEN_CACHE", api_main.OrderedDict())
+
+    assert api_main._verify_firebase_token("token-a") == "user-a"
+    assert api_main._verify_firebase_token("token-a") == "user-a"
+
+    user.tokens_valid_after_timestamp = 1_700_000_500_000
+    with pytest.raises(HTTPException) as exc_info:
+        api_main._verify_firebase_token("token-a")
+    assert exc_info.value.status_code == 401
+    assert api_main._VERIFIED_TOKEN_CACHE == {}
+
+
+def test_zip_stream_from_r2_streams_each_object(monkeypatch: pytest.MonkeyPatch) -> None:
+    objects = {"key/a.mp4": b"a" * 4096, "key/b.mp4": b"b" * 10}
+
+    class FakeR2Client:
+        def get_object(self, Bucket: str, Key: str) -> dict[str, object]:  # noqa: N803
+            return {"Body": io.BytesIO(objects[Key])}
+
+    monkeypatch.setattr(api_main, "_r2_client", lambda: FakeR2Client())
+
+    sources = api_main._r2_zip_sources([("a.mp4", "key/a.mp4"), ("b.mp4", "key/b.mp4")])
+    payload = b"".join(api_main._iter_zip_stream(sources))
+
+    with zipfile.ZipFile(io.BytesIO(payload)) as archive:
+        assert archive.namelist() == ["a.mp4", "b.mp4"]
+        assert archive.read("a.mp4") == objects["key/a.mp4"]
+        assert archive.read("b.mp4") == objects["key/b.mp4"]
+        assert {info.compress_type for info in archive.infolist()} == {zipfile.ZIP_STORED}
+        assert all(info.date_time[0] >= 2020 for info in archive.infolist())
+
+
+def test_zip_stream_from_local_files_keeps_file_mtime(tmp_path: Path) -> None:
+    output_path = tmp_path / "clip-overlay.mp4"
+    output_path.write_bytes(b"video")
+    os.utime(output_path, (1_700_000_000, 1_700_000_000))
+
+    sources = api_main._local_zip_sources(tmp_path, ["clip-overlay.mp4", "missing.mp4"])
+    payload = b"".join(api_main._iter_zip_stream(sources))
+
+    with zipfile.ZipFile(io.BytesIO(payload)) as archive:
+        assert archive.namelist() == ["clip-overlay.mp4"]
+        assert archive.getinfo("clip-overlay.mp4").date_time == api_main.time.localtime(1_700_000_000)[:6]
+
+
 def test_invalid_token_is_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(api_main, "_verify_firebase_token", _stub_verify_token)
     response = client.get("/api/jobs/job-1", headers={"Authorization": "Bearer not-valid"})
@@ -236,6 +463,210 @@ def test_build_renderer_command_sets_cache_dir_and_overlay_size() -> None:
     assert "3840x2160" in command
 
 
+def test_select_render_profile_auto_uses_available_candidates() -> None:
+    selected, candidates = api_main._select_render_profile({"width": 5312, "height": 2988}, api_main.AUTO_RENDER_PROFILE)
+
+    expected = api_main._available_auto_render_profiles(True)
+    assert candidates == expected
+    assert selected == expected[0]
+    assert all(profile in api_main.MANUAL_RENDER_PROFILES for profile in candidates)
+    assert api_main._select_render_profile({"width": 1920, "height": 1080}, "h264-fast") == ("h264-fast", ("h264-fast",))
+
+
+def test_copy_upload_file_uses_sendfile_only_for_large_spools(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    if not hasattr(os, "sendfile"):
+        pytest.skip("os.sendfile is unavailable")
+    sendfile_calls: list[int] = []
+    real_sendfile = os.sendfile
+
+    def _counting_sendfile(out_fd: int, in_fd: int, offset: int, count: int) -> int:
+        sendfile_calls.append(count)
+        return real_sendfile(out_fd, in_fd, offset, count)
+
+    monkeypatch.setattr(api_main.os, "sendfile", _counting_sendfile)
+    monkeypatch.setattr(api_main, "UPLOAD_SENDFILE_MIN_BYTES", 64)
+
+    small = api_main.tempfile.SpooledTemporaryFile(max_size=1024)
+    small.write(b"s" * 32)
+    small.seek(0)
+    api_main._copy_upload_file(small, tmp_path / "small.mp4")
+    assert (tmp_path / "small.mp4").read_bytes() == b"s" * 32
+    assert sendfile_calls == []
+
+    large = api_main.tempfile.SpooledTemporaryFile(max_size=16)
+    large.write(b"l" * 256)
+    large.seek(0)
+    api_main._copy_upload_file(large, tmp_path / "large.mp4")
+    assert (tmp_path / "large.mp4").read_bytes() == b"l" * 256
+    assert sendfile_calls == [256]
+
+    api_main._copy_upload_file(io.BytesIO(b"b" * 256), tmp_path / "bytes.mp4")
+    assert (tmp_path / "bytes.mp4").read_bytes() == b"b" * 256
+    assert sendfile_calls == [256]
+
+
+def test_resolve_job_file_rejects_traversal_and_missing_files(tmp_path: Path) -> None:
+    outputs_dir = (tmp_path / "outputs").resolve()
+    outputs_dir.mkdir()
+    (outputs_dir / "clip.mp4").write_bytes(b"x")
+    (tmp_path / "outputs-secret.txt").write_text("secret")
+
+    assert api_main._resolve_job_file(outputs_dir, "clip.mp4") == outputs_dir / "clip.mp4"
+    assert api_main._resolve_job_file(outputs_dir, "missing.mp4") is None
+    assert api_main._resolve_job_file(outputs_dir, "../outputs-secret.txt") is None
+    assert api_main._resolve_job_file(outputs_dir, ".") is None
+
+
+def test_accel_redirect_response_points_inside_jobs_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    jobs_dir = tmp_path / "jobs"
+    monkeypatch.setattr(api_main, "JOBS_DIR", jobs_dir)
+    target = (jobs_dir / "job-1" / "outputs" / "clip one.mp4").resolve()
+
+    monkeypatch.setattr(api_main, "ACCEL_REDIRECT_PREFIX", "")
+    assert api_main._accel_redirect_response(target, "video/mp4") is None
+
+    monkeypatch.setattr(api_main, "ACCEL_REDIRECT_PREFIX", "/_protected/jobs")
+    response = api_main._accel_redirect_response(target, "video/mp4")
+    assert response is not None
+    assert response.headers["x-accel-redirect"] == "/_protected/jobs/job-1/outputs/clip%20one.mp4"
+    assert response.headers["content-type"] == "video/mp4"
+    assert api_main._accel_redirect_response(tmp_path / "elsewhere.mp4", "video/mp4") is None
+
+
+def test_derived_output_metadata_skips_filtered_profiles() -> None:
+    metadata = {"width": 1920, "height": 1080, "duration": 12.5, "fps": 29.97, "fps_raw": "30000/1001", "codec": "hevc"}
+
+    derived = api_main._derived_output_metadata(metadata, "h264-source")
+
+    assert derived == {
+        "width": 1920,
+        "height": 1080,
+        "duration": 12.5,
+        "codec": "h264",
+        "fps": 29.97,
+        "fps_raw": "30000/1001",
+    }
+    assert api_main._derived_output_metadata(metadata, "h264-4k-compat") is None
+    assert api_main._derived_output_metadata({**metadata, "duration": None}, "h264-source") is None
+
+
+def test_render_profile_encode_probe_reports_encoder_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    commands: list[list[str]] = []
+
+    def _fake_run(cmd: list[str], **_kwargs: object) -> types.SimpleNamespace:
+        commands.append(cmd)
+        failed = "-filter_complex" in cmd
+        return types.SimpleNamespace(returncode=1 if failed else 0, stderr=b"encoder error" if failed else b"")
+
+    monkeypatch.setattr(api_main.subprocess, "run", _fake_run)
+    monkeypatch.setattr(api_main, "_RENDER_PROFILE_PROBE_CACHE", api_main.OrderedDict())
+    monkeypatch.setattr(api_main, "_UNAVAILABLE_ENCODERS", set())
+    assert api_main._render_profile_encodes("h264-source", 5312, 2988) is True
+    assert api_main._render_profile_encodes("h264-4k-compat", 5312, 2988) is False
+    assert api_main._render_profile_encodes("h264-source", 5312, 2988) is True
+    assert len(commands) == 2
+    assert "-frames:v" in commands[0]
+    assert "color=c=black:s=5312x2988:r=30" in commands[0]
+
+
+def test_render_profile_encode_probe_retries_transient_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    results = [
+        types.SimpleNamespace(returncode=1, stderr=b"Cannot open encoder session"),
+        types.SimpleNamespace(returncode=0, stderr=b""),
+        types.SimpleNamespace(returncode=1, stderr=b"Unknown encoder 'libx264'"),
+    ]
+    commands: list[list[str]] = []
+
+    def _fake_run(cmd: list[str], **_kwargs: object) -> types.SimpleNamespace:
+        commands.append(cmd)
+        return results.pop(0)
+
+    monkeypatch.setattr(api_main.subprocess, "run", _fake_run)
+    monkeypatch.setattr(api_main, "_RENDER_PROFILE_PROBE_CACHE", api_main.OrderedDict())
+    monkeypatch.setattr(api_main, "_UNAVAILABLE_ENCODERS", set())
+    monkeypatch.setattr(api_main, "RENDER_PROFILE_PROBE_FAILURE_TTL_SECONDS", 0.0)
+
+    assert api_main._render_profile_encodes("h264-source", 3840, 2160) is False
+    assert api_main._render_profile_encodes("h264-source", 3840, 2160) is True
+    assert len(commands) == 2
+
+    assert api_main._render_profile_encodes("h264-fast", 3840, 2160) is False
+    assert api_main._UNAVAILABLE_ENCODERS == {"libx264"}
+    assert api_main._render_profile_encodes("h264-fast", 1920, 1080) is False
+    assert len(commands) == 3
+
+
+def test_probe_video_reuses_results_for_unchanged_files(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    probes: list[Path] = []
+
+    def _fake_probe(path: Path) -> dict[str, object]:
+        probes.append(path)
+        return {"width": 1920, "height": 1080, "duration": 10.0, "creation_time": "2026-01-01T00:00:00+00:00"}
+
+    monkeypatch.setattr(api_main, "_probe_video_uncached", _fake_probe)
+    monkeypatch.setattr(api_main, "_PROBE_CACHE", api_main.OrderedDict())
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"video")
+
+    first = api_main._probe_video(video)
+    first["width"] = 1
+    assert api_main._probe_video(video)["width"] == 1920
+    api_main._set_file_mtime_from_creation(video, "2026-01-01T00:00:00+00:00")
+    api_main._probe_video(video)
+    assert len(probes) == 1
+
+    video.write_bytes(b"re-encoded video")
+    api_main._probe_video(video)
+    assert len(probes) == 2
+
+
+def test_pyav_probe_matches_ffprobe_metadata(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"video")
+    ffprobe_payload = {
+        "streams": [{"codec_type": "video", "codec_name": "h264", "width": 5312, "height": 2988, "avg_frame_rate": "30000/1001"}],
+        "format": {"duration": "42.5", "tags": {"creation_time": "2026-02-07T22:28:39.000000Z"}},
+    }
+    monkeypatch.setattr(
+        api_main.subprocess,
+        "run",
+        lambda *_args, **_kwargs: types.SimpleNamespace(returncode=0, stdout=json.dumps(ffprobe_payload), stderr=""),
+    )
+    monkeypatch.setitem(sys.modules, "av", None)
+    api_main._pyav_module.cache_clear()
+    try:
+        ffprobe_metadata = api_main._probe_video_uncached(video)
+    finally:
+        api_main._pyav_module.cache_clear()
+
+    class FakeContainer:
+        duration = 42_500_000
+        metadata = {"creation_time": "2026-02-07T22:28:39.000000Z"}
+        streams = types.SimpleNamespace(
+            video=[
+                types.SimpleNamespace(
+                    codec_context=types.SimpleNamespace(width=5312, height=2988, name="h264"),
+                    average_rate=Fraction(30000, 1001),
+                )
+            ]
+        )
+
+        def __enter__(self) -> "FakeContainer":
+            return self
+
+        def __exit__(self, *_exc: object) -> None:
+            return None
+
+    fake_av = types.SimpleNamespace(open=lambda _path: FakeContainer(), time_base=1_000_000)
+    monkeypatch.setitem(sys.modules, "av", fake_av)
+    api_main._pyav_module.cache_clear()
+    try:
+        assert api_main._pyav_module() is fake_av
+        assert api_main._probe_video_in_process(video) == ffprobe_metadata
+    finally:
+        api_main._pyav_module.cache_clear()
+
+
 def test_ffmpeg_profile_presets_include_thread_budget(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(api_main, "FFMPEG_THREADS_PER_RENDER", 4)
     presets = api_main._ffmpeg_profile_presets()
@@ -289,6 +720,25 @@ def test_render_eta_calibration_from_samples() -> None:
     assert calibration["source_rounded_multiplier"] < 1.0
 
 
+def test_load_recent_render_samples_reads_tail_window(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    samples_file = tmp_path / "render-samples.jsonl"
+    lines = [json.dumps({"index": index}) for index in range(10)]
+    lines.insert(7, "not-json")
+    lines.insert(3, "")
+    samples_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    monkeypatch.setattr(api_main, "RENDER_SAMPLES_FILE", samples_file)
+    monkeypatch.setattr(api_main, "RENDER_SAMPLES_TAIL_BLOCK_BYTES", 7)
+
+    assert api_main._load_recent_render_samples(limit=4) == [{"index": index} for index in range(6, 10)]
+    assert api_main._load_recent_render_samples(limit=50) == [{"index": index} for index in range(10)]
+
+    monkeypatch.setattr(api_main, "RENDER_SAMPLES_FILE", tmp_path / "missing.jsonl")
+    assert api_main._load_recent_render_samples() == []
+
+
 def test_cross_user_job_access_returns_not_found(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -313,6 +763,7 @@ def test_cross_user_job_access_returns_not_found(
     owner_response = client.get("/api/jobs/job-1", headers={"Authorization": "Bearer token-user-a"})
     assert owner_response.status_code == 200
     assert owner_response.json()["uid"] == "user-a"
+    assert "video_identity_version" not in owner_response.json()
 
 
 def test_create_job_persists_authenticated_uid(
@@ -358,6 +809,7 @@ def test_create_job_persists_authenticated_uid(
     assert first_video["source_resolution"] == "5312x2988"
     assert first_video["source_fps"] == "30000/1001"
     assert first_video["source_duration_seconds"] == 42.5
+    assert fake_job_store[job_id]["video_identity_version"] == api_main.VIDEO_IDENTITY_VERSION
 
 
 def test_recover_pending_jobs_normalizes_running_states_and_enqueues(
@@ -514,8 +966,6 @@ def test_process_job_resume_skips_already_completed_videos(
         _log_path: Path,
         _job_id: str,
         video_index: int,
-        _completed_before: int,
-        _total_videos: int,
     ) -> tuple[int, str, float]:
         render_calls.append(video_index)
         return 0, "[100%]", 1.0
@@ -546,10 +996,99 @@ def test_process_job_resume_skips_already_completed_videos(
     assert (inputs_dir / "pending.mp4").exists()
 
 
+def test_render_sample_is_recorded_after_upload_outcome(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    fake_job_store: dict[str, dict[str, object]],
+) -> None:
+    samples: list[dict[str, object]] = []
+    monkeypatch.setattr(api_main, "_submit_render_sample", samples.append)
+    fake_job_store["job-upload"] = {
+        "id": "job-upload",
+        "uid": "user-a",
+        "status": "running",
+        "videos": [{"id": "v1", "status": "running"}, {"id": "v2", "status": "running"}],
+    }
+    upload_kwargs = {
+        "uid": "user-a",
+        "output_name": "clip-overlay.mp4",
+        "output_path": tmp_path / "clip-overlay.mp4",
+        "completed_fields": {"output_name": "clip-overlay.mp4"},
+    }
+
+    def _failing_upload(**_kwargs: object) -> dict[str, object]:
+        raise RuntimeError("R2 unavailable")
+
+    monkeypatch.setattr(api_main, "_upload_output_to_r2", _failing_upload)
+    result = api_main._upload_job_video_output(
+        "job-upload", 0, render_sample={"job_id": "job-upload", "success": True}, **upload_kwargs
+    )
+    assert result == "R2 unavailable"
+    assert samples == [{"job_id": "job-upload", "success": False, "error": "Upload failed: R2 unavailable"}]
+
+    monkeypatch.setattr(api_main, "_upload_output_to_r2", lambda **_kwargs: {"r2_object_key": "key"})
+    assert api_main._upload_job_video_output(
+        "job-upload", 1, render_sample={"job_id": "job-upload", "success": True}, **upload_kwargs
+    ) is None
+    assert samples[-1] == {"job_id": "job-upload", "success": True}
+    assert fake_job_store["job-upload"]["videos"][0]["status"] == "failed"
+    assert fake_job_store["job-upload"]["videos"][1]["status"] == "completed"
+
+
+def test_set_render_progress_aggregates_all_videos(fake_job_store: dict[str, dict[str, object]]) -> None:
+    fake_job_store["job-progress"] = {
+        "id": "job-progress",
+        "status": "running",
+        "progress": 1,
+        "videos": [
+            {"id": "v1", "status": "completed", "progress": 100},
+            {"id": "v2", "status": "running", "progress": 10},
+            {"id": "v3", "status": "running", "progress": 0},
+            {"id": "v4", "status": "queued", "progress": 0},
+        ],
+    }
+
+    api_main._set_render_progress("job-progress", 2, 50)
+
+    updated = fake_job_store["job-progress"]
+    assert updated["videos"][2]["progress"] == 50
+    assert updated["progress"] == 40
+    assert updated["message"] == "Rendering 2/4"
+
+
+def test_run_renderer_pumps_progress_and_last_line(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    progress_calls: list[tuple[int, str | None]] = []
+    monkeypatch.setattr(
+        api_main,
+        "_set_render_progress",
+        lambda _job_id, _index, progress, detail=None: progress_calls.append((progress, detail)),
+    )
+    monkeypatch.setattr(api_main, "_set_video", lambda _job_id, _index, **fields: progress_calls.append((-1, fields["detail"])))
+    script = (
+        "import sys\n"
+        "for value in (10, 55, 100):\n"
+        "    sys.stdout.write(f'Render [{value:3d}%]\\r')\n"
+        "    sys.stdout.flush()\n"
+        "sys.stdout.write('\\r\\nRender complete\\n')\n"
+    )
+    log_path = tmp_path / "render.log"
+
+    return_code, last_line, _elapsed = api_main._run_renderer([sys.executable, "-c", script], log_path, "job", 0)
+
+    assert return_code == 0
+    assert last_line == "Render complete"
+    assert (100, None) in progress_calls
+    assert progress_calls[-1][1] == "Render complete"
+    assert b"\r" not in log_path.read_bytes()
+    assert b"Render [100%]\n" in log_path.read_bytes()
+
+
 def test_set_job_terminal_transition_triggers_single_notification(
     monkeypatch: pytest.MonkeyPatch,
     fake_job_store: dict[str, dict[str, object]],
 ) -> None:
+    notification_executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(api_main, "_NOTIFICATION_EXECUTOR", notification_executor)
     notifications: list[dict[str, object]] = []
     monkeypatch.setattr(api_main, "_send_job_completion_notification", lambda job: notifications.append(deepcopy(job)))
 
@@ -565,6 +1104,7 @@ def test_set_job_terminal_transition_triggers_single_notification(
 
     api_main._set_job("job-terminal", status="completed", progress=100, message="Done")
     api_main._set_job("job-terminal", status="completed", progress=100, message="Done")
+    notification_executor.shutdown(wait=True)
 
     assert len(notifications) == 1
     assert notifications[0]["status"] == "completed"
@@ -574,6 +1114,8 @@ def test_set_job_notification_failure_does_not_block_state_update(
     monkeypatch: pytest.MonkeyPatch,
     fake_job_store: dict[str, dict[str, object]],
 ) -> None:
+    notification_executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(api_main, "_NOTIFICATION_EXECUTOR", notification_executor)
     monkeypatch.setattr(api_main, "_send_job_completion_notification", lambda _job: (_ for _ in ()).throw(RuntimeError("boom")))
 
     fake_job_store["job-notify-fail"] = {
@@ -587,10 +1129,57 @@ def test_set_job_notification_failure_does_not_block_state_update(
     }
 
     api_main._set_job("job-notify-fail", status="failed", progress=100, message="Failed")
+    notification_executor.shutdown(wait=True)
     assert fake_job_store["job-notify-fail"]["status"] == "failed"
     assert fake_job_store["job-notify-fail"]["progress"] == 100
 
 
+def test_user_profile_reads_are_cached_and_updated_on_write(monkeypatch: pytest.MonkeyPatch) -> None:
+    reads: list[str] = []
+    writes: list[dict[str, object]] = []
+    stored = {"notifications_enabled": True}
+    clock = [1000.0]
+
+    class FakeDocument:
+        def __init__(self, uid: str) -> None:
+            self.uid = uid
+
+        def get(self) -> types.SimpleNamespace:
+            reads.append(self.uid)
+            return types.SimpleNamespace(exists=True, to_dict=lambda: {"uid": self.uid, **stored})
+
+        def set(self, payload: dict[str, object], merge: bool = False) -> None:  # noqa: ARG002
+            writes.append(dict(payload))
+
+    class FakeCollection:
+        def document(self, uid: str) -> FakeDocument:
+            return FakeDocument(uid)
+
+    monkeypatch.setattr(api_main, "_firestore_users_collection", lambda: FakeCollection())
+    monkeypatch.setattr(api_main, "_USER_PROFILE_CACHE", api_main.OrderedDict())
+    monkeypatch.setattr(api_main.time, "monotonic", lambda: clock[0])
+
+    first = api_main._load_or_create_user_profile("user-a")
+    first["notifications_enabled"] = False
+    assert api_main._load_or_create_user_profile("user-a")["notifications_enabled"] is True
+    assert reads == ["user-a"]
+
+    api_main._update_user_profile_contact("user-a", email="rider@example.com", display_name=None)
+    assert api_main._lookup_recipient_email("user-a") == ("rider@example.com", None)
+    api_main._update_user_notification_preference("user-a", notifications_enabled=False)
+    assert api_main._load_or_create_user_profile("user-a")["notifications_enabled"] is False
+    assert reads == ["user-a"]
+    assert len(writes) == 2
+
+    # Another instance opts the user out; this instance sees it once the short TTL lapses.
+    stored["notifications_enabled"] = False
+    api_main._cache_user_profile("user-a", {"uid": "user-a", "notifications_enabled": True})
+    assert api_main._load_or_create_user_profile("user-a")["notifications_enabled"] is True
+    clock[0] += api_main.USER_PROFILE_CACHE_TTL_SECONDS
+    assert api_main._load_or_create_user_profile("user-a")["notifications_enabled"] is False
+    assert reads == ["user-a", "user-a"]
+
+
 def test_user_settings_defaults_to_notifications_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(api_main, "_verify_firebase_token", _stub_verify_token)
     monkeypatch.setattr(api_main, "_load_or_create_user_profile", lambda uid: {"uid": uid, "notifications_enabled": True})
@@ -903,6 +1492,91 @@ def test_media_list_is_user_scoped_with_sorting_and_pagination(
     assert {item["job_id"] for item in payload["items"]} <= {"job-a-1", "job-a-2"}
 
 
+def test_media_list_partial_sort_matches_full_sort(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    fake_job_store: dict[str, dict[str, object]],
+) -> None:
+    monkeypatch.setattr(api_main, "_verify_firebase_token", _stub_verify_token)
+    statuses = ("completed", "failed", "running", "queued")
+    fake_job_store["job-many"] = {
+        "id": "job-many",
+        "uid": "user-a",
+        "job_dir": str(tmp_path / "job-many"),
+        "status": "completed_with_errors",
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "updated_at": "2026-01-01T00:00:00+00:00",
+        "videos": [
+            {"id": f"video-{index}", "input_name": f"clip-{index}.mp4", "status": statuses[index % 4], "output_name": None, "r2_object_key": None}
+            for index in range(40)
+        ],
+    }
+
+    def _ids(query: str) -> list[str]:
+        response = client.get(f"/api/media?{query}", headers={"Authorization": "Bearer token-user-a"})
+        assert response.status_code == 200
+        return [item["id"] for item in response.json()["items"]]
+
+    for sort_order in ("asc", "desc"):
+        full = _ids(f"page=1&page_size=40&sort_by=status&sort_order={sort_order}")
+        assert _ids(f"page=1&page_size=3&sort_by=status&sort_order={sort_order}") == full[:3]
+        assert _ids(f"page=2&page_size=2&sort_by=status&sort_order={sort_order}") == full[2:4]
+
+
+def test_media_list_cursor_pages_follow_offset_order(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    fake_job_store: dict[str, dict[str, object]],
+) -> None:
+    monkeypatch.setattr(api_main, "_verify_firebase_token", _stub_verify_token)
+    statuses = ("completed", "failed", "running")
+    fake_job_store["job-cursor"] = {
+        "id": "job-cursor",
+        "uid": "user-a",
+        "job_dir": str(tmp_path / "job-cursor"),
+        "status": "completed_with_errors",
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "updated_at": "2026-01-01T00:00:00+00:00",
+        "videos": [
+            {"id": f"video-{index:02d}", "input_name": "clip.mp4", "title": "Clip", "status": statuses[index % 3], "output_name": None, "r2_object_key": None}
+            for index in range(11)
+        ],
+    }
+    headers = {"Authorization": "Bearer token-user-a"}
+
+    full = client.get("/api/media?page=1&page_size=11&sort_by=status&sort_order=desc", headers=headers).json()
+    first = client.get("/api/media?page=1&page_size=4&sort_by=status&sort_order=desc", headers=headers).json()
+    ids = [item["id"] for item in first["items"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        response = client.get(f"/api/media?page_size=4&sort_by=status&sort_order=desc&cursor={cursor}", headers=headers)
+        assert response.status_code == 200
+        payload = response.json()
+        assert "total" not in payload
+        ids.extend(item["id"] for item in payload["items"])
+        cursor = payload["next_cursor"]
+
+    assert full["next_cursor"] is None
+    assert ids == [item["id"] for item in full["items"]]
+
+    mismatched = client.get(f"/api/media?sort_by=title&sort_order=desc&cursor={first['next_cursor']}", headers=headers)
+    assert mismatched.status_code == 400
+    garbage = client.get("/api/media?sort_by=status&sort_order=desc&cursor=not-a-cursor", headers=headers)
+    assert garbage.status_code == 400
+
+
+def test_video_identity_backfill_reports_only_real_changes() -> None:
+    complete = {"id": "job-a", "videos": [{"id": "video-a", "title": "Clip", "input_name": "clip.mp4"}]}
+    assert api_main._backfill_video_identity_metadata(complete) is False
+    assert "video_identity_version" not in complete
+
+    legacy = {"id": "job-b", "videos": [{"id": "", "title": " ", "input_name": "clip.mp4"}]}
+    assert api_main._backfill_video_identity_metadata(legacy) is True
+    assert legacy["videos"][0]["id"]
+    assert legacy["videos"][0]["title"].strip()
+    assert "video_identity_version" not in legacy
+
+
 def test_media_rename_updates_title_and_blocks_cross_user(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -928,6 +1602,7 @@ def test_media_rename_updates_title_and_blocks_cross_user(
     assert owner_response.status_code == 200
     assert owner_response.json()["title"] == "New title"
     assert fake_job_store["job-rename"]["videos"][0]["title"] == "New title"
+    assert "video_identity_version" not in fake_job_store["job-rename"]
 
     other_response = client.patch(
         "/api/media/job-rename/video-rename",
@@ -987,6 +1662,59 @@ def test_media_delete_removes_video_and_r2_object(
     assert fake_job_store["job-delete"]["videos"] == []
 
 
+def test_media_bulk_delete_batches_r2_deletes_across_jobs(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    fake_job_store: dict[str, dict[str, object]],
+) -> None:
+    monkeypatch.setattr(api_main, "_verify_firebase_token", _stub_verify_token)
+    delete_calls: list[list[str]] = []
+
+    class FakeR2Client:
+        def delete_objects(self, Bucket: str, Delete: dict[str, object]) -> dict[str, object]:  # noqa: N803
+            delete_calls.append([entry["Key"] for entry in Delete["Objects"]])
+            return {}
+
+    monkeypatch.setattr(api_main, "_r2_client", lambda: FakeR2Client())
+    monkeypatch.setattr(api_main, "R2_BUCKET", "test-bucket")
+
+    for job_id in ("job-bulk-1", "job-bulk-2"):
+        job_dir = tmp_path / job_id
+        (job_dir / "outputs").mkdir(parents=True, exist_ok=True)
+        (job_dir / "outputs" / "a-overlay.mp4").write_bytes(b"video")
+        fake_job_store[job_id] = {
+            "id": job_id,
+            "uid": "user-a",
+            "job_dir": str(job_dir),
+            "status": "completed",
+            "videos": [
+                {"id": f"{job_id}-a", "title": "A", "status": "completed", "output_name": "a-overlay.mp4", "r2_object_key": f"{job_id}/a"},
+                {"id": f"{job_id}-b", "title": "B", "status": "completed", "output_name": None, "r2_object_key": f"{job_id}/b"},
+            ],
+        }
+
+    response = client.post(
+        "/api/media/bulk-delete",
+        json={"items": [{"job_id": "job-bulk-1", "video_id": "job-bulk-1-a"}, {"job_id": "job-bulk-2", "video_id": "job-bulk-2-a"}, {"job_id": "job-bulk-2", "video_id": "job-bulk-2-b"}]},
+        headers={"Authorization": "Bearer token-user-a"},
+    )
+    assert response.status_code == 200
+    assert len(response.json()["deleted"]) == 3
+    assert len(delete_calls) == 1
+    assert sorted(delete_calls[0]) == ["job-bulk-1/a", "job-bulk-2/a", "job-bulk-2/b"]
+    assert [video["id"] for video in fake_job_store["job-bulk-1"]["videos"]] == ["job-bulk-1-b"]
+    assert fake_job_store["job-bulk-2"]["videos"] == []
+    assert not (tmp_path / "job-bulk-1" / "outputs" / "a-overlay.mp4").exists()
+
+    other_response = client.post(
+        "/api/media/bulk-delete",
+        json={"items": [{"job_id": "job-bulk-1", "video_id": "job-bulk-1-b"}]},
+        headers={"Authorization": "Bearer token-user-b"},
+    )
+    assert other_response.status_code == 404
+    assert len(fake_job_store["job-bulk-1"]["videos"]) == 1
+
+
 def test_media_download_link_is_owner_scoped(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -1118,6 +1846,35 @@ def test_render_layout_xml_for_new_styles_contains_expected_widgets(
         assert marker in layout_xml
 
 
+def test_cached_layout_xml_matches_direct_render() -> None:
+    settings = api_main._resolve_render_settings(
+        {
+            "include_maps": True,
+            "overlay_theme": "powder-neon",
+            "gpx_offset_seconds": 0,
+            "component_visibility": {"route_maps": False, "speed": True},
+            "speed_units": "mph",
+        }
+    )
+    cached = api_main._cached_layout_xml(
+        1920,
+        1080,
+        settings.overlay_theme,
+        True,
+        settings.layout_style,
+        settings.component_visibility,
+        settings.speed_units,
+    )
+    assert cached == render_layout_xml(
+        1920,
+        1080,
+        "powder-neon",
+        include_maps=True,
+        component_visibility={"route_maps": False, "speed": True},
+        speed_units="mph",
+    )
+
+
 def test_layout_preview_manifest_covers_all_layout_styles() -> None:
     repo_root = Path(__file__).resolve().parents[3]
     manifest_path = repo_root / "apps/web/public/layout-previews/manifest.json"
@@ -15,6 +15,7 @@ from app.main import app  # noqa: E402
 
 
 client = TestClient(app)
+REAL_PERSIST_JOB_STATE = api_main._persist_job_state
 
 
 @pytest.fixture(autouse=True)
@@ -31,14 +32,20 @@ def fake_job_store(monkeypatch: pytest.MonkeyPatch) -> dict[str, dict[str, objec
         payload = store.get(job_id)
         return deepcopy(payload) if payload is not None else None
 
+    def _load_job_states(job_ids: list[str]) -> dict[str, dict[str, object] | None]:
+        return {job_id: deepcopy(store.get(job_id)) for job_id in job_ids}
+
     monkeypatch.setattr(api_main, "_persist_job_state", _persist_job_state)
     monkeypatch.setattr(api_main, "_load_job_state", _load_job_state)
+    monkeypatch.setattr(api_main, "_load_job_states", _load_job_states)
     monkeypatch.setattr(api_main, "FIRESTORE_ENABLED", True)
     monkeypatch.setattr(api_main, "R2_UPLOAD_ENABLED", False)
     monkeypatch.setattr(api_main, "LOCAL_RENDER_ENABLED", True)
 
     with api_main.JOBS_LOCK:
         api_main.JOBS.clear()
+        api_main.JOBS_BY_UID.clear()
+        api_main.JOB_STATE_SIGNATURES.clear()
     with api_main.LOCAL_RENDER_LOCK:
         api_main.LOCAL_RENDER_PAIRINGS.clear()
         api_main.LOCAL_RENDER_WORKER_SESSIONS.clear()
@@ -47,6 +54,8 @@ def fake_job_store(monkeypatch: pytest.MonkeyPatch) -> dict[str, dict[str, objec
 
     with api_main.JOBS_LOCK:
         api_main.JOBS.clear()
+        api_main.JOBS_BY_UID.clear()
+        api_main.JOB_STATE_SIGNATURES.clear()
     with api_main.LOCAL_RENDER_LOCK:
         api_main.LOCAL_RENDER_PAIRINGS.clear()
         api_main.LOCAL_RENDER_WORKER_SESSIONS.clear()
@@ -153,6 +162,47 @@ def test_local_smoke_auth_and_memory_jobs_allow_local_render_without_firestore_o
     assert loaded["uid"] == "smoke-user"
 
 
+def test_memory_jobs_are_listed_per_uid_from_cache_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(api_main, "FIRESTORE_ENABLED", False)
+    monkeypatch.setattr(api_main, "LOCAL_SMOKE_IN_MEMORY_JOBS", True)
+
+    api_main._cache_job_state({"id": "job-a1", "uid": "user-a", "status": "queued"})
+    api_main._cache_job_state({"id": "job-a2", "uid": "user-a", "status": "queued"})
+    api_main._cache_job_state({"id": "job-b1", "uid": "user-b", "status": "queued"})
+
+    assert sorted(job["id"] for job in api_main._list_jobs_for_uid("user-a")) == ["job-a1", "job-a2"]
+
+    api_main._cache_job_state({"id": "job-a2", "uid": "user-b", "status": "running"})
+    api_main._forget_job("job-a1")
+
+    assert api_main._list_jobs_for_uid("user-a") == []
+    assert sorted(job["id"] for job in api_main._list_jobs_for_uid("user-b")) == ["job-a2", "job-b1"]
+
+
+def test_persist_job_state_skips_unchanged_firestore_writes(monkeypatch: pytest.MonkeyPatch) -> None:
+    writes: list[dict[str, object]] = []
+
+    class FakeDocument:
+        def set(self, payload: dict[str, object]) -> None:
+            writes.append(deepcopy(payload))
+
+    class FakeCollection:
+        def document(self, _job_id: str) -> FakeDocument:
+            return FakeDocument()
+
+    monkeypatch.setattr(api_main, "_firestore_jobs_collection", lambda: FakeCollection())
+
+    job = {"id": "job-sig", "uid": "user-a", "status": "running", "progress": 10}
+    first = REAL_PERSIST_JOB_STATE(job)
+    second = REAL_PERSIST_JOB_STATE({**job, "updated_at": "ignored"})
+    assert len(writes) == 1
+    assert second == first
+
+    REAL_PERSIST_JOB_STATE({**job, "progress": 20})
+    assert len(writes) == 2
+    assert writes[-1]["progress"] == 20
+
+
 def test_pairing_code_is_single_use(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(api_main, "_verify_firebase_token", _stub_verify_token)
 